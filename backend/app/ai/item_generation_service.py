@@ -10,9 +10,10 @@ import json
 import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-import psycopg2
 from psycopg2.extras import Json
 
+from app.english_test.connection_pool import get_pool
+
 from .gemini_client import GeminiClient
 
 logger = logging.getLogger(__name__)
@@ -36,6 +37,8 @@ class ItemGenerationService:
         """
         self.client = gemini_client
         self.database_url = database_url
+        # Shared with EnglishTestDB and the admin routes
+        self.pool = get_pool(database_url)
 
     def generate_and_save_item(
         self,
@@ -242,7 +245,7 @@ class ItemGenerationService:
     ) -> int:
         """Save generated item to PostgreSQL database."""
 
-        conn = psycopg2.connect(self.database_url)
+        conn = self.pool.getconn()
         cur = conn.cursor()
 
         try:
@@ -327,12 +330,12 @@ class ItemGenerationService:
             raise
         finally:
             cur.close()
-            conn.close()
+            self.pool.putconn(conn)
 
     def _fetch_item_from_database(self, item_id: int) -> Optional[Dict[str, Any]]:
         """Fetch item from database."""
 
-        conn = psycopg2.connect(self.database_url)
+        conn = self.pool.getconn()
         cur = conn.cursor()
 
         try:
@@ -370,12 +373,12 @@ class ItemGenerationService:
 
         finally:
             cur.close()
-            conn.close()
+            self.pool.putconn(conn)
 
     def _update_item_validation(self, item_id: int, validation_result: Dict[str, Any]) -> None:
         """Update item validation results in database."""
 
-        conn = psycopg2.connect(self.database_url)
+        conn = self.pool.getconn()
         cur = conn.cursor()
 
         try:
@@ -403,12 +406,12 @@ class ItemGenerationService:
             raise
         finally:
             cur.close()
-            conn.close()
+            self.pool.putconn(conn)
 
     def _deactivate_item(self, item_id: int) -> None:
         """Mark item as inactive."""
 
-        conn = psycopg2.connect(self.database_url)
+        conn = self.pool.getconn()
         cur = conn.cursor()
 
         try:
@@ -422,7 +425,7 @@ class ItemGenerationService:
 
         finally:
             cur.close()
-            conn.close()
+            self.pool.putconn(conn)
 
     def list_ai_generated_items(
         self,
@@ -443,7 +446,7 @@ class ItemGenerationService:
         Returns:
             Dictionary with items list and pagination info
         """
-        conn = psycopg2.connect(self.database_url)
+        conn = self.pool.getconn()
         cur = conn.cursor()
 
         try:
@@ -518,7 +521,7 @@ class ItemGenerationService:
 
         finally:
             cur.close()
-            conn.close()
+            self.pool.putconn(conn)
 
     def get_ai_item_details(self, item_id: int) -> Optional[Dict[str, Any]]:
         """
@@ -530,7 +533,7 @@ class ItemGenerationService:
         Returns:
             Detailed item information with AI metadata, or None if not found
         """
-        conn = psycopg2.connect(self.database_url)
+        conn = self.pool.getconn()
         cur = conn.cursor()
 
         try:
@@ -596,4 +599,4 @@ class ItemGenerationService:
 
         finally:
             cur.close()
-            conn.close()
+            self.pool.putconn(conn)
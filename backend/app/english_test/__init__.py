@@ -5,7 +5,8 @@ English Adaptive Test Module
 MST-based English proficiency assessment with IRT 3PL modeling.
 """
 
-from .irt_engine import IRTEngine
+from .irt_engine import IRTEngine, PosteriorState, StoppingRule
+from .item_bank import ItemBank
 from .router import router
 
-__all__ = ['IRTEngine', 'router']
+__all__ = ['IRTEngine', 'PosteriorState', 'StoppingRule', 'ItemBank', 'router']
@@ -6,16 +6,45 @@ English Test Admin Routes
 Version: 2.1.0 - Fixed skill_tag column name for VST implementation
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import Dict, List, Optional
 from pydantic import BaseModel
+import hmac
 import json
 import os
-from datetime import datetime
+from datetime import date, datetime
 
 router = APIRouter()
 
 
+def require_admin_token(
+    x_admin_token: Optional[str] = Header(None),
+    authorization: Optional[str] = Header(None)
+):
+    """
+    Admin token check for endpoints that expose student data.
+
+    The token is ADMIN_API_TOKEN, sent as `X-Admin-Token: <token>` or
+    `Authorization: Bearer <token>`. Without ADMIN_API_TOKEN the
+    endpoints are disabled rather than left open.
+    """
+    expected = os.getenv("ADMIN_API_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=503, detail="ADMIN_API_TOKEN is not configured")
+
+    token = x_admin_token
+    if token is None and authorization and authorization.lower().startswith("bearer "):
+        token = authorization[7:].strip()
+
+    if not token or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or missing admin token",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
 # Request models for AI generation
 class GenerateItemsRequest(BaseModel):
     stage: int  # 1, 2, or 3
@@ -38,9 +67,12 @@ async def cleanup_and_insert_clean_items() -> Dict:
     - Reading: 10개 + 4 passages
     """
     from app.english_test.database import EnglishTestDB
+    from app.english_test.router import item_cache
+
+    db = EnglishTestDB()
+    conn = None
 
     try:
-        db = EnglishTestDB()
         conn = db._get_connection()
         cursor = conn.cursor()
 
@@ -162,6 +194,7 @@ async def cleanup_and_insert_clean_items() -> Dict:
                 datetime.now()
             ))
         conn.commit()
+        item_cache.invalidate()
         results["steps"].append({"step": "6_insert_items", "count": len(items)})
 
         # 7. 최종 상태 확인
@@ -180,13 +213,17 @@ async def cleanup_and_insert_clean_items() -> Dict:
         })
 
         cursor.close()
-        conn.close()
 
         return results
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database cleanup failed: {str(e)}")
 
+    finally:
+        # Pooled connection: returning it also rolls back a failed cleanup
+        if conn is not None:
+            db._return_connection(conn)
+
 
 @router.post("/generate-items")
 async def generate_items_with_ai(request: GenerateItemsRequest) -> Dict:
@@ -206,6 +243,7 @@ async def generate_items_with_ai(request: GenerateItemsRequest) -> Dict:
     try:
         from app.english_test.ai_item_generator import get_generator
         from app.english_test.database import EnglishTestDB
+        from app.english_test.router import item_cache
 
         # Validate input
         if request.stage not in [1, 2, 3]:
@@ -284,6 +322,7 @@ async def generate_items_with_ai(request: GenerateItemsRequest) -> Dict:
                     inserted_count += 1
 
                 conn.commit()
+                item_cache.invalidate()
                 result["auto_inserted"] = True
                 result["inserted_count"] = inserted_count
 
@@ -295,7 +334,7 @@ async def generate_items_with_ai(request: GenerateItemsRequest) -> Dict:
                 )
             finally:
                 cursor.close()
-                conn.close()
+                db._return_connection(conn)
 
         return result
 
@@ -303,3 +342,97 @@ async def generate_items_with_ai(request: GenerateItemsRequest) -> Dict:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Item generation failed: {str(e)}")
+
+
+@router.get("/item-statistics")
+def get_item_statistics(
+    status: Optional[str] = Query(None, description="Item status, e.g. active")
+) -> Dict:
+    """
+    Classical item statistics from the running aggregates.
+
+    Reads one item_statistics row per item (maintained incrementally by
+    ItemStatsAggregator), so the cost is O(items) however many responses
+    have been recorded.
+
+    Returns:
+        p-value, point-biserial against final θ and response-time mean,
+        SD, median and 90th percentile per item
+    """
+    from app.english_test.database import EnglishTestDB
+    from app.english_test.item_stats import summarize
+
+    try:
+        rows = EnglishTestDB().get_item_statistics(status=status)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to load item statistics: {str(e)}")
+
+    items = [
+        {
+            'item_id': row['item_id'],
+            'stage': row['stage'],
+            'panel': row['panel'],
+            'form_id': row['form_id'],
+            'domain': row['domain'],
+            'status': row['status'],
+            **summarize(row),
+            'updated_at': row['updated_at'].isoformat() if row['updated_at'] else None
+        }
+        for row in rows
+    ]
+
+    return {
+        "status": "success",
+        "count": len(items),
+        "items": items
+    }
+
+
+@router.get("/export/{table}", dependencies=[Depends(require_admin_token)])
+def export_results(
+    table: str,
+    format: str = Query(default="ndjson", description="ndjson or csv"),
+    since: Optional[date] = Query(None, description="First session start date (inclusive)"),
+    until: Optional[date] = Query(None, description="Last session start date (inclusive)"),
+    status: Optional[str] = Query(None, description="Session status, e.g. completed"),
+    gzip: bool = Query(default=True, description="Gzip-compress the output")
+) -> StreamingResponse:
+    """
+    Stream english_test_sessions or english_test_responses as NDJSON/CSV.
+
+    Rows are read through a server-side cursor and encoded and compressed
+    batch by batch, so a full semester neither has to fit in memory nor
+    holds the response back until the query has finished.
+
+    Args:
+        table: sessions or responses
+        format: ndjson (default) or csv
+        since, until: Session start date range; responses follow their session
+        status: Only sessions (and their responses) with this status
+        gzip: Compress the stream (default: true)
+
+    Requires the admin token (see require_admin_token).
+    """
+    from app.english_test.database import EnglishTestDB
+    from app.english_test.export import MEDIA_TYPES, export_filename, export_stream
+
+    if since and until and since > until:
+        raise HTTPException(status_code=400, detail="'since' must not be after 'until'")
+
+    try:
+        stream = export_stream(
+            EnglishTestDB(), table, fmt=format,
+            since=since, until=until, status=status, compress=gzip
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Sync generator: Starlette iterates it in the threadpool, so the
+    # blocking cursor reads never stall the event loop
+    return StreamingResponse(
+        stream,
+        media_type="application/gzip" if gzip else MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{export_filename(table, format, gzip)}"'
+        }
+    )
@@ -0,0 +1,447 @@
+"""
+English Adaptive Test Async Database Layer
+==========================================
+
+asyncpg counterpart of EnglishTestDB for the FastAPI endpoints, so a
+query awaits on the event loop instead of blocking the worker. Method
+names, arguments and return shapes mirror EnglishTestDB; the sync class
+stays in use for scripts, admin routes and background threads.
+
+JSON/JSONB columns are decoded to Python objects by a connection codec,
+so callers get parsed `options` / `vocabulary_bands` just like the sync
+layer's json.loads handling.
+
+asyncpg prepares every query and caches the prepared statement per
+connection (ASYNCPG_STATEMENT_CACHE_SIZE, 0 behind a transaction-mode
+pooler). Request-path queries therefore keep a fixed SQL text: lists
+are passed as array parameters and updates use fixed column sets, so
+each is parsed and planned once per connection rather than per call.
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import asyncpg
+
+
+def _rowcount(status: str) -> int:
+    """Affected rows from an asyncpg command status ('UPDATE 5' -> 5)"""
+    try:
+        return int(status.rsplit(' ', 1)[-1])
+    except (ValueError, AttributeError):
+        return 0
+
+
+def _map_irt_parameters(item: Dict) -> Dict:
+    """Map IRT parameters: discrimination->a, difficulty->b, guessing->c"""
+    item['a'] = item['discrimination']
+    item['b'] = item['difficulty']
+    item['c'] = item['guessing']
+    return item
+
+
+async def _init_connection(conn):
+    """Decode json/jsonb to Python objects on every pooled connection"""
+    for type_name in ('json', 'jsonb'):
+        await conn.set_type_codec(
+            type_name,
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema='pg_catalog'
+        )
+
+
+class AsyncEnglishTestDB:
+    """
+    Async database access layer for English Adaptive Test.
+
+    The asyncpg pool is created on first use (not at import), sized by
+    ASYNCPG_POOL_MIN_SIZE / ASYNCPG_POOL_MAX_SIZE.
+    """
+
+    def __init__(self, database_url: Optional[str] = None):
+        database_url = database_url or os.environ.get('DATABASE_URL')
+        if not database_url:
+            raise ValueError("DATABASE_URL environment variable is required")
+
+        self.database_url = database_url
+        self.min_size = int(os.environ.get('ASYNCPG_POOL_MIN_SIZE', '2'))
+        self.max_size = int(os.environ.get('ASYNCPG_POOL_MAX_SIZE', '10'))
+        self.command_timeout = float(os.environ.get('ASYNCPG_COMMAND_TIMEOUT', '30'))
+        self.statement_cache_size = int(os.environ.get('ASYNCPG_STATEMENT_CACHE_SIZE', '100'))
+
+        self._pool: Optional[asyncpg.Pool] = None
+        self._pool_lock = asyncio.Lock()
+
+    async def _get_pool(self) -> asyncpg.Pool:
+        """Create the connection pool on first use"""
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    print(f"🔧 Initializing asyncpg pool (min={self.min_size}, max={self.max_size})")
+                    self._pool = await asyncpg.create_pool(
+                        dsn=self.database_url,
+                        min_size=self.min_size,
+                        max_size=self.max_size,
+                        command_timeout=self.command_timeout,
+                        statement_cache_size=self.statement_cache_size,
+                        init=_init_connection
+                    )
+                    print("✅ asyncpg pool initialized successfully")
+        return self._pool
+
+    async def close(self):
+        """Close the pool (application shutdown)"""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    def pool_stats(self) -> Dict:
+        """Pool occupancy for health checks"""
+        if self._pool is None:
+            return {'initialized': False, 'min_size': self.min_size, 'max_size': self.max_size}
+
+        return {
+            'initialized': True,
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'size': self._pool.get_size(),
+            'idle': self._pool.get_idle_size()
+        }
+
+    async def _fetchrow(self, query: str, *args) -> Optional[Dict]:
+        pool = await self._get_pool()
+        row = await pool.fetchrow(query, *args)
+        return dict(row) if row else None
+
+    async def _fetch(self, query: str, *args) -> List[Dict]:
+        pool = await self._get_pool()
+        return [dict(row) for row in await pool.fetch(query, *args)]
+
+    async def _execute(self, query: str, *args) -> int:
+        pool = await self._get_pool()
+        return _rowcount(await pool.execute(query, *args))
+
+    # ===== Session Methods =====
+
+    async def create_session(self, user_id: str) -> Dict:
+        """Create new English test session (see EnglishTestDB.create_session)"""
+        return await self._fetchrow("""
+            INSERT INTO english_test_sessions (
+                user_id, started_at, status, items_completed, stage, panel
+            )
+            VALUES ($1, $2, $3, $4, $5, $6)
+            RETURNING *;
+        """, user_id, datetime.now(), 'active', 0, 1, 'routing')
+
+    async def get_session(self, session_id: int) -> Optional[Dict]:
+        """Get session by ID"""
+        return await self._fetchrow("""
+            SELECT * FROM english_test_sessions WHERE id = $1;
+        """, session_id)
+
+    async def update_session(self, session_id: int, updates: Dict) -> Dict:
+        """
+        Update session fields (see EnglishTestDB.update_session).
+
+        The statement text depends on the field set, so each distinct set
+        is prepared separately; request paths use the fixed-shape
+        record_submission / finalize_session.
+        """
+        set_clauses = []
+        values = []
+
+        for field, value in updates.items():
+            # Convert numpy types to Python native types
+            if hasattr(value, 'item'):
+                value = value.item()
+            values.append(value)
+            set_clauses.append(f"{field} = ${len(values)}")
+
+        values.append(session_id)
+
+        return await self._fetchrow(f"""
+            UPDATE english_test_sessions
+            SET {', '.join(set_clauses)}, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ${len(values)}
+            RETURNING *;
+        """, *values)
+
+    async def finalize_session(self, session_id: int, final_results: Dict) -> Dict:
+        """Finalize session with final results (see EnglishTestDB.finalize_session)"""
+        values = [
+            datetime.now(),
+            final_results.get('final_theta'),
+            final_results.get('standard_error'),
+            final_results.get('proficiency_level'),
+            final_results.get('lexile_score'),
+            final_results.get('ar_level'),
+            final_results.get('vocabulary_size'),
+            final_results.get('vocabulary_bands') or None,
+            final_results.get('total_items'),
+            final_results.get('correct_count'),
+            final_results.get('accuracy_percentage')
+        ]
+
+        return await self._fetchrow("""
+            UPDATE english_test_sessions
+            SET status = 'completed',
+                completed_at = $2,
+                final_theta = $3,
+                standard_error = $4,
+                proficiency_level = $5,
+                lexile_score = $6,
+                ar_level = $7,
+                vocabulary_size = $8,
+                vocabulary_bands = $9,
+                total_items = $10,
+                correct_count = $11,
+                accuracy_percentage = $12,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = $1
+            RETURNING *;
+        """, session_id, *[value.item() if hasattr(value, 'item') else value for value in values])
+
+    async def record_submission(
+        self,
+        session_id: int,
+        item_id: int,
+        selected_answer: str,
+        is_correct: bool,
+        stage: int,
+        item_order: int,
+        theta_estimate: float,
+        standard_error: float,
+        new_stage: int,
+        new_panel: str,
+        response_time: Optional[int] = None,
+        exposure_item_id: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Persist one answer in a single statement (see
+        EnglishTestDB.record_submission for the guard and return value).
+        """
+        return await self._fetchrow("""
+            WITH s AS (
+                UPDATE english_test_sessions
+                SET items_completed = $6,
+                    current_theta = $7,
+                    current_se = $8,
+                    stage = $9,
+                    panel = $10,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = $1
+                  AND items_completed = $6 - 1
+                RETURNING id, user_id, items_completed, current_theta, current_se,
+                          stage, panel, status, updated_at
+            ),
+            r AS (
+                INSERT INTO english_test_responses (
+                    session_id, item_id, selected_answer, is_correct,
+                    stage, item_order,
+                    theta_estimate, standard_error, response_time, responded_at
+                )
+                SELECT s.id, $2, $3, $4, $5, $6, $7, $8, $11, $12
+                FROM s
+                RETURNING id
+            ),
+            e AS (
+                UPDATE items
+                SET exposure_count = COALESCE(exposure_count, 0) + 1
+                WHERE id = $13
+                  AND EXISTS (SELECT 1 FROM s)
+                RETURNING id
+            )
+            SELECT s.*,
+                   (SELECT id FROM r) AS response_id,
+                   (SELECT COUNT(*) FROM e) AS exposure_updated
+            FROM s;
+        """,
+            session_id, item_id, selected_answer, bool(is_correct), stage, item_order,
+            float(theta_estimate), float(standard_error), new_stage, new_panel,
+            response_time, datetime.now(), exposure_item_id
+        )
+
+    # ===== Item Methods =====
+
+    async def get_item(self, item_id: int) -> Optional[Dict]:
+        """Get item by ID with passage text and a/b/c mapped"""
+        item = await self._fetchrow("""
+            SELECT i.*, p.title as passage_title, p.content as passage_content
+            FROM items i
+            LEFT JOIN passages p ON i.passage_id = p.id
+            WHERE i.id = $1;
+        """, item_id)
+        return _map_irt_parameters(item) if item else None
+
+    async def get_items_for_selection(
+        self,
+        stage: int,
+        panel: str,
+        form_id: int = 1,
+        domain: Optional[str] = None,
+        excluded_ids: Optional[List[int]] = None
+    ) -> List[Dict]:
+        """Get candidate items for adaptive selection (see EnglishTestDB)"""
+        items = await self._fetch("""
+            SELECT i.*, p.title as passage_title, p.content as passage_content
+            FROM items i
+            LEFT JOIN passages p ON i.passage_id = p.id
+            WHERE i.stage = $1
+              AND i.panel = $2
+              AND i.form_id = $3
+              AND i.status = 'active'
+              AND ($4::text IS NULL OR i.domain::text = $4::text)
+              AND i.id <> ALL($5::int[])
+            ORDER BY i.exposure_rate NULLS FIRST, i.exposure_count ASC;
+        """, stage, panel, form_id, domain or None, [int(item_id) for item_id in excluded_ids or []])
+
+        return [_map_irt_parameters(item) for item in items]
+
+    async def get_active_items(self) -> List[Dict]:
+        """Get all active items without passage text (for the item bank cache)"""
+        items = await self._fetch("""
+            SELECT *
+            FROM items
+            WHERE status = 'active'
+            ORDER BY id;
+        """)
+        return [_map_irt_parameters(item) for item in items]
+
+    async def get_passages(self, passage_ids: List[int]) -> Dict[int, Dict]:
+        """Get passage titles and content by ID"""
+        if not passage_ids:
+            return {}
+
+        rows = await self._fetch("""
+            SELECT id, title, content
+            FROM passages
+            WHERE id = ANY($1::int[]);
+        """, list(passage_ids))
+        return {row['id']: {'title': row['title'], 'content': row['content']} for row in rows}
+
+    async def get_item_bank_version(self) -> Optional[int]:
+        """Current item bank version, or None if the version table is not installed"""
+        try:
+            row = await self._fetchrow("SELECT version FROM item_bank_version WHERE id = 1;")
+        except asyncpg.UndefinedTableError:
+            return None
+        return int(row['version']) if row else None
+
+    async def listen(self, channel: str, callback: Callable) -> asyncpg.Connection:
+        """
+        Open a dedicated (unpooled) connection listening on a NOTIFY channel.
+        The caller owns and must close the connection.
+
+        Args:
+            channel: Channel name
+            callback: Called as callback(connection, pid, channel, payload)
+
+        Returns:
+            asyncpg connection
+        """
+        conn = await asyncpg.connect(self.database_url)
+        await conn.add_listener(channel, callback)
+        return conn
+
+    async def increment_exposure(self, item_id: int):
+        """Increment item exposure count"""
+        await self._execute("""
+            UPDATE items
+            SET exposure_count = exposure_count + 1
+            WHERE id = $1;
+        """, item_id)
+
+    async def count_sessions(self) -> int:
+        """Number of started sessions (see EnglishTestDB.count_sessions)"""
+        row = await self._fetchrow("SELECT COUNT(*) AS sessions FROM english_test_sessions;")
+        return row['sessions']
+
+    async def apply_exposure_increments(self, increments: Dict[int, int], sessions: int) -> int:
+        """Apply batched exposure increments (see EnglishTestDB.apply_exposure_increments)"""
+        if not increments:
+            return 0
+
+        ids, counts = zip(*sorted(increments.items()))
+        return await self._execute("""
+            UPDATE items AS i
+            SET exposure_count = COALESCE(i.exposure_count, 0) + v.n,
+                exposure_rate = (COALESCE(i.exposure_count, 0) + v.n)::float / GREATEST($3::bigint, 1)
+            FROM unnest($1::int[], $2::int[]) AS v(id, n)
+            WHERE i.id = v.id;
+        """, list(ids), list(counts), sessions)
+
+    async def refresh_exposure_rates(self, sessions: int) -> int:
+        """Recompute exposure_rate for all items (see EnglishTestDB.refresh_exposure_rates)"""
+        return await self._execute("""
+            UPDATE items
+            SET exposure_rate = COALESCE(exposure_count, 0)::float / GREATEST($1::bigint, 1)
+            WHERE exposure_rate IS DISTINCT FROM
+                  COALESCE(exposure_count, 0)::float / GREATEST($1::bigint, 1);
+        """, sessions)
+
+    # ===== Response Methods =====
+
+    async def create_response(
+        self,
+        session_id: int,
+        item_id: int,
+        selected_answer: str,
+        is_correct: bool,
+        stage: int,
+        item_order: int,
+        theta_estimate: Optional[float] = None,
+        standard_error: Optional[float] = None,
+        response_time: Optional[int] = None
+    ) -> Dict:
+        """Record item response (see EnglishTestDB.create_response)"""
+        return await self._fetchrow("""
+            INSERT INTO english_test_responses (
+                session_id, item_id, selected_answer, is_correct,
+                stage, item_order,
+                theta_estimate, standard_error, response_time, responded_at
+            )
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+            RETURNING *;
+        """,
+            session_id, item_id, selected_answer, is_correct, stage, item_order,
+            float(theta_estimate) if theta_estimate is not None else None,
+            float(standard_error) if standard_error is not None else None,
+            response_time, datetime.now()
+        )
+
+    async def get_session_responses(self, session_id: int) -> List[Dict]:
+        """Get all responses for a session with item parameters"""
+        return await self._fetch("""
+            SELECT r.*,
+                   i.discrimination, i.difficulty, i.guessing, i.domain,
+                   i.frequency_band, i.target_word, i.is_pseudoword, i.band_size
+            FROM english_test_responses r
+            JOIN items i ON r.item_id = i.id
+            WHERE r.session_id = $1
+            ORDER BY r.responded_at ASC;
+        """, session_id)
+
+    # ===== Utility Methods =====
+
+    async def get_session_statistics(self, session_id: int) -> Dict:
+        """Get session statistics (see EnglishTestDB.get_session_statistics)"""
+        stats = await self._fetchrow("""
+            SELECT
+                COUNT(*) as total_items,
+                SUM(CASE WHEN is_correct THEN 1 ELSE 0 END) as correct_count,
+                AVG(CASE WHEN is_correct THEN 1.0 ELSE 0.0 END) * 100 as accuracy_percentage,
+                AVG(response_time) as avg_response_time
+            FROM english_test_responses
+            WHERE session_id = $1;
+        """, session_id)
+
+        return {
+            'total_items': int(stats['total_items']) if stats['total_items'] else 0,
+            'correct_count': int(stats['correct_count']) if stats['correct_count'] else 0,
+            'accuracy_percentage': round(float(stats['accuracy_percentage']), 2) if stats['accuracy_percentage'] else 0.0,
+            'avg_response_time': round(float(stats['avg_response_time']), 2) if stats['avg_response_time'] else None
+        }
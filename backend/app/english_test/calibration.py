@@ -0,0 +1,463 @@
+"""
+Streaming MML-EM Item Calibration for English Adaptive Testing
+==============================================================
+
+Re-estimates 3PL item parameters (discrimination, difficulty, guessing)
+from english_test_responses by marginal maximum likelihood with the
+Bock-Aitkin EM algorithm.
+
+- E-step: responses are streamed from Postgres through a server-side
+  cursor, a chunk of sessions at a time. Each chunk contributes expected
+  counts n[j, q] (examinees at node q who answered item j) and r[j, q]
+  (of those, correct), so memory is O(chunk × items + items × nodes)
+  regardless of table size. Chunks can be fanned out to worker processes.
+- M-step: one bounded L-BFGS-B run over all items at once with a
+  vectorized analytic gradient (the objective is separable per item),
+  with weak priors on a, b and c to keep sparse items stable.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from scipy.optimize import minimize
+
+from .irt_engine import IRTEngine
+
+
+ChunkSource = Callable[[], Iterable[Tuple[np.ndarray, np.ndarray]]]
+
+
+# ===== E-step =====
+
+def e_step_chunk(
+    correct: np.ndarray,
+    mask: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray,
+    c: np.ndarray,
+    quad_points: np.ndarray,
+    log_prior: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Expected counts for one chunk of examinees.
+
+    Top-level so it can run in a worker process.
+
+    Args:
+        correct: Scored responses, shape (N, J), 0 where unanswered
+        mask: Answered-item mask, shape (N, J)
+        a, b, c: Current item parameters, shape (J,)
+        quad_points: Quadrature nodes, shape (Q,)
+        log_prior: Log prior + log quadrature weights, shape (Q,)
+
+    Returns:
+        Tuple of (n, r, marginal log-likelihood) with n, r of shape (J, Q)
+    """
+    prob = IRTEngine().probability_matrix(a, b, c, quad_points)
+
+    correct = correct.astype(float)
+    incorrect = mask.astype(float) - correct
+
+    log_posterior = correct @ np.log(prob) + incorrect @ np.log1p(-prob) + log_prior
+    row_max = log_posterior.max(axis=1, keepdims=True)
+    weights = np.exp(log_posterior - row_max)
+    row_sum = weights.sum(axis=1, keepdims=True)
+    weights /= row_sum
+
+    marginal_ll = float(np.sum(np.log(row_sum) + row_max))
+
+    return mask.T.astype(float) @ weights, correct.T @ weights, marginal_ll
+
+
+# ===== Calibrator =====
+
+class ItemCalibrator:
+    """
+    Marginal maximum likelihood EM calibration of 3PL item parameters.
+
+    Attributes:
+        irt (IRTEngine): Engine supplying the quadrature grid and prior
+        a_bounds, b_bounds, c_bounds (Tuple[float, float]): Parameter bounds
+        log_a_prior (Tuple[float, float]): Normal prior (mean, sd) on log a
+        b_prior (Tuple[float, float]): Normal prior (mean, sd) on b
+        c_prior (Tuple[float, float]): Beta prior (alpha, beta) on c
+    """
+
+    def __init__(
+        self,
+        irt_engine: Optional[IRTEngine] = None,
+        a_bounds: Tuple[float, float] = (0.2, 4.0),
+        b_bounds: Tuple[float, float] = (-4.0, 4.0),
+        c_bounds: Tuple[float, float] = (0.0, 0.5),
+        log_a_prior: Tuple[float, float] = (0.0, 0.5),
+        b_prior: Tuple[float, float] = (0.0, 2.0),
+        c_prior: Tuple[float, float] = (5.0, 17.0)
+    ):
+        self.irt = irt_engine or IRTEngine()
+        self.a_bounds = a_bounds
+        self.b_bounds = b_bounds
+        self.c_bounds = c_bounds
+        self.log_a_prior = log_a_prior
+        self.b_prior = b_prior
+        self.c_prior = c_prior
+
+    def e_step(
+        self,
+        chunks: Iterable[Tuple[np.ndarray, np.ndarray]],
+        a: np.ndarray,
+        b: np.ndarray,
+        c: np.ndarray,
+        executor: Optional[ProcessPoolExecutor] = None,
+        max_in_flight: int = 2
+    ) -> Tuple[np.ndarray, np.ndarray, float, int]:
+        """
+        Accumulate expected counts over all chunks.
+
+        Args:
+            chunks: Iterable of (correct, mask) arrays, shape (N_chunk, J)
+            a, b, c: Current item parameters
+            executor: Process pool for the chunks; None runs inline
+            max_in_flight: Chunks submitted ahead of the oldest result
+
+        Returns:
+            Tuple of (n, r, marginal log-likelihood, examinee count)
+        """
+        quad_points = self.irt.quad_points
+        log_prior = np.asarray(self.irt.log_prior())
+
+        n = np.zeros((len(a), len(quad_points)))
+        r = np.zeros_like(n)
+        total_ll = 0.0
+        examinees = 0
+
+        if executor is None:
+            for correct, mask in chunks:
+                chunk_n, chunk_r, chunk_ll = e_step_chunk(correct, mask, a, b, c, quad_points, log_prior)
+                n += chunk_n
+                r += chunk_r
+                total_ll += chunk_ll
+                examinees += len(correct)
+            return n, r, total_ll, examinees
+
+        # Bound the chunks in flight so memory stays bounded
+        pending = []
+        for correct, mask in chunks:
+            pending.append(executor.submit(e_step_chunk, correct, mask, a, b, c, quad_points, log_prior))
+            examinees += len(correct)
+
+            if len(pending) >= max_in_flight:
+                chunk_n, chunk_r, chunk_ll = pending.pop(0).result()
+                n += chunk_n
+                r += chunk_r
+                total_ll += chunk_ll
+
+        for future in pending:
+            chunk_n, chunk_r, chunk_ll = future.result()
+            n += chunk_n
+            r += chunk_r
+            total_ll += chunk_ll
+
+        return n, r, total_ll, examinees
+
+    def _objective(
+        self,
+        params: np.ndarray,
+        n: np.ndarray,
+        r: np.ndarray
+    ) -> Tuple[float, np.ndarray]:
+        """Negative expected complete-data log posterior and its gradient."""
+        n_items = n.shape[0]
+        a, b, c = params[:n_items], params[n_items:2 * n_items], params[2 * n_items:]
+        theta = self.irt.quad_points[np.newaxis, :]
+
+        p_star = 1.0 / (1.0 + np.exp(np.clip(-a[:, None] * (theta - b[:, None]), -20, 20)))
+        p = np.clip(c[:, None] + (1 - c[:, None]) * p_star, 1e-10, 1 - 1e-10)
+
+        ll = np.sum(r * np.log(p) + (n - r) * np.log1p(-p))
+        dll_dp = r / p - (n - r) / (1 - p)
+        slope = (1 - c[:, None]) * p_star * (1 - p_star)
+
+        grad_a = np.sum(dll_dp * slope * (theta - b[:, None]), axis=1)
+        grad_b = np.sum(dll_dp * slope * -a[:, None], axis=1)
+        grad_c = np.sum(dll_dp * (1 - p_star), axis=1)
+
+        # Priors: log a ~ N, b ~ N, c ~ Beta
+        log_a_mean, log_a_sd = self.log_a_prior
+        b_mean, b_sd = self.b_prior
+        c_alpha, c_beta = self.c_prior
+        c_safe = np.clip(c, 1e-6, 1 - 1e-6)
+
+        ll += np.sum(-0.5 * ((np.log(a) - log_a_mean) / log_a_sd) ** 2 - np.log(a))
+        grad_a += -(np.log(a) - log_a_mean) / (log_a_sd ** 2 * a) - 1.0 / a
+        ll += np.sum(-0.5 * ((b - b_mean) / b_sd) ** 2)
+        grad_b += -(b - b_mean) / b_sd ** 2
+        ll += np.sum((c_alpha - 1) * np.log(c_safe) + (c_beta - 1) * np.log1p(-c_safe))
+        grad_c += (c_alpha - 1) / c_safe - (c_beta - 1) / (1 - c_safe)
+
+        return -ll, -np.concatenate([grad_a, grad_b, grad_c])
+
+    def m_step(
+        self,
+        n: np.ndarray,
+        r: np.ndarray,
+        a: np.ndarray,
+        b: np.ndarray,
+        c: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Maximize the expected complete-data log posterior for all items.
+
+        Args:
+            n: Expected examinees per (item, node), shape (J, Q)
+            r: Expected correct per (item, node), shape (J, Q)
+            a, b, c: Starting parameters
+
+        Returns:
+            Updated (a, b, c)
+        """
+        n_items = len(a)
+        start = np.concatenate([
+            np.clip(a, *self.a_bounds),
+            np.clip(b, *self.b_bounds),
+            np.clip(c, *self.c_bounds)
+        ])
+        bounds = [self.a_bounds] * n_items + [self.b_bounds] * n_items + [self.c_bounds] * n_items
+
+        result = minimize(
+            self._objective, start, args=(n, r), jac=True,
+            method='L-BFGS-B', bounds=bounds, options={'maxiter': 200}
+        )
+        params = result.x
+
+        return params[:n_items], params[n_items:2 * n_items], params[2 * n_items:]
+
+    def calibrate(
+        self,
+        chunk_source: ChunkSource,
+        a: np.ndarray,
+        b: np.ndarray,
+        c: np.ndarray,
+        max_iterations: int = 50,
+        tolerance: float = 1e-3,
+        workers: int = 1,
+        min_responses: int = 0,
+        log: Callable[[str], None] = print
+    ) -> Dict:
+        """
+        Run EM until the largest parameter change falls below tolerance.
+
+        Args:
+            chunk_source: Callable returning a fresh iterable of
+                (correct, mask) chunks for each pass over the data
+            a, b, c: Starting item parameters, shape (J,)
+            max_iterations: Maximum EM cycles
+            tolerance: Convergence threshold on max |Δparameter|
+            workers: Worker processes for the E-step
+            min_responses: Items with fewer responses keep their parameters
+            log: Progress callback
+
+        Returns:
+            Dictionary with a, b, c, response counts, iterations,
+            converged flag and final marginal log-likelihood
+        """
+        a = np.asarray(a, dtype=float).copy()
+        b = np.asarray(b, dtype=float).copy()
+        c = np.asarray(c, dtype=float).copy()
+
+        converged = False
+        marginal_ll = None
+        iteration = 0
+        responses_per_item = np.zeros(len(a))
+
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            for iteration in range(1, max_iterations + 1):
+                n, r, marginal_ll, examinees = self.e_step(
+                    chunk_source(), a, b, c, executor=executor, max_in_flight=2 * workers
+                )
+                responses_per_item = n.sum(axis=1)
+                free = responses_per_item >= max(min_responses, 1)
+                if not free.any():
+                    log("  No items have enough responses to calibrate")
+                    break
+
+                new_a, new_b, new_c = self.m_step(n[free], r[free], a[free], b[free], c[free])
+                change = max(
+                    np.max(np.abs(new_a - a[free]), initial=0.0),
+                    np.max(np.abs(new_b - b[free]), initial=0.0),
+                    np.max(np.abs(new_c - c[free]), initial=0.0)
+                )
+                a[free], b[free], c[free] = new_a, new_b, new_c
+
+                log(f"  EM {iteration:>3}: logL={marginal_ll:.2f} max|Δ|={change:.5f} "
+                    f"({examinees} examinees, {int(free.sum())} items free)")
+
+                if change < tolerance:
+                    converged = True
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return {
+            'a': a,
+            'b': b,
+            'c': c,
+            'responses': np.rint(responses_per_item).astype(int),
+            'iterations': iteration,
+            'converged': converged,
+            'marginal_log_likelihood': marginal_ll
+        }
+
+
+# ===== Database I/O =====
+
+def load_items_for_calibration(db) -> Tuple[List[int], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Load item IDs and current parameters (starting values).
+
+    Args:
+        db: EnglishTestDB instance
+
+    Returns:
+        Tuple of (item_ids, a, b, c)
+    """
+    conn = db._get_connection()
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            SELECT id,
+                   COALESCE(discrimination, 1.0),
+                   COALESCE(difficulty, 0.0),
+                   COALESCE(guessing, 0.25)
+            FROM items
+            ORDER BY id;
+        """)
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+        db._return_connection(conn)
+
+    params = np.array([row[1:] for row in rows], dtype=float).reshape(-1, 3)
+    return [row[0] for row in rows], params[:, 0], params[:, 1], params[:, 2]
+
+
+def stream_response_chunks(
+    db,
+    item_ids: List[int],
+    chunk_sessions: int = 5000,
+    fetch_size: int = 50000
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Stream english_test_responses as dense per-chunk matrices.
+
+    A named (server-side) cursor delivers rows fetch_size at a time,
+    ordered by session, and rows are packed into (correct, mask)
+    matrices of chunk_sessions sessions × len(item_ids) items.
+
+    Args:
+        db: EnglishTestDB instance
+        item_ids: Item IDs defining the matrix columns
+        chunk_sessions: Sessions per yielded chunk
+        fetch_size: Rows per server round trip
+
+    Yields:
+        Tuple of (correct float32 matrix, mask bool matrix)
+    """
+    column_of = {item_id: col for col, item_id in enumerate(item_ids)}
+    n_items = len(item_ids)
+
+    conn = db._get_connection()
+    cursor = conn.cursor(name=f"calibration_stream_{datetime.now():%H%M%S%f}")
+    cursor.itersize = fetch_size
+
+    try:
+        cursor.execute("""
+            SELECT session_id, item_id, is_correct
+            FROM english_test_responses
+            ORDER BY session_id;
+        """)
+
+        correct = np.zeros((chunk_sessions, n_items), dtype=np.float32)
+        mask = np.zeros((chunk_sessions, n_items), dtype=bool)
+        row = -1
+        current_session = None
+
+        for session_id, item_id, is_correct in cursor:
+            if session_id != current_session:
+                current_session = session_id
+                row += 1
+                if row == chunk_sessions:
+                    yield correct, mask
+                    correct = np.zeros((chunk_sessions, n_items), dtype=np.float32)
+                    mask = np.zeros((chunk_sessions, n_items), dtype=bool)
+                    row = 0
+
+            col = column_of.get(item_id)
+            if col is not None:
+                correct[row, col] = float(is_correct)
+                mask[row, col] = True
+
+        if row >= 0:
+            yield correct[:row + 1], mask[:row + 1]
+
+    finally:
+        cursor.close()
+        conn.rollback()
+        db._return_connection(conn)
+
+
+def write_item_parameters(
+    db,
+    item_ids: List[int],
+    a: np.ndarray,
+    b: np.ndarray,
+    c: np.ndarray,
+    update_mask: Optional[np.ndarray] = None
+) -> int:
+    """
+    Bulk-write calibrated parameters back to items in one statement.
+
+    Args:
+        db: EnglishTestDB instance
+        item_ids: Item IDs aligned with the parameter arrays
+        a, b, c: Calibrated parameters
+        update_mask: Only write items where True (default: all)
+
+    Returns:
+        Number of items updated
+    """
+    from psycopg2.extras import execute_values
+
+    if update_mask is None:
+        update_mask = np.ones(len(item_ids), dtype=bool)
+
+    rows = [
+        (item_id, round(float(a[j]), 4), round(float(b[j]), 4), round(float(c[j]), 4))
+        for j, item_id in enumerate(item_ids) if update_mask[j]
+    ]
+    if not rows:
+        return 0
+
+    conn = db._get_connection()
+    cursor = conn.cursor()
+
+    try:
+        execute_values(cursor, """
+            UPDATE items AS i
+            SET discrimination = v.a,
+                difficulty = v.b,
+                guessing = v.c,
+                calibrated_at = CURRENT_TIMESTAMP
+            FROM (VALUES %s) AS v(id, a, b, c)
+            WHERE i.id = v.id;
+        """, rows, page_size=1000)
+        conn.commit()
+        return len(rows)
+
+    finally:
+        cursor.close()
+        db._return_connection(conn)
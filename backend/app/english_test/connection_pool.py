@@ -0,0 +1,384 @@
+"""
+Thread-Safe psycopg2 Connection Pool
+====================================
+
+psycopg2's SimpleConnectionPool is not safe to share between threads and
+raises PoolError as soon as maxconn connections are checked out, so a
+burst of admin or generation requests turned into 500s. ConnectionPool
+instead:
+
+- queues callers FIFO until a connection is returned (returned
+  connections are handed straight to the longest waiter), raising
+  PoolTimeout only after `timeout` seconds
+- validates a connection on checkout (closed, or a `SELECT 1` ping once it
+  has been idle longer than `validate_idle` seconds) and replaces it if
+  it is broken
+- rolls back any open transaction when a connection is returned
+- opens `min_size` connections up front with warm()
+- counts checkouts, wait time, exhaustion events (callers that had to
+  queue) and timeouts for /health
+
+One pool per DATABASE_URL and process is shared through get_pool(), so
+EnglishTestDB, the admin routes and ItemGenerationService draw from the
+same `max_size` connections. Sizes come from DB_POOL_MIN_SIZE,
+DB_POOL_MAX_SIZE, DB_POOL_TIMEOUT and DB_POOL_VALIDATE_IDLE.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Optional, Tuple
+
+import psycopg2
+from psycopg2 import extensions, pool
+
+
+class PoolTimeout(pool.PoolError):
+    """No connection became available within the checkout timeout"""
+
+
+class _Waiter:
+    """A queued checkout; filled in by whoever frees a connection or slot"""
+
+    __slots__ = ('event', 'ready', 'conn', 'idle_since')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.ready = False
+        self.conn = None          # None with ready=True: a slot to open one
+        self.idle_since = 0.0
+
+
+class ConnectionPool:
+    """
+    Bounded, blocking pool of psycopg2 connections.
+
+    Attributes:
+        dsn (str): Connection string
+        min_size (int): Connections opened by warm()
+        max_size (int): Upper bound on open connections
+        timeout (float): Default seconds to wait for a free connection
+        validate_idle (float): Idle seconds after which checkout pings the
+            connection (0 pings on every checkout)
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 10.0,
+        validate_idle: float = 30.0
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min={min_size}, max={max_size}")
+
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.validate_idle = validate_idle
+
+        # Idle connections with the time they were returned; most recently
+        # used at the right so the warmest connection is reused first
+        self._idle: Deque[Tuple[object, float]] = deque()
+        self._in_use = set()
+        self._opening = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._pid = os.getpid()
+
+        self.checkouts = 0
+        self.exhaustions = 0
+        self.timeouts = 0
+        self.replaced = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    # ----- Checkout / return -----
+
+    def getconn(self, timeout: Optional[float] = None):
+        """
+        Check out a validated connection, waiting for one if the pool is full.
+
+        Args:
+            timeout: Seconds to wait (defaults to the pool timeout)
+
+        Returns:
+            psycopg2 connection; give it back with putconn()
+
+        Raises:
+            PoolTimeout: No connection was freed within timeout
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        waited = False
+
+        while True:
+            conn, idle_since, waited = self._acquire(started, timeout, waited)
+
+            if conn is None:
+                # A slot was reserved for a new connection
+                try:
+                    conn = psycopg2.connect(self.dsn)
+                except Exception:
+                    with self._lock:
+                        self._opening -= 1
+                        self._release_slot()
+                    raise
+                with self._lock:
+                    self._opening -= 1
+                    self._in_use.add(conn)
+                break
+
+            if self._is_usable(conn, idle_since):
+                break
+
+            # Broken connection: drop it and retry, normally in the freed slot
+            with self._lock:
+                self.replaced += 1
+            self.putconn(conn, close=True)
+
+        wait = time.monotonic() - started
+        with self._lock:
+            self.checkouts += 1
+            self.wait_time_total += wait
+            self.wait_time_max = max(self.wait_time_max, wait)
+        return conn
+
+    def _acquire(self, started: float, timeout: float, waited: bool):
+        """
+        Take an idle connection, reserve a slot to open one, or queue.
+
+        Returns:
+            (connection, idle_since, waited); connection is None when the
+            caller should open a new connection in the reserved slot
+        """
+        with self._lock:
+            self._check_fork()
+            if self._closed:
+                raise pool.PoolError("connection pool is closed")
+
+            # Callers already queued are served first
+            if not self._waiters:
+                if self._idle:
+                    conn, idle_since = self._idle.pop()
+                    self._in_use.add(conn)
+                    return conn, idle_since, waited
+
+                if self._size() < self.max_size:
+                    self._opening += 1
+                    return None, None, waited
+
+            if not waited:
+                self.exhaustions += 1
+                waited = True
+
+            waiter = _Waiter()
+            self._waiters.append(waiter)
+
+        waiter.event.wait(max(0.0, timeout - (time.monotonic() - started)))
+
+        with self._lock:
+            if waiter.ready:
+                return waiter.conn, waiter.idle_since, waited
+
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+            if self._closed:
+                raise pool.PoolError("connection pool is closed")
+
+            self.timeouts += 1
+            raise PoolTimeout(
+                f"No database connection available within {timeout:.1f}s "
+                f"({len(self._in_use)}/{self.max_size} in use)"
+            )
+
+    def _is_usable(self, conn, idle_since: float) -> bool:
+        """Validate a connection taken from the idle queue"""
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self.validate_idle:
+            return True
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def putconn(self, conn, close: bool = False):
+        """
+        Return a connection to the pool.
+
+        An open transaction is rolled back; broken connections (or
+        close=True) are closed instead and free their slot.
+        """
+        if not close and not conn.closed:
+            try:
+                if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                close = True
+
+        with self._lock:
+            self._in_use.discard(conn)
+
+            if close or conn.closed or self._closed:
+                self._release_slot()
+            else:
+                self._give(conn, time.monotonic())
+                conn = None
+
+        if conn is not None and not conn.closed:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _give(self, conn, idle_since: float):
+        """Hand a free connection to the longest waiter, else park it (lock held)"""
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.conn = conn
+            waiter.idle_since = idle_since
+            waiter.ready = True
+            self._in_use.add(conn)
+            waiter.event.set()
+        else:
+            self._idle.append((conn, idle_since))
+
+    def _release_slot(self):
+        """Let the longest waiter open a connection in a freed slot (lock held)"""
+        if self._waiters and self._size() < self.max_size:
+            waiter = self._waiters.popleft()
+            waiter.ready = True
+            self._opening += 1
+            waiter.event.set()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """Context manager that checks out a connection and always returns it"""
+        conn = self.getconn(timeout)
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    # ----- Lifecycle -----
+
+    def warm(self) -> int:
+        """
+        Open connections until min_size exist (application startup).
+
+        Returns:
+            Number of connections opened
+        """
+        opened = 0
+        while True:
+            with self._lock:
+                if self._closed or self._size() >= self.min_size:
+                    return opened
+                self._opening += 1
+
+            try:
+                conn = psycopg2.connect(self.dsn)
+            except Exception:
+                with self._lock:
+                    self._opening -= 1
+                    self._release_slot()
+                raise
+
+            with self._lock:
+                self._opening -= 1
+                self._give(conn, time.monotonic())
+            opened += 1
+
+    def closeall(self):
+        """Close idle connections and refuse new checkouts"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, deque()
+            waiters, self._waiters = self._waiters, deque()
+
+        for waiter in waiters:
+            waiter.event.set()
+
+        for conn, _ in idle:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _size(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._opening
+
+    def _check_fork(self):
+        """
+        Forget connections inherited from a parent process (process pools);
+        the sockets belong to the parent, so they are dropped, not closed.
+        """
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._idle = deque()
+            self._in_use = set()
+            self._waiters = deque()
+            self._opening = 0
+
+    # ----- Monitoring -----
+
+    def stats(self) -> Dict:
+        """Occupancy and checkout metrics for health checks"""
+        with self._lock:
+            return {
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                'size': self._size(),
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'waiting': len(self._waiters),
+                'checkouts': self.checkouts,
+                'exhaustions': self.exhaustions,
+                'timeouts': self.timeouts,
+                'replaced': self.replaced,
+                'wait_ms_avg': round(1000 * self.wait_time_total / self.checkouts, 3) if self.checkouts else 0.0,
+                'wait_ms_max': round(1000 * self.wait_time_max, 3)
+            }
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(dsn: Optional[str] = None) -> ConnectionPool:
+    """
+    Process-wide pool for a DSN (DATABASE_URL by default).
+
+    The pool is created on first call; connections are opened on demand
+    or by warm().
+    """
+    dsn = dsn or os.environ.get('DATABASE_URL')
+    if not dsn:
+        raise ValueError("DATABASE_URL environment variable is required")
+
+    with _pools_lock:
+        conn_pool = _pools.get(dsn)
+        if conn_pool is None:
+            conn_pool = ConnectionPool(
+                dsn,
+                min_size=int(os.environ.get('DB_POOL_MIN_SIZE', '1')),
+                max_size=int(os.environ.get('DB_POOL_MAX_SIZE', '10')),
+                timeout=float(os.environ.get('DB_POOL_TIMEOUT', '10')),
+                validate_idle=float(os.environ.get('DB_POOL_VALIDATE_IDLE', '30'))
+            )
+            _pools[dsn] = conn_pool
+        return conn_pool
@@ -7,26 +7,69 @@ Mirrors Prisma schema for English test tables.
 """
 
 import os
+import re
 import socket
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+import weakref
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import date, datetime
 import psycopg2
-from psycopg2 import pool
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 import json
 
+from .connection_pool import get_pool
+
+
+# psycopg2 placeholders, positional (%s) or named (%(name)s)
+_PLACEHOLDER = re.compile(r'%\((\w+)\)s|%s')
+
+
+def _prepared_forms(name: str, query: str) -> Tuple[str, str]:
+    """
+    Split a psycopg2 query into a PREPARE statement ($n parameters) and
+    the matching EXECUTE template (psycopg2 placeholders). A named
+    placeholder used several times maps to a single $n.
+    """
+    slots: List[Optional[str]] = []
+
+    def number(match):
+        key = match.group(1)
+        if key is None:
+            slots.append(None)
+            return f"${len(slots)}"
+        if key not in slots:
+            slots.append(key)
+        return f"${slots.index(key) + 1}"
+
+    body = _PLACEHOLDER.sub(number, query).strip().rstrip(';')
+    prepare = f"PREPARE {name} AS {body}"
+
+    if not slots:
+        return prepare, f"EXECUTE {name}"
+    args = ', '.join('%s' if key is None else f"%({key})s" for key in slots)
+    return prepare, f"EXECUTE {name}({args})"
+
+
+def _native(value):
+    """Convert numpy scalars to Python types for the driver"""
+    return value.item() if hasattr(value, 'item') else value
+
 
 class EnglishTestDB:
     """
     Database access layer for English Adaptive Test.
 
-    Uses connection pooling via psycopg2 to prevent connection exhaustion.
+    Uses the shared thread-safe connection pool (connection_pool.py), so
+    concurrent callers wait for a free connection instead of failing.
     Schema mirrors Prisma definitions in schema.prisma.
     """
 
-    # Class-level connection pool (shared across all instances)
+    # Process-wide connection pool, shared with the admin routes and
+    # ItemGenerationService (see connection_pool.get_pool)
     _connection_pool = None
 
+    # Per-connection prepared statements: connection -> {name: EXECUTE template}
+    _prepared: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
     def __init__(self):
         """
         Initialize database connection pool using DATABASE_URL from environment.
@@ -44,27 +87,22 @@ class EnglishTestDB:
             print("⚠️ Please ensure DATABASE_URL is set in Render environment variables")
             raise ValueError("DATABASE_URL environment variable is required")
 
+        # Hot statements are prepared once per connection; set
+        # DB_PREPARE_STATEMENTS=0 behind a transaction-mode pooler
+        # (PgBouncer), where session-level PREPARE is not preserved
+        self.prepare_statements = os.environ.get('DB_PREPARE_STATEMENTS', '1') == '1'
+
     def _ensure_pool_initialized(self):
         """
-        Lazy initialization of connection pool.
-        Pool is created only when first connection is requested.
-        This prevents connection errors during module import.
+        Lazy lookup of the shared connection pool.
+        Connections are opened on first checkout (or by warm_pool at
+        startup), which prevents connection errors during module import.
         """
         if EnglishTestDB._connection_pool is None:
-            try:
-                print("🔧 Initializing connection pool (min=1, max=5)")
-                EnglishTestDB._connection_pool = pool.SimpleConnectionPool(
-                    minconn=1,
-                    maxconn=5,
-                    dsn=self.database_url
-                )
-                print("✅ Connection pool initialized successfully")
-            except Exception as e:
-                print(f"❌ Failed to initialize connection pool: {e}")
-                raise
+            EnglishTestDB._connection_pool = get_pool(self.database_url)
 
     def _get_connection(self):
-        """Get database connection from pool"""
+        """Get database connection from pool, waiting if all are in use"""
         # Ensure pool is initialized before getting connection
         self._ensure_pool_initialized()
 
@@ -81,6 +119,52 @@ class EnglishTestDB:
         except Exception as e:
             print(f"⚠️ Failed to return connection to pool: {e}")
 
+    def warm_pool(self) -> int:
+        """Open the pool's minimum connections (application startup)"""
+        self._ensure_pool_initialized()
+        return EnglishTestDB._connection_pool.warm()
+
+    def pool_stats(self) -> Dict:
+        """Pool occupancy and checkout metrics for health checks"""
+        if EnglishTestDB._connection_pool is None:
+            return {'initialized': False}
+        return {'initialized': True, **EnglishTestDB._connection_pool.stats()}
+
+    def _execute_prepared(self, cursor, name: str, query: str, params=None):
+        """
+        Execute a fixed-shape hot query through a prepared statement, so
+        Postgres parses and plans it once per connection instead of on
+        every call.
+
+        Args:
+            cursor: Cursor of a pooled connection
+            name: Statement name, unique per query text
+            query: Query with psycopg2 placeholders (%s or %(name)s)
+            params: Parameters, as for cursor.execute
+        """
+        if not self.prepare_statements:
+            cursor.execute(query, params)
+            return
+
+        conn = cursor.connection
+        prepared = EnglishTestDB._prepared.setdefault(conn, {})
+
+        for attempt in range(2):
+            execute = prepared.get(name)
+            if execute is None:
+                prepare, execute = _prepared_forms(name, query)
+                cursor.execute(prepare)
+                prepared[name] = execute
+            try:
+                cursor.execute(execute, params)
+                return
+            except psycopg2.errors.InvalidSqlStatementName:
+                # The server session was reset (e.g. by a pooler); prepare again
+                conn.rollback()
+                prepared.clear()
+                if attempt:
+                    raise
+
     # ===== Session Methods =====
 
     def create_session(self, user_id: str) -> Dict:
@@ -127,7 +211,7 @@ class EnglishTestDB:
         cursor = conn.cursor(cursor_factory=RealDictCursor)
 
         try:
-            cursor.execute("""
+            self._execute_prepared(cursor, 'ets_get_session', """
                 SELECT * FROM english_test_sessions WHERE id = %s;
             """, (session_id,))
 
@@ -142,6 +226,10 @@ class EnglishTestDB:
         """
         Update session fields.
 
+        The SET clause follows the given fields, so each field set is a
+        different statement to Postgres; request paths use the fixed-shape
+        record_submission / finalize_session instead.
+
         Args:
             session_id: Session ID
             updates: Dictionary of field: value pairs to update
@@ -196,8 +284,8 @@ class EnglishTestDB:
         Returns:
             Completed session dictionary
         """
-        updates = {
-            'status': 'completed',
+        params = {
+            'session_id': session_id,
             'completed_at': datetime.now(),
             'final_theta': final_results.get('final_theta'),
             'standard_error': final_results.get('standard_error'),
@@ -211,7 +299,152 @@ class EnglishTestDB:
             'accuracy_percentage': final_results.get('accuracy_percentage')
         }
 
-        return self.update_session(session_id, updates)
+        conn = self._get_connection()
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+        try:
+            self._execute_prepared(cursor, 'ets_finalize_session', """
+                UPDATE english_test_sessions
+                SET status = 'completed',
+                    completed_at = %(completed_at)s,
+                    final_theta = %(final_theta)s,
+                    standard_error = %(standard_error)s,
+                    proficiency_level = %(proficiency_level)s,
+                    lexile_score = %(lexile_score)s,
+                    ar_level = %(ar_level)s,
+                    vocabulary_size = %(vocabulary_size)s,
+                    vocabulary_bands = %(vocabulary_bands)s,
+                    total_items = %(total_items)s,
+                    correct_count = %(correct_count)s,
+                    accuracy_percentage = %(accuracy_percentage)s,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = %(session_id)s
+                RETURNING *;
+            """, {key: _native(value) for key, value in params.items()})
+
+            session = dict(cursor.fetchone())
+            conn.commit()
+            return session
+
+        except Exception:
+            conn.rollback()
+            raise
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
+    def record_submission(
+        self,
+        session_id: int,
+        item_id: int,
+        selected_answer: str,
+        is_correct: bool,
+        stage: int,
+        item_order: int,
+        theta_estimate: float,
+        standard_error: float,
+        new_stage: int,
+        new_panel: str,
+        response_time: Optional[int] = None,
+        exposure_item_id: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Persist one answer in a single statement (one round trip, one commit):
+        insert the response, update the session's progress, estimates and
+        stage/panel, and bump the next item's exposure count.
+
+        The session update is guarded by items_completed = item_order - 1,
+        so a stale caller (another process advanced the session) writes
+        nothing.
+
+        Args:
+            session_id: Session ID
+            item_id: Answered item ID
+            selected_answer: Selected option ('A', 'B', 'C', 'D')
+            is_correct: Whether answer is correct
+            stage: MST stage the item was answered in
+            item_order: Sequential order of this item (new items_completed)
+            theta_estimate: Theta estimate after this response
+            standard_error: Standard error after this response
+            new_stage: Session stage after routing
+            new_panel: Session panel after routing
+            response_time: Response time in milliseconds
+            exposure_item_id: Item whose exposure_count to increment
+                (the next item; None if counted elsewhere or test complete)
+
+        Returns:
+            Dictionary with the updated session fields and response_id, or
+            None if the guard did not match
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+        try:
+            self._execute_prepared(cursor, 'ets_record_submission', """
+                WITH s AS (
+                    UPDATE english_test_sessions
+                    SET items_completed = %(item_order)s,
+                        current_theta = %(theta)s,
+                        current_se = %(se)s,
+                        stage = %(new_stage)s,
+                        panel = %(new_panel)s,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = %(session_id)s
+                      AND items_completed = %(item_order)s - 1
+                    RETURNING id, user_id, items_completed, current_theta, current_se,
+                              stage, panel, status, updated_at
+                ),
+                r AS (
+                    INSERT INTO english_test_responses (
+                        session_id, item_id, selected_answer, is_correct,
+                        stage, item_order,
+                        theta_estimate, standard_error, response_time, responded_at
+                    )
+                    SELECT s.id, %(item_id)s, %(selected_answer)s, %(is_correct)s,
+                           %(stage)s, %(item_order)s,
+                           %(theta)s, %(se)s, %(response_time)s, %(responded_at)s
+                    FROM s
+                    RETURNING id
+                ),
+                e AS (
+                    UPDATE items
+                    SET exposure_count = COALESCE(exposure_count, 0) + 1
+                    WHERE id = %(exposure_item_id)s
+                      AND EXISTS (SELECT 1 FROM s)
+                    RETURNING id
+                )
+                SELECT s.*,
+                       (SELECT id FROM r) AS response_id,
+                       (SELECT COUNT(*) FROM e) AS exposure_updated
+                FROM s;
+            """, {
+                'session_id': session_id,
+                'item_id': item_id,
+                'selected_answer': selected_answer,
+                'is_correct': bool(is_correct),
+                'stage': stage,
+                'item_order': item_order,
+                'theta': float(theta_estimate),
+                'se': float(standard_error),
+                'new_stage': new_stage,
+                'new_panel': new_panel,
+                'response_time': response_time,
+                'responded_at': datetime.now(),
+                'exposure_item_id': exposure_item_id
+            })
+
+            row = cursor.fetchone()
+            conn.commit()
+            return dict(row) if row else None
+
+        except Exception:
+            conn.rollback()
+            raise
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
 
     # ===== Item Methods =====
 
@@ -229,7 +462,7 @@ class EnglishTestDB:
         cursor = conn.cursor(cursor_factory=RealDictCursor)
 
         try:
-            cursor.execute("""
+            self._execute_prepared(cursor, 'ets_get_item', """
                 SELECT i.*, p.title as passage_title, p.content as passage_content
                 FROM items i
                 LEFT JOIN passages p ON i.passage_id = p.id
@@ -280,36 +513,68 @@ class EnglishTestDB:
         cursor = conn.cursor(cursor_factory=RealDictCursor)
 
         try:
-            query = """
+            # One statement shape for every call: the optional domain filter
+            # and the exclusion list are parameters (an empty array excludes
+            # nothing) instead of SQL that changes with the list length
+            self._execute_prepared(cursor, 'ets_items_for_selection', """
                 SELECT i.*, p.title as passage_title, p.content as passage_content
                 FROM items i
                 LEFT JOIN passages p ON i.passage_id = p.id
-                WHERE i.stage = %s
-                  AND i.panel = %s
-                  AND i.form_id = %s
+                WHERE i.stage = %(stage)s
+                  AND i.panel = %(panel)s
+                  AND i.form_id = %(form_id)s
                   AND i.status = 'active'
-            """
-            params = [stage, panel, form_id]
+                  AND (%(domain)s::text IS NULL OR i.domain::text = %(domain)s::text)
+                  AND i.id <> ALL(%(excluded_ids)s::int[])
+                ORDER BY i.exposure_rate NULLS FIRST, i.exposure_count ASC;
+            """, {
+                'stage': stage,
+                'panel': panel,
+                'form_id': form_id,
+                'domain': domain or None,
+                'excluded_ids': [int(item_id) for item_id in excluded_ids or []]
+            })
+            items = [dict(row) for row in cursor.fetchall()]
 
-            if domain:
-                query += " AND i.domain = %s"
-                params.append(domain)
+            # Parse JSON options and map IRT parameters
+            for item in items:
+                if isinstance(item['options'], str):
+                    item['options'] = json.loads(item['options'])
 
-            if excluded_ids:
-                query += f" AND i.id NOT IN ({','.join(['%s'] * len(excluded_ids))})"
-                params.extend(excluded_ids)
+                # Map IRT parameters: discrimination->a, difficulty->b, guessing->c
+                item['a'] = item['discrimination']
+                item['b'] = item['difficulty']
+                item['c'] = item['guessing']
 
-            query += " ORDER BY i.exposure_rate NULLS FIRST, i.exposure_count ASC;"
+            return items
 
-            cursor.execute(query, params)
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
+    def get_active_items(self) -> List[Dict]:
+        """
+        Get all active items without passage text (for the item bank cache).
+
+        Returns:
+            List of item dictionaries (options parsed, a/b/c mapped)
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+        try:
+            cursor.execute("""
+                SELECT *
+                FROM items
+                WHERE status = 'active'
+                ORDER BY id;
+            """)
             items = [dict(row) for row in cursor.fetchall()]
 
-            # Parse JSON options and map IRT parameters
             for item in items:
                 if isinstance(item['options'], str):
                     item['options'] = json.loads(item['options'])
 
-                # Map IRT parameters: discrimination->a, difficulty->b, guessing->c
                 item['a'] = item['discrimination']
                 item['b'] = item['difficulty']
                 item['c'] = item['guessing']
@@ -320,6 +585,60 @@ class EnglishTestDB:
             cursor.close()
             self._return_connection(conn)
 
+    def get_passages(self, passage_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Get passage titles and content by ID.
+
+        Args:
+            passage_ids: Passage IDs
+
+        Returns:
+            Mapping of passage ID to {'title', 'content'}
+        """
+        if not passage_ids:
+            return {}
+
+        conn = self._get_connection()
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+        try:
+            cursor.execute("""
+                SELECT id, title, content
+                FROM passages
+                WHERE id = ANY(%s);
+            """, (list(passage_ids),))
+
+            return {row['id']: {'title': row['title'], 'content': row['content']} for row in cursor.fetchall()}
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
+    def get_item_bank_version(self) -> Optional[int]:
+        """
+        Current item bank version, bumped by trigger whenever items or
+        passages change (see migrations/add_item_bank_version.sql).
+
+        Returns:
+            Version number, or None if the version table is not installed
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("SELECT version FROM item_bank_version WHERE id = 1;")
+            row = cursor.fetchone()
+            conn.commit()
+            return int(row[0]) if row else None
+
+        except psycopg2.errors.UndefinedTable:
+            conn.rollback()
+            return None
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
     def increment_exposure(self, item_id: int):
         """
         Increment item exposure count (for exposure control).
@@ -342,6 +661,122 @@ class EnglishTestDB:
             cursor.close()
             self._return_connection(conn)
 
+    def count_sessions(self) -> int:
+        """
+        Number of started sessions (denominator of exposure_rate).
+
+        A full COUNT(*); ExposureAggregator caches it between flushes rather
+        than counting on every write.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("SELECT COUNT(*) FROM english_test_sessions;")
+            return cursor.fetchone()[0]
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
+    def apply_exposure_increments(self, increments: Dict[int, int], sessions: int) -> int:
+        """
+        Apply batched exposure increments in one statement and refresh
+        exposure_rate (administrations per started session) for those items.
+
+        Args:
+            increments: Mapping of item ID to number of new administrations
+            sessions: Started-session count (see count_sessions)
+
+        Returns:
+            Number of items updated
+        """
+        if not increments:
+            return 0
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        ids, counts = zip(*sorted(increments.items()))
+
+        try:
+            # Arrays keep the statement shape fixed whatever the batch size
+            self._execute_prepared(cursor, 'ets_apply_exposure', """
+                UPDATE items AS i
+                SET exposure_count = COALESCE(i.exposure_count, 0) + v.n,
+                    exposure_rate = (COALESCE(i.exposure_count, 0) + v.n)::float / GREATEST(%s::bigint, 1)
+                FROM unnest(%s::int[], %s::int[]) AS v(id, n)
+                WHERE i.id = v.id;
+            """, (sessions, list(ids), list(counts)))
+            updated = cursor.rowcount
+            conn.commit()
+            return updated
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
+    def refresh_exposure_rates(self, sessions: int) -> int:
+        """
+        Recompute exposure_rate for all items against the current session
+        count (rates of unserved items decay as sessions grow).
+
+        Args:
+            sessions: Started-session count (see count_sessions)
+
+        Returns:
+            Number of items whose rate changed
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                UPDATE items
+                SET exposure_rate = COALESCE(exposure_count, 0)::float / GREATEST(%(sessions)s::bigint, 1)
+                WHERE exposure_rate IS DISTINCT FROM
+                      COALESCE(exposure_count, 0)::float / GREATEST(%(sessions)s::bigint, 1);
+            """, {'sessions': sessions})
+            updated = cursor.rowcount
+            conn.commit()
+            return updated
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
+    def update_sympson_hetter_parameters(self, parameters: Dict[int, float]) -> int:
+        """
+        Store precomputed Sympson-Hetter exposure parameters.
+
+        Args:
+            parameters: Mapping of item ID to K (probability of administering
+                the item once selected)
+
+        Returns:
+            Number of items updated
+        """
+        if not parameters:
+            return 0
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            execute_values(cursor, """
+                UPDATE items AS i
+                SET sympson_hetter_k = v.k
+                FROM (VALUES %s) AS v(id, k)
+                WHERE i.id = v.id;
+            """, [(item_id, float(k)) for item_id, k in sorted(parameters.items())])
+            updated = cursor.rowcount
+            conn.commit()
+            return updated
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
     # ===== Response Methods =====
 
     def create_response(
@@ -419,7 +854,7 @@ class EnglishTestDB:
         cursor = conn.cursor(cursor_factory=RealDictCursor)
 
         try:
-            cursor.execute("""
+            self._execute_prepared(cursor, 'ets_session_responses', """
                 SELECT r.*,
                        i.discrimination, i.difficulty, i.guessing, i.domain,
                        i.frequency_band, i.target_word, i.is_pseudoword, i.band_size
@@ -472,3 +907,280 @@ class EnglishTestDB:
         finally:
             cursor.close()
             self._return_connection(conn)
+
+    # ===== Item Statistics Methods =====
+
+    def apply_item_statistics(self, deltas: Dict[int, Dict]) -> int:
+        """
+        Add batched item statistic deltas (see item_stats.py) to
+        item_statistics in one statement, and refresh items.correct_rate
+        and items.point_biserial from the new totals.
+
+        Args:
+            deltas: Mapping of item ID to increments of the item_statistics
+                columns; rt_buckets is a list of per-bucket counts
+
+        Returns:
+            Number of items updated
+        """
+        if not deltas:
+            return 0
+
+        ids = sorted(deltas)
+
+        def column(name):
+            return [deltas[item_id][name] for item_id in ids]
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            # Bucket arrays differ in length per item, so they travel as
+            # array literals and are added element-wise on conflict
+            self._execute_prepared(cursor, 'ets_apply_item_statistics', """
+                WITH v AS (
+                    SELECT *
+                    FROM unnest(
+                        %(item_ids)s::int[], %(responses)s::int[], %(correct)s::int[],
+                        %(scored)s::int[], %(scored_correct)s::int[],
+                        %(sum_theta)s::float8[], %(sum_theta_sq)s::float8[], %(sum_correct_theta)s::float8[],
+                        %(rt_count)s::int[], %(rt_sum)s::float8[], %(rt_sum_sq)s::float8[],
+                        %(rt_buckets)s::text[]
+                    ) AS v(item_id, responses, correct, scored, scored_correct,
+                           sum_theta, sum_theta_sq, sum_correct_theta,
+                           rt_count, rt_sum, rt_sum_sq, rt_buckets)
+                    WHERE EXISTS (SELECT 1 FROM items WHERE items.id = v.item_id)
+                ),
+                s AS (
+                    INSERT INTO item_statistics AS s (
+                        item_id, responses, correct, scored, scored_correct,
+                        sum_theta, sum_theta_sq, sum_correct_theta,
+                        rt_count, rt_sum, rt_sum_sq, rt_buckets, updated_at
+                    )
+                    SELECT item_id, responses, correct, scored, scored_correct,
+                           sum_theta, sum_theta_sq, sum_correct_theta,
+                           rt_count, rt_sum, rt_sum_sq, rt_buckets::int[], CURRENT_TIMESTAMP
+                    FROM v
+                    ON CONFLICT (item_id) DO UPDATE SET
+                        responses = s.responses + EXCLUDED.responses,
+                        correct = s.correct + EXCLUDED.correct,
+                        scored = s.scored + EXCLUDED.scored,
+                        scored_correct = s.scored_correct + EXCLUDED.scored_correct,
+                        sum_theta = s.sum_theta + EXCLUDED.sum_theta,
+                        sum_theta_sq = s.sum_theta_sq + EXCLUDED.sum_theta_sq,
+                        sum_correct_theta = s.sum_correct_theta + EXCLUDED.sum_correct_theta,
+                        rt_count = s.rt_count + EXCLUDED.rt_count,
+                        rt_sum = s.rt_sum + EXCLUDED.rt_sum,
+                        rt_sum_sq = s.rt_sum_sq + EXCLUDED.rt_sum_sq,
+                        rt_buckets = (
+                            SELECT COALESCE(array_agg(COALESCE(x, 0) + COALESCE(y, 0) ORDER BY k), '{}')
+                            FROM unnest(s.rt_buckets, EXCLUDED.rt_buckets) WITH ORDINALITY AS b(x, y, k)
+                        ),
+                        updated_at = CURRENT_TIMESTAMP
+                    RETURNING s.*
+                )
+                UPDATE items AS i
+                SET correct_rate = s.correct::float8 / NULLIF(s.responses, 0),
+                    point_biserial =
+                        (s.scored::float8 * s.sum_correct_theta - s.scored_correct::float8 * s.sum_theta)
+                        / NULLIF(sqrt(
+                            GREATEST(s.scored::float8 * s.scored_correct - s.scored_correct::float8 ^ 2, 0)
+                            * GREATEST(s.scored::float8 * s.sum_theta_sq - s.sum_theta ^ 2, 0)
+                        ), 0)
+                FROM s
+                WHERE i.id = s.item_id;
+            """, {
+                'item_ids': ids,
+                'responses': column('responses'),
+                'correct': column('correct'),
+                'scored': column('scored'),
+                'scored_correct': column('scored_correct'),
+                'sum_theta': column('sum_theta'),
+                'sum_theta_sq': column('sum_theta_sq'),
+                'sum_correct_theta': column('sum_correct_theta'),
+                'rt_count': column('rt_count'),
+                'rt_sum': column('rt_sum'),
+                'rt_sum_sq': column('rt_sum_sq'),
+                'rt_buckets': ['{' + ','.join(map(str, buckets)) + '}' for buckets in column('rt_buckets')]
+            })
+            updated = cursor.rowcount
+            conn.commit()
+            return updated
+
+        except Exception:
+            conn.rollback()
+            raise
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
+    def get_item_statistics(self, status: Optional[str] = None) -> List[Dict]:
+        """
+        Running statistics of all items (one row per item, no response scan).
+
+        Args:
+            status: Only items with this status (e.g. 'active')
+
+        Returns:
+            item_statistics rows with the item's stage, panel, form_id,
+            domain and status; items without responses have zero sums
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+        try:
+            cursor.execute("""
+                SELECT i.id AS item_id, i.stage, i.panel, i.form_id,
+                       i.domain::text AS domain, i.status::text AS status,
+                       COALESCE(s.responses, 0) AS responses,
+                       COALESCE(s.correct, 0) AS correct,
+                       COALESCE(s.scored, 0) AS scored,
+                       COALESCE(s.scored_correct, 0) AS scored_correct,
+                       COALESCE(s.sum_theta, 0) AS sum_theta,
+                       COALESCE(s.sum_theta_sq, 0) AS sum_theta_sq,
+                       COALESCE(s.sum_correct_theta, 0) AS sum_correct_theta,
+                       COALESCE(s.rt_count, 0) AS rt_count,
+                       COALESCE(s.rt_sum, 0) AS rt_sum,
+                       COALESCE(s.rt_sum_sq, 0) AS rt_sum_sq,
+                       COALESCE(s.rt_buckets, '{}') AS rt_buckets,
+                       s.updated_at
+                FROM items i
+                LEFT JOIN item_statistics s ON s.item_id = i.id
+                WHERE (%(status)s::text IS NULL OR i.status::text = %(status)s::text)
+                ORDER BY i.stage, i.panel, i.form_id, i.id;
+            """, {'status': status or None})
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
+    def reset_item_statistics(self):
+        """Delete all running item statistics (before a rebuild)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("TRUNCATE item_statistics;")
+            conn.commit()
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
+    # ===== Export Methods =====
+
+    def iter_export(
+        self,
+        table: str,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        status: Optional[str] = None,
+        batch_size: int = 5000
+    ) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """
+        Stream sessions or responses through a server-side (named) cursor.
+
+        Rows are fetched batch_size at a time, so memory stays bounded by
+        one batch whatever the size of the export. The pooled connection is
+        held until the generator is exhausted or closed.
+
+        Args:
+            table: 'sessions' or 'responses'
+            since: First session start date to include
+            until: Last session start date to include
+            status: Session status to include (e.g. 'completed')
+            batch_size: Rows per fetch
+
+        Yields:
+            (column names, batch of row tuples)
+        """
+        query, params = _export_query(table, since, until, status)
+
+        conn = self._get_connection()
+        cursor = conn.cursor(name=f'ets_export_{table}')
+        cursor.itersize = batch_size
+
+        try:
+            cursor.execute(query, params)
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [column.name for column in cursor.description], rows
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
+    def copy_export(
+        self,
+        table: str,
+        file,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        status: Optional[str] = None
+    ):
+        """
+        Write sessions or responses as CSV (with header) to a file object
+        with COPY ... TO STDOUT, which skips per-row Python conversion.
+
+        Args:
+            table: 'sessions' or 'responses'
+            file: Writable file object (text or binary, e.g. gzip.open)
+            since, until, status: Filters, as for iter_export
+        """
+        query, params = _export_query(table, since, until, status)
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            query = cursor.mogrify(query, params).decode(conn.encoding).rstrip().rstrip(';')
+            cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)", file)
+            conn.commit()
+
+        finally:
+            cursor.close()
+            self._return_connection(conn)
+
+
+# Export queries share the session filters; a NULL filter matches every row.
+# Responses are ordered by (session_id, responded_at), which the
+# idx_responses_session_responded index returns without a sort.
+_EXPORT_FILTERS = """
+    (%(since)s::date IS NULL OR s.started_at >= %(since)s::date)
+    AND (%(until)s::date IS NULL OR s.started_at < %(until)s::date + 1)
+    AND (%(status)s::text IS NULL OR s.status = %(status)s::text)
+"""
+
+EXPORT_TABLES = {
+    'sessions': """
+        SELECT s.*
+        FROM english_test_sessions s
+        WHERE """ + _EXPORT_FILTERS + """
+        ORDER BY s.id;
+    """,
+    'responses': """
+        SELECT r.*
+        FROM english_test_responses r
+        JOIN english_test_sessions s ON s.id = r.session_id
+        WHERE """ + _EXPORT_FILTERS + """
+        ORDER BY r.session_id, r.responded_at;
+    """,
+}
+
+
+def _export_query(
+    table: str,
+    since: Optional[date],
+    until: Optional[date],
+    status: Optional[str]
+) -> Tuple[str, Dict]:
+    """Query text and parameters for an export"""
+    if table not in EXPORT_TABLES:
+        raise ValueError(f"Unknown export table '{table}' (expected one of {sorted(EXPORT_TABLES)})")
+    return EXPORT_TABLES[table], {'since': since, 'until': until, 'status': status or None}
@@ -0,0 +1,144 @@
+"""
+Streaming Export of English Test Sessions and Responses
+=======================================================
+
+Turns the row batches of EnglishTestDB.iter_export into NDJSON or CSV
+and (optionally) gzip-compresses them on the fly. Everything is a
+generator: a batch is encoded, compressed and handed on before the next
+one is fetched, so an export of any size needs memory for one batch and
+the first bytes go out as soon as the first batch arrives.
+
+Used by the admin export endpoint (StreamingResponse) and by
+scripts/export_results.py.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .database import EXPORT_TABLES, EnglishTestDB
+
+
+FORMATS = ('ndjson', 'csv')
+
+MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+# Compressed output is handed on in chunks of at least this many bytes
+CHUNK_SIZE = 64 * 1024
+
+
+def _json_default(value):
+    """JSON encoding for the non-JSON types psycopg2 returns"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_ndjson(batches: Iterable[Tuple[List[str], List[tuple]]]) -> Iterator[str]:
+    """One JSON object per row, one string per batch"""
+    for columns, rows in batches:
+        yield ''.join(
+            json.dumps(dict(zip(columns, row)), default=_json_default, ensure_ascii=False) + '\n'
+            for row in rows
+        )
+
+
+def encode_csv(batches: Iterable[Tuple[List[str], List[tuple]]]) -> Iterator[str]:
+    """CSV with a header line, one string per batch"""
+    header = True
+    for columns, rows in batches:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        if header:
+            writer.writerow(columns)
+            header = False
+        for row in rows:
+            writer.writerow(
+                json.dumps(value, default=_json_default) if isinstance(value, (dict, list)) else
+                value.isoformat() if isinstance(value, (datetime, date)) else value
+                for value in row
+            )
+        yield buffer.getvalue()
+
+
+def gzip_stream(texts: Iterable[str], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Gzip-compress a stream of strings incrementally.
+
+    Output is buffered until at least chunk_size bytes are ready, so the
+    HTTP response is not split into many tiny chunks.
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    pending = []
+    pending_size = 0
+
+    for text in texts:
+        data = compressor.compress(text.encode('utf-8'))
+        if data:
+            pending.append(data)
+            pending_size += len(data)
+        if pending_size >= chunk_size:
+            yield b''.join(pending)
+            pending, pending_size = [], 0
+
+    pending.append(compressor.flush())
+    yield b''.join(pending)
+
+
+def export_stream(
+    db: EnglishTestDB,
+    table: str,
+    fmt: str = 'ndjson',
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    status: Optional[str] = None,
+    compress: bool = True,
+    batch_size: int = 5000
+) -> Iterator[bytes]:
+    """
+    Export sessions or responses as a stream of bytes.
+
+    Args:
+        db: Database layer
+        table: 'sessions' or 'responses'
+        fmt: 'ndjson' or 'csv'
+        since: First session start date to include
+        until: Last session start date to include
+        status: Session status to include
+        compress: Gzip the output
+        batch_size: Rows fetched per round trip
+
+    Returns:
+        Iterator of encoded (and compressed) chunks; nothing is queried
+        until it is consumed
+
+    Raises:
+        ValueError: Unknown table or format (raised here, before streaming
+            starts, so callers can still report it)
+    """
+    if table not in EXPORT_TABLES:
+        raise ValueError(f"Unknown export table '{table}' (expected one of {sorted(EXPORT_TABLES)})")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}' (expected one of {list(FORMATS)})")
+
+    batches = db.iter_export(table, since=since, until=until, status=status, batch_size=batch_size)
+    texts = encode_ndjson(batches) if fmt == 'ndjson' else encode_csv(batches)
+
+    if compress:
+        return gzip_stream(texts)
+    return (text.encode('utf-8') for text in texts)
+
+
+def export_filename(table: str, fmt: str, compress: bool = True) -> str:
+    """Download name, e.g. english_test_responses_20250301.ndjson.gz"""
+    name = f"english_test_{table}_{datetime.now():%Y%m%d}.{fmt}"
+    return name + '.gz' if compress else name
@@ -0,0 +1,167 @@
+"""
+Write-Behind Exposure Counter for English Adaptive Testing
+==========================================================
+
+Every administered item used to cost one UPDATE on the items table inside
+the request, and popular items turned that row into a lock hotspot. The
+aggregator instead counts administrations in memory and a background
+thread flushes them every flush_interval seconds with a single batched
+UPDATE (EnglishTestDB.apply_exposure_increments).
+
+exposure_count / exposure_rate are monitoring data; selection uses the
+precomputed Sympson-Hetter parameters, so a few seconds of lag is harmless.
+Counts that fail to flush are merged back and retried on the next tick.
+
+The rate denominator (started sessions) is counted here, once every
+session_count_flushes flushes and before each full rate refresh, and passed
+to the UPDATE - not counted per statement, and not maintained on the
+session INSERT path, where a shared counter row would serialize every
+session start.
+"""
+
+import atexit
+import threading
+import time
+from typing import Dict, Optional
+
+from .database import EnglishTestDB
+
+
+class ExposureAggregator:
+    """
+    In-memory exposure counts with periodic batched flushes.
+
+    Attributes:
+        flush_interval (float): Seconds between flushes
+        rate_refresh_interval (float): Seconds between full exposure_rate
+            refreshes (0 disables)
+        session_count_flushes (int): Flushes between recounts of started
+            sessions (the exposure_rate denominator)
+    """
+
+    def __init__(
+        self,
+        db: EnglishTestDB,
+        flush_interval: float = 5.0,
+        rate_refresh_interval: float = 60.0,
+        session_count_flushes: int = 12
+    ):
+        self.db = db
+        self.flush_interval = flush_interval
+        self.rate_refresh_interval = rate_refresh_interval
+        self.session_count_flushes = max(1, session_count_flushes)
+
+        self._pending: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_rate_refresh = time.monotonic()
+
+        # Cached started-session count and uses since it was read
+        self._sessions: Optional[int] = None
+        self._sessions_age = 0
+
+        self.recorded = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.failures = 0
+
+    def record(self, item_id: int, count: int = 1):
+        """Count an administration; written to the database on the next flush"""
+        with self._lock:
+            self._pending[item_id] = self._pending.get(item_id, 0) + count
+            self.recorded += count
+
+        if self._thread is None:
+            self.start()
+
+    def pending(self) -> int:
+        """Administrations not yet written"""
+        with self._lock:
+            return sum(self._pending.values())
+
+    def flush(self) -> int:
+        """
+        Write pending counts in one statement.
+
+        Returns:
+            Number of items updated
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+
+            if not batch:
+                return 0
+
+            try:
+                updated = self.db.apply_exposure_increments(batch, self._session_count())
+            except Exception as e:
+                # Keep the counts for the next attempt
+                with self._lock:
+                    for item_id, count in batch.items():
+                        self._pending[item_id] = self._pending.get(item_id, 0) + count
+                    self.failures += 1
+                print(f"⚠️ Exposure flush failed ({len(batch)} items pending): {e}")
+                return 0
+
+            self.flushes += 1
+            self.flushed += sum(batch.values())
+            return updated
+
+    def start(self):
+        """Start the background flush thread (idempotent)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name='exposure-flush',
+                daemon=True
+            )
+            self._thread.start()
+
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Stop the flush thread and write whatever is still pending"""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+            if (
+                self.rate_refresh_interval
+                and time.monotonic() - self._last_rate_refresh >= self.rate_refresh_interval
+            ):
+                self._last_rate_refresh = time.monotonic()
+                try:
+                    with self._flush_lock:
+                        self.db.refresh_exposure_rates(self._session_count(refresh=True))
+                except Exception as e:
+                    print(f"⚠️ Exposure rate refresh failed: {e}")
+
+    def _session_count(self, refresh: bool = False) -> int:
+        """Started sessions, recounted every session_count_flushes uses (call under _flush_lock)"""
+        if refresh or self._sessions is None or self._sessions_age >= self.session_count_flushes:
+            self._sessions = self.db.count_sessions()
+            self._sessions_age = 0
+        self._sessions_age += 1
+        return self._sessions
+
+    def stats(self) -> Dict:
+        """Counters for monitoring"""
+        return {
+            'pending': self.pending(),
+            'recorded': self.recorded,
+            'flushed': self.flushed,
+            'flushes': self.flushes,
+            'failures': self.failures,
+            'sessions': self._sessions,
+            'flush_interval': self.flush_interval
+        }
@@ -18,6 +18,107 @@ from scipy.stats import norm
 from typing import List, Dict, Tuple, Optional
 
 
+class PosteriorState:
+    """
+    Running log posterior for one examinee on the engine's quadrature grid.
+
+    Each answered item multiplies its likelihood into the posterior, so an
+    update costs O(quadrature_points) no matter how many items came before.
+
+    Attributes:
+        log_posterior (np.ndarray): Unnormalized log posterior (including
+            log quadrature weights) at each quadrature point
+        item_ids (List[int]): IDs of the items folded into the posterior, in order
+        responses (List[bool]): Correctness of each folded-in response, in order
+    """
+
+    def __init__(
+        self,
+        log_posterior: np.ndarray,
+        item_ids: Optional[List[int]] = None,
+        responses: Optional[List[bool]] = None
+    ):
+        self.log_posterior = np.array(log_posterior, dtype=float)
+        self.item_ids = list(item_ids) if item_ids else []
+        self.responses = [bool(r) for r in responses] if responses else []
+
+    @property
+    def n_responses(self) -> int:
+        """Number of responses folded into the posterior"""
+        return len(self.item_ids)
+
+    @property
+    def pattern(self) -> Tuple[Tuple[int, bool], ...]:
+        """Response pattern as ((item_id, is_correct), ...)"""
+        return tuple(zip(self.item_ids, self.responses))
+
+    def to_dict(self) -> Dict:
+        """Serialize to plain lists (JSON-safe)"""
+        return {
+            'log_posterior': self.log_posterior.tolist(),
+            'item_ids': list(self.item_ids),
+            'responses': list(self.responses)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'PosteriorState':
+        """Restore a state produced by to_dict()"""
+        return cls(data['log_posterior'], data.get('item_ids'), data.get('responses'))
+
+
+class StoppingRule:
+    """
+    Termination policy for a variable-length test.
+
+    A session stops at max_items, or once it has at least min_items
+    responses and either its SE is at or below target_se or its
+    proficiency band is decided (posterior mass inside the band
+    containing θ reaches classification_confidence). Set target_se or
+    classification_confidence to None to disable that criterion;
+    min_items == max_items gives a fixed-length test.
+
+    Attributes:
+        target_se (float): Precision at which the test may stop
+        min_items (int): Responses required before any early stop
+        max_items (int): Hard cap on test length
+        classification_confidence (float): Posterior probability of the
+            current band at which the classification counts as stable
+        cut_scores (Tuple[float, ...]): θ boundaries of the bands
+    """
+
+    def __init__(
+        self,
+        target_se: Optional[float] = 0.30,
+        min_items: int = 24,
+        max_items: int = 40,
+        classification_confidence: Optional[float] = 0.95,
+        cut_scores: Tuple[float, ...] = (-2.0, -1.0, 0.0, 1.0)
+    ):
+        if min_items > max_items:
+            raise ValueError(f"min_items ({min_items}) must not exceed max_items ({max_items})")
+
+        self.target_se = target_se
+        self.min_items = min_items
+        self.max_items = max_items
+        self.classification_confidence = classification_confidence
+        self.cut_scores = tuple(sorted(cut_scores))
+
+    @classmethod
+    def fixed_length(cls, n_items: int) -> 'StoppingRule':
+        """Rule that always administers exactly n_items"""
+        return cls(target_se=None, min_items=n_items, max_items=n_items, classification_confidence=None)
+
+    def to_dict(self) -> Dict:
+        """Serialize the policy (for reports and health checks)"""
+        return {
+            'target_se': self.target_se,
+            'min_items': self.min_items,
+            'max_items': self.max_items,
+            'classification_confidence': self.classification_confidence,
+            'cut_scores': list(self.cut_scores)
+        }
+
+
 class IRTEngine:
     """
     IRT 3-Parameter Logistic Model with EAP estimation.
@@ -28,39 +129,111 @@ class IRTEngine:
         quadrature_points (int): Number of quadrature points for integration
         theta_min (float): Minimum θ value for integration range
         theta_max (float): Maximum θ value for integration range
+        quadrature (str): Quadrature scheme (see QUADRATURE_SCHEMES)
     """
 
+    # Supported quadrature schemes:
+    # - 'trapezoid': evenly spaced grid over [theta_min, theta_max], trapezoid weights
+    # - 'rectangular': evenly spaced grid over [theta_min, theta_max], equal weights
+    # - 'gauss_hermite': Gauss-Hermite nodes scaled to the N(prior_mean, prior_sd) prior
+    # - 'adaptive': Gauss-Hermite nodes re-centered on the current posterior
+    #   (eap_estimate only; incremental and batch scoring use the prior-centered nodes)
+    QUADRATURE_SCHEMES = ('trapezoid', 'rectangular', 'gauss_hermite', 'adaptive')
+
+    # Schemes that score identically through update_posterior/posterior_estimate
+    # and eap_estimate (a live session and its final score must agree)
+    INCREMENTAL_SCHEMES = ('trapezoid', 'rectangular', 'gauss_hermite')
+
+    # Re-centering passes for the adaptive scheme
+    ADAPTIVE_PASSES = 2
+
+    # numpy's hermgauss underflows to zero/NaN weights above ~370 nodes;
+    # Gauss-Hermite never needs anywhere near this many
+    MAX_GAUSS_HERMITE_POINTS = 300
+
     def __init__(
         self,
         prior_mean: float = 0.0,
         prior_sd: float = 1.0,
         quadrature_points: int = 41,
         theta_min: float = -4.0,
-        theta_max: float = 4.0
+        theta_max: float = 4.0,
+        quadrature: str = 'trapezoid'
     ):
+        if quadrature not in self.QUADRATURE_SCHEMES:
+            raise ValueError(
+                f"Unknown quadrature scheme '{quadrature}' (expected one of {', '.join(self.QUADRATURE_SCHEMES)})"
+            )
+
+        if quadrature in ('gauss_hermite', 'adaptive') and not 1 <= quadrature_points <= self.MAX_GAUSS_HERMITE_POINTS:
+            raise ValueError(
+                f"Gauss-Hermite quadrature supports 1-{self.MAX_GAUSS_HERMITE_POINTS} points "
+                f"(got {quadrature_points})"
+            )
+
         self.prior_mean = prior_mean
         self.prior_sd = prior_sd
         self.quadrature_points = quadrature_points
         self.theta_min = theta_min
         self.theta_max = theta_max
+        self.quadrature = quadrature
 
         # Precompute quadrature points and weights for efficiency
+        # (Gauss-Hermite nodes only for the schemes that use them)
+        self._gh_nodes: Optional[np.ndarray] = None
+        self._gh_log_weights: Optional[np.ndarray] = None
+        if quadrature in ('gauss_hermite', 'adaptive'):
+            self._gh_nodes, gh_weights = np.polynomial.hermite.hermgauss(quadrature_points)
+            self._gh_log_weights = np.log(gh_weights) + self._gh_nodes ** 2
         self.quad_points, self.quad_weights = self._setup_quadrature()
+        self._default_log_prior = self._compute_log_prior(prior_mean, prior_sd)
+        self._default_log_prior.flags.writeable = False
 
     def _setup_quadrature(self) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Setup Gauss-Hermite quadrature points and weights.
+        Setup quadrature points and weights for the configured scheme.
+
+        Weights are always with respect to dθ, so the prior density is
+        applied separately (see log_prior) for every scheme.
 
         Returns:
             Tuple of (quadrature_points, weights)
         """
+        if self.quadrature in ('gauss_hermite', 'adaptive'):
+            return self.gauss_hermite_grid(self.prior_mean, self.prior_sd)
+
         # Create evenly spaced quadrature points
         points = np.linspace(self.theta_min, self.theta_max, self.quadrature_points)
-
-        # Compute weights using trapezoidal rule
         weights = np.ones(self.quadrature_points)
-        weights[0] = weights[-1] = 0.5
-        weights *= (self.theta_max - self.theta_min) / (self.quadrature_points - 1)
+
+        if self.quadrature == 'trapezoid':
+            # Compute weights using trapezoidal rule
+            weights[0] = weights[-1] = 0.5
+            weights *= (self.theta_max - self.theta_min) / (self.quadrature_points - 1)
+        else:
+            weights *= (self.theta_max - self.theta_min) / self.quadrature_points
+
+        return points, weights
+
+    def gauss_hermite_grid(self, center: float, scale: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gauss-Hermite nodes for a normal-shaped integrand centered at
+        `center` with spread `scale`.
+
+        ∫ f(θ) dθ ≈ ∑ w_i × exp(x_i²) × √2·scale × f(center + √2·scale·x_i)
+
+        Args:
+            center: Location the nodes are centered on
+            scale: Spread of the nodes (SD of the target density)
+
+        Returns:
+            Tuple of (points, weights with respect to dθ)
+        """
+        if self._gh_nodes is None:
+            raise ValueError(f"Gauss-Hermite nodes are not available with '{self.quadrature}' quadrature")
+
+        points = center + np.sqrt(2.0) * scale * self._gh_nodes
+        weights = np.sqrt(2.0) * scale * np.exp(self._gh_log_weights)
 
         return points, weights
 
@@ -125,6 +298,161 @@ class IRTEngine:
 
         return likelihood_value
 
+    def item_parameter_arrays(
+        self,
+        items: List[Dict[str, float]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Convert item parameter dicts to contiguous (a, b, c) arrays.
+
+        Args:
+            items: List of item parameters {'a': float, 'b': float, 'c': float}
+
+        Returns:
+            Tuple of (a, b, c) float arrays of shape (n_items,)
+        """
+        n_items = len(items)
+        a = np.fromiter((item['a'] for item in items), dtype=float, count=n_items)
+        b = np.fromiter((item['b'] for item in items), dtype=float, count=n_items)
+        c = np.fromiter((item['c'] for item in items), dtype=float, count=n_items)
+        return a, b, c
+
+    def exposure_parameter_array(self, items: List[Dict]) -> np.ndarray:
+        """
+        Sympson-Hetter K of each item as a float array.
+
+        A missing K means no exposure control (1.0); K = 0.0 is kept
+        (never administer), so this checks for None rather than falsiness.
+        """
+        return np.fromiter(
+            (1.0 if item.get('sympson_hetter_k') is None else item['sympson_hetter_k'] for item in items),
+            dtype=float,
+            count=len(items)
+        )
+
+    def probability_matrix(
+        self,
+        a: np.ndarray,
+        b: np.ndarray,
+        c: np.ndarray,
+        theta: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Calculate 3PL probabilities for every item at every θ in one pass.
+
+        Args:
+            a: Discrimination parameters, shape (n_items,)
+            b: Difficulty parameters, shape (n_items,)
+            c: Guessing parameters, shape (n_items,)
+            theta: θ grid (default: quadrature points)
+
+        Returns:
+            Probability matrix of shape (n_items, n_theta), clipped to
+            [1e-10, 1 - 1e-10] so log-probabilities stay finite
+        """
+        if theta is None:
+            theta = self.quad_points
+
+        a = np.asarray(a, dtype=float)[:, np.newaxis]
+        b = np.asarray(b, dtype=float)[:, np.newaxis]
+        c = np.asarray(c, dtype=float)[:, np.newaxis]
+
+        exponent = np.clip(-a * (theta[np.newaxis, :] - b), -20, 20)
+        prob = c + (1 - c) / (1 + np.exp(exponent))
+
+        return np.clip(prob, 1e-10, 1 - 1e-10)
+
+    def log_likelihood(
+        self,
+        responses: List[bool],
+        items: List[Dict[str, float]],
+        theta: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Calculate log L(θ | responses) at every quadrature point.
+
+        log L(θ) = ∑ [u × log P(θ) + (1-u) × log(1-P(θ))]
+
+        Summing in log space avoids the underflow the product form in
+        likelihood() hits on long sessions.
+
+        Args:
+            responses: List of boolean responses
+            items: List of item parameters
+            theta: θ grid (default: quadrature points)
+
+        Returns:
+            Log-likelihood array of shape (quadrature_points,)
+        """
+        if theta is None:
+            theta = self.quad_points
+
+        if not items:
+            return np.zeros_like(theta)
+
+        prob = self.probability_matrix(*self.item_parameter_arrays(items), theta)
+        correct = np.asarray(responses, dtype=bool)[:, np.newaxis]
+
+        return np.where(correct, np.log(prob), np.log1p(-prob)).sum(axis=0)
+
+    def log_prior(
+        self,
+        prior_mean: Optional[float] = None,
+        prior_sd: Optional[float] = None
+    ) -> np.ndarray:
+        """
+        Log prior density plus log quadrature weights at each quadrature point.
+
+        Args:
+            prior_mean: Override default prior mean
+            prior_sd: Override default prior standard deviation
+
+        Returns:
+            Array of shape (quadrature_points,)
+        """
+        if prior_mean is None and prior_sd is None:
+            return self._default_log_prior
+
+        if prior_mean is None:
+            prior_mean = self.prior_mean
+        if prior_sd is None:
+            prior_sd = self.prior_sd
+
+        return self._compute_log_prior(prior_mean, prior_sd)
+
+    def _compute_log_prior(self, prior_mean: float, prior_sd: float) -> np.ndarray:
+        """Normal log prior plus log quadrature weights."""
+        return norm.logpdf(self.quad_points, prior_mean, prior_sd) + np.log(self.quad_weights)
+
+    def posterior_summary(
+        self,
+        log_posterior: np.ndarray,
+        points: Optional[np.ndarray] = None
+    ) -> Tuple[float, float]:
+        """
+        Compute EAP mean and SE from an unnormalized log posterior.
+
+        Args:
+            log_posterior: Log posterior (including quadrature weights) at
+                each quadrature point
+            points: θ values log_posterior is evaluated at
+                (default: quadrature points)
+
+        Returns:
+            Tuple of (theta_eap, standard_error)
+        """
+        if points is None:
+            points = self.quad_points
+
+        # Subtract the max before exponentiating so the largest weight is 1
+        weights = np.exp(log_posterior - np.max(log_posterior))
+        weights /= weights.sum()
+
+        theta_eap = float(np.dot(points, weights))
+        variance = float(np.dot((points - theta_eap) ** 2, weights))
+
+        return theta_eap, float(np.sqrt(variance))
+
     def eap_estimate(
         self,
         responses: List[bool],
@@ -138,6 +466,10 @@ class IRTEngine:
         θ_EAP = ∫ θ × L(θ|R) × π(θ) dθ / ∫ L(θ|R) × π(θ) dθ
         SE = sqrt(∫ (θ - θ_EAP)² × L(θ|R) × π(θ) dθ / ∫ L(θ|R) × π(θ) dθ)
 
+        The posterior is evaluated in log space from a single
+        item × quadrature probability matrix, so cost is one NumPy pass
+        regardless of test length and long sessions cannot underflow.
+
         Args:
             responses: List of boolean responses
             items: List of item parameters
@@ -147,43 +479,242 @@ class IRTEngine:
         Returns:
             Tuple of (theta_eap, standard_error)
         """
-        if prior_mean is None:
-            prior_mean = self.prior_mean
-        if prior_sd is None:
-            prior_sd = self.prior_sd
+        log_posterior = self.log_likelihood(responses, items) + self.log_prior(prior_mean, prior_sd)
+        theta_eap, se = self.posterior_summary(log_posterior)
+
+        if self.quadrature == 'adaptive' and items:
+            # Re-center the nodes on the posterior and re-integrate
+            if prior_mean is None:
+                prior_mean = self.prior_mean
+            if prior_sd is None:
+                prior_sd = self.prior_sd
+
+            for _ in range(self.ADAPTIVE_PASSES):
+                points, weights = self.gauss_hermite_grid(theta_eap, max(se, 1e-3))
+                # Normal log density up to a constant (cancels on normalization)
+                log_posterior = (
+                    self.log_likelihood(responses, items, points)
+                    - 0.5 * ((points - prior_mean) / prior_sd) ** 2
+                    + np.log(weights)
+                )
+                theta_eap, se = self.posterior_summary(log_posterior, points)
 
-        # Use precomputed quadrature points
-        likelihoods = np.array([
-            self.likelihood(theta, responses, items)
-            for theta in self.quad_points
-        ])
+        return theta_eap, se
 
-        # Prior probabilities
-        priors = norm.pdf(self.quad_points, prior_mean, prior_sd)
+    def eap_estimate_batch(
+        self,
+        responses_matrix: np.ndarray,
+        mask: Optional[np.ndarray],
+        item_params,
+        prior_mean: Optional[float] = None,
+        prior_sd: Optional[float] = None,
+        chunk_size: int = 10000
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        EAP estimates for many examinees in one vectorized pass.
 
-        # Posterior = Likelihood × Prior
-        posteriors = likelihoods * priors
+        Log-likelihoods for a chunk of examinees are two matrix products,
+        (N × J) @ (J × Q), against the item log-probability tables, so the
+        whole chunk is scored without a Python loop. Examinees are
+        processed chunk_size at a time to keep memory at O(chunk_size × Q).
 
-        # Normalize posterior
-        posterior_sum = np.sum(posteriors * self.quad_weights)
+        Args:
+            responses_matrix: Scored responses, shape (N, J); 1/True = correct.
+                Entries where mask is False are ignored (may be NaN)
+            mask: Answered-item mask, shape (N, J); None means all answered
+            item_params: List of J item parameter dicts, or an (a, b, c)
+                tuple of arrays
+            prior_mean: Override default prior mean
+            prior_sd: Override default prior standard deviation
+            chunk_size: Examinees scored per chunk
 
-        if posterior_sum < 1e-100:
-            # Fallback to prior mean if all likelihoods are zero
-            return prior_mean, prior_sd
+        Returns:
+            Tuple of (theta_eap, standard_error) arrays, shape (N,)
+        """
+        if isinstance(item_params, tuple):
+            a, b, c = item_params
+        else:
+            a, b, c = self.item_parameter_arrays(item_params)
+
+        responses_matrix = np.asarray(responses_matrix, dtype=float)
+        if mask is None:
+            mask = np.ones(responses_matrix.shape, dtype=bool)
+        else:
+            mask = np.asarray(mask, dtype=bool)
 
-        # EAP estimate: E[θ | responses]
-        theta_eap = np.sum(
-            self.quad_points * posteriors * self.quad_weights
-        ) / posterior_sum
+        prob = self.probability_matrix(a, b, c)
+        log_p = np.log(prob)
+        log_q = np.log1p(-prob)
+        log_prior = self.log_prior(prior_mean, prior_sd)
 
-        # Standard error: sqrt(Var[θ | responses])
-        variance = np.sum(
-            ((self.quad_points - theta_eap) ** 2) * posteriors * self.quad_weights
-        ) / posterior_sum
+        n_examinees = responses_matrix.shape[0]
+        thetas = np.empty(n_examinees)
+        ses = np.empty(n_examinees)
 
-        se = np.sqrt(variance)
+        for start in range(0, n_examinees, chunk_size):
+            stop = min(start + chunk_size, n_examinees)
+            chunk_mask = mask[start:stop]
+            correct = np.where(chunk_mask, responses_matrix[start:stop], 0.0)
+            incorrect = chunk_mask - correct
 
-        return theta_eap, se
+            log_posterior = correct @ log_p + incorrect @ log_q + log_prior
+            log_posterior -= log_posterior.max(axis=1, keepdims=True)
+
+            weights = np.exp(log_posterior)
+            weights /= weights.sum(axis=1, keepdims=True)
+
+            theta = weights @ self.quad_points
+            variance = np.einsum('nq,nq->n', weights, (self.quad_points[np.newaxis, :] - theta[:, np.newaxis]) ** 2)
+
+            thetas[start:stop] = theta
+            ses[start:stop] = np.sqrt(variance)
+
+        return thetas, ses
+
+    def new_posterior(
+        self,
+        prior_mean: Optional[float] = None,
+        prior_sd: Optional[float] = None
+    ) -> PosteriorState:
+        """
+        Create a posterior state holding only the prior.
+
+        Args:
+            prior_mean: Override default prior mean
+            prior_sd: Override default prior standard deviation
+
+        Returns:
+            Fresh PosteriorState
+        """
+        return PosteriorState(self.log_prior(prior_mean, prior_sd))
+
+    def posterior_from_responses(
+        self,
+        responses: List[bool],
+        items: List[Dict[str, float]],
+        item_ids: Optional[List[int]] = None
+    ) -> PosteriorState:
+        """
+        Build a posterior state from a full response history in one pass.
+
+        Used to seed or rebuild a session's state from the database.
+
+        Args:
+            responses: List of boolean responses
+            items: List of item parameters
+            item_ids: IDs of the answered items, in response order
+
+        Returns:
+            PosteriorState with all responses folded in
+        """
+        state = PosteriorState(self.log_prior() + self.log_likelihood(responses, items), item_ids, responses)
+        state.log_posterior -= state.log_posterior.max()
+        return state
+
+    def update_posterior(
+        self,
+        state: PosteriorState,
+        response: bool,
+        item: Dict[str, float]
+    ) -> PosteriorState:
+        """
+        Fold one new response into a posterior state in place.
+
+        Args:
+            state: Posterior state to update
+            response: Whether the item was answered correctly
+            item: Item parameters {'a', 'b', 'c'} (and 'id' if available)
+
+        Returns:
+            The updated state
+        """
+        state.log_posterior += self.log_likelihood([response], [item])
+
+        # Re-anchor so values stay near zero over long sessions
+        state.log_posterior -= state.log_posterior.max()
+        state.item_ids.append(item.get('id'))
+        state.responses.append(bool(response))
+
+        return state
+
+    def posterior_estimate(self, state: PosteriorState) -> Tuple[float, float]:
+        """
+        EAP estimate and SE for a posterior state.
+
+        Args:
+            state: Posterior state
+
+        Returns:
+            Tuple of (theta_eap, standard_error)
+        """
+        return self.posterior_summary(state.log_posterior)
+
+    def classification_probability(
+        self,
+        log_posterior: np.ndarray,
+        cut_scores: Tuple[float, ...],
+        theta: Optional[float] = None
+    ) -> float:
+        """
+        Posterior probability that θ lies in the band containing the estimate.
+
+        Args:
+            log_posterior: Log posterior (including quadrature weights) at
+                each quadrature point
+            cut_scores: Sorted θ band boundaries
+            theta: Point estimate locating the band (default: EAP)
+
+        Returns:
+            Probability mass of the estimate's band
+        """
+        weights = np.exp(log_posterior - np.max(log_posterior))
+        weights /= weights.sum()
+
+        if theta is None:
+            theta = float(np.dot(self.quad_points, weights))
+
+        cuts = np.asarray(cut_scores, dtype=float)
+        band = np.searchsorted(cuts, theta, side='right')
+        in_band = np.searchsorted(cuts, self.quad_points, side='right') == band
+
+        return float(weights[in_band].sum())
+
+    def stopping_reason(
+        self,
+        state: PosteriorState,
+        theta: float,
+        se: float,
+        rule: StoppingRule
+    ) -> Optional[str]:
+        """
+        Evaluate a stopping rule after the latest response.
+
+        Args:
+            state: Posterior state including the latest response
+            theta: Current EAP estimate
+            se: Current standard error
+            rule: Termination policy
+
+        Returns:
+            'max_items', 'target_se' or 'classification' if the test should
+            stop, otherwise None
+        """
+        n_items = state.n_responses
+
+        if n_items >= rule.max_items:
+            return 'max_items'
+        if n_items < rule.min_items:
+            return None
+
+        if rule.target_se is not None and se <= rule.target_se:
+            return 'target_se'
+
+        if rule.classification_confidence is not None:
+            confidence = self.classification_probability(state.log_posterior, rule.cut_scores, theta)
+            if confidence >= rule.classification_confidence:
+                return 'classification'
+
+        return None
 
     def fisher_information(
         self,
@@ -204,24 +735,90 @@ class IRTEngine:
         Returns:
             Fisher information value
         """
-        total_info = 0.0
+        if not items:
+            return 0.0
 
-        for item in items:
-            a, b, c = item['a'], item['b'], item['c']
-            p = self.three_pl_probability(theta, a, b, c)
+        info = self.information_matrix(*self.item_parameter_arrays(items), np.array([theta], dtype=float))
+        return float(info.sum())
 
-            # Prevent division by zero
-            p = np.clip(p, c + 1e-10, 1 - 1e-10)
+    def information_matrix(
+        self,
+        a: np.ndarray,
+        b: np.ndarray,
+        c: np.ndarray,
+        theta: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate per-item Fisher information at every θ in one pass.
 
-            # Derivative of P(θ)
-            p_prime = a * (1 - c) * np.exp(-a * (theta - b)) / \
-                      ((1 + np.exp(-a * (theta - b))) ** 2)
+        Args:
+            a: Discrimination parameters, shape (n_items,)
+            b: Difficulty parameters, shape (n_items,)
+            c: Guessing parameters, shape (n_items,)
+            theta: θ values, shape (n_theta,)
+
+        Returns:
+            Information matrix of shape (n_items, n_theta)
+        """
+        a = np.asarray(a, dtype=float)[:, np.newaxis]
+        b = np.asarray(b, dtype=float)[:, np.newaxis]
+        c = np.asarray(c, dtype=float)[:, np.newaxis]
+        theta = np.asarray(theta, dtype=float)[np.newaxis, :]
 
-            # Fisher information for this item
-            item_info = (p_prime ** 2) / (p * (1 - p))
-            total_info += item_info
+        exp_term = np.exp(np.clip(-a * (theta - b), -20, 20))
+        p = c + (1 - c) / (1 + exp_term)
 
-        return total_info
+        # Prevent division by zero
+        p = np.clip(p, c + 1e-10, 1 - 1e-10)
+
+        # Derivative of P(θ)
+        p_prime = a * (1 - c) * exp_term / ((1 + exp_term) ** 2)
+
+        return (p_prime ** 2) / (p * (1 - p))
+
+    def sympson_hetter_choice(
+        self,
+        info: np.ndarray,
+        exposure_k: Optional[np.ndarray] = None,
+        max_candidates: int = 10,
+        exposure_control: bool = True
+    ) -> int:
+        """
+        Pick an index by maximum information with Sympson-Hetter exposure
+        control (Sympson & Hetter, 1985).
+
+        Candidates are visited in descending information order; candidate i
+        is administered with probability K_i, otherwise the next one is
+        tried. K_i are precomputed by simulation so that no item's
+        administration rate exceeds the target (see
+        simulation.sympson_hetter_parameters). If every visited candidate
+        is rejected, the most informative one is used.
+
+        Args:
+            info: Information of each candidate at the current θ
+            exposure_k: Sympson-Hetter parameter of each candidate
+                (None: all 1.0, i.e. pure maximum information)
+            max_candidates: Most informative candidates visited
+            exposure_control: If False, return the most informative index
+
+        Returns:
+            Index into info of the selected candidate
+        """
+        if not exposure_control or exposure_k is None:
+            return int(np.argmax(info))
+
+        n_candidates = min(max_candidates, len(info))
+        if n_candidates < len(info):
+            top_idx = np.argpartition(info, -n_candidates)[-n_candidates:]
+        else:
+            top_idx = np.arange(len(info))
+        top_idx = top_idx[np.argsort(-info[top_idx])]
+
+        accepted = np.random.random(n_candidates) < np.asarray(exposure_k, dtype=float)[top_idx]
+        if accepted.any():
+            return int(top_idx[np.argmax(accepted)])
+
+        return int(top_idx[0])
 
     def select_next_item(
         self,
@@ -233,15 +830,16 @@ class IRTEngine:
         """
         Select next item using Maximum Fisher Information criterion.
 
-        Implements "randomesque" exposure control (Kingsbury & Zara, 1989):
-        - Select top 5 items by information
-        - Randomly choose from top 5 weighted by (1 / exposure_count)
+        Implements Sympson-Hetter exposure control: each item's
+        'sympson_hetter_k' (default 1.0) is its probability of being
+        administered once selected.
 
         Args:
             theta_current: Current ability estimate
             candidate_items: List of candidate items with parameters and metadata
             exposure_control: Enable exposure control
-            max_exposure_rate: Maximum exposure rate threshold
+            max_exposure_rate: Target maximum exposure rate (used when the
+                Sympson-Hetter parameters are computed, not at selection time)
 
         Returns:
             Selected item or None if no candidates available
@@ -249,40 +847,16 @@ class IRTEngine:
         if not candidate_items:
             return None
 
-        # Calculate information for all items
-        item_info = []
-        for item in candidate_items:
-            info = self.fisher_information(theta_current, [item])
-            item_info.append((item, info))
-
-        # Sort by information (descending)
-        item_info.sort(key=lambda x: x[1], reverse=True)
-
-        if not exposure_control:
-            # Return item with maximum information
-            return item_info[0][0]
-
-        # Randomesque selection from top 5
-        top_k = min(5, len(item_info))
-        top_items = item_info[:top_k]
-
-        # Calculate selection weights (inverse of exposure count)
-        weights = []
-        for item, _ in top_items:
-            exposure_count = item.get('exposure_count', 0)
-            # Add 1 to avoid division by zero
-            weight = 1.0 / (exposure_count + 1)
-            weights.append(weight)
-
-        # Normalize weights
-        weights = np.array(weights)
-        weights /= weights.sum()
+        # Calculate information for all items in one pass
+        info = self.information_matrix(
+            *self.item_parameter_arrays(candidate_items),
+            np.array([theta_current], dtype=float)
+        )[:, 0]
 
-        # Random selection
-        selected_idx = np.random.choice(top_k, p=weights)
-        selected_item = top_items[selected_idx][0]
+        exposure_k = self.exposure_parameter_array(candidate_items)
 
-        return selected_item
+        selected_idx = self.sympson_hetter_choice(info, exposure_k, exposure_control=exposure_control)
+        return candidate_items[selected_idx]
 
     def ability_to_proficiency_level(
         self,
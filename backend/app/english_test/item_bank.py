@@ -0,0 +1,196 @@
+"""
+Array-backed Item Bank for English Adaptive Testing
+===================================================
+
+Holds item parameters in contiguous NumPy arrays grouped by
+(stage, panel, form_id) and precomputes each item's Fisher information
+on a fine θ grid. Item selection then reduces to a masked linear
+interpolation plus argpartition, independent of how the bank grows.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .irt_engine import IRTEngine
+
+
+GroupKey = Tuple[int, str, int]
+
+
+class ItemBank:
+    """
+    Contiguous item parameter store with precomputed information curves.
+
+    Attributes:
+        items (List[Dict]): Item dictionaries, aligned with the arrays
+        ids (np.ndarray): Item IDs, shape (n_items,)
+        a, b, c (np.ndarray): 3PL parameters, shape (n_items,)
+        exposure_counts (np.ndarray): Exposure counts, shape (n_items,)
+        exposure_k (np.ndarray): Sympson-Hetter parameters, shape (n_items,)
+        theta_grid (np.ndarray): θ grid the information curves are sampled on
+        info_table (np.ndarray): Fisher information, shape (n_grid, n_items)
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Dict],
+        irt_engine: Optional[IRTEngine] = None,
+        theta_min: float = -4.0,
+        theta_max: float = 4.0,
+        grid_step: float = 0.05
+    ):
+        self.irt = irt_engine or IRTEngine()
+        self.items = list(items)
+
+        n_items = len(self.items)
+        self.ids = np.fromiter((item['id'] for item in self.items), dtype=np.int64, count=n_items)
+        self.a, self.b, self.c = self.irt.item_parameter_arrays(self.items)
+        self.exposure_counts = np.fromiter(
+            (item.get('exposure_count') or 0 for item in self.items),
+            dtype=float,
+            count=n_items
+        )
+        self.exposure_k = self.irt.exposure_parameter_array(self.items)
+        self._index_by_id = {int(item_id): idx for idx, item_id in enumerate(self.ids)}
+
+        # Group indices by (stage, panel, form_id)
+        groups: Dict[GroupKey, List[int]] = {}
+        for idx, item in enumerate(self.items):
+            key = (int(item['stage']), item['panel'], int(item.get('form_id') or 1))
+            groups.setdefault(key, []).append(idx)
+        self.groups: Dict[GroupKey, np.ndarray] = {
+            key: np.array(indices, dtype=np.int64) for key, indices in groups.items()
+        }
+
+        # Each item's position within its group, for O(len(excluded)) masking
+        self._group_position = np.zeros(n_items, dtype=np.int64)
+        for indices in self.groups.values():
+            self._group_position[indices] = np.arange(len(indices))
+
+        # Precompute information curves; rows are θ so a row slice is contiguous
+        self.theta_min = theta_min
+        self.grid_step = grid_step
+        n_grid = int(round((theta_max - theta_min) / grid_step)) + 1
+        self.theta_grid = theta_min + grid_step * np.arange(n_grid)
+        self.info_table = np.ascontiguousarray(
+            self.irt.information_matrix(self.a, self.b, self.c, self.theta_grid).T
+        )
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._index_by_id
+
+    def get(self, item_id: int) -> Optional[Dict]:
+        """Get item dictionary by ID"""
+        idx = self._index_by_id.get(item_id)
+        return self.items[idx] if idx is not None else None
+
+    def group_indices(self, stage: int, panel: str, form_id: int = 1) -> np.ndarray:
+        """Array indices of the items in one (stage, panel, form_id) module"""
+        return self.groups.get((stage, panel, form_id), np.empty(0, dtype=np.int64))
+
+    def information_at(self, theta: float, indices: np.ndarray) -> np.ndarray:
+        """
+        Interpolate Fisher information at θ for the given items.
+
+        Args:
+            theta: Ability estimate (clamped to the grid range)
+            indices: Array indices of the items
+
+        Returns:
+            Information values, shape (len(indices),)
+        """
+        position = (theta - self.theta_min) / self.grid_step
+        position = min(max(position, 0.0), len(self.theta_grid) - 1.0)
+
+        lower = min(int(position), len(self.theta_grid) - 2)
+        frac = position - lower
+
+        return (1.0 - frac) * self.info_table[lower, indices] + frac * self.info_table[lower + 1, indices]
+
+    def excluded_positions(
+        self,
+        indices: np.ndarray,
+        excluded_ids: Optional[Iterable[int]] = None
+    ) -> np.ndarray:
+        """
+        Positions within a module's index array of the excluded item IDs.
+
+        Costs O(len(excluded_ids)) via the ID lookup, not O(module size).
+
+        Args:
+            indices: Array indices of the module (from group_indices)
+            excluded_ids: Item IDs to exclude (already answered)
+
+        Returns:
+            Array of positions into indices
+        """
+        if not excluded_ids or len(indices) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        excluded = np.array(
+            [self._index_by_id[item_id] for item_id in excluded_ids if item_id in self._index_by_id],
+            dtype=np.int64
+        )
+        positions = self._group_position[excluded]
+
+        # Keep only excluded items that belong to this module
+        in_module = positions < len(indices)
+        in_module[in_module] = indices[positions[in_module]] == excluded[in_module]
+
+        return np.unique(positions[in_module])
+
+    def select_item(
+        self,
+        stage: int,
+        panel: str,
+        theta_current: float,
+        form_id: int = 1,
+        excluded_ids: Optional[Iterable[int]] = None,
+        exposure_control: bool = True,
+        max_candidates: int = 10
+    ) -> Optional[Dict]:
+        """
+        Select next item by maximum Fisher information with Sympson-Hetter
+        exposure control, using the precomputed information curves.
+
+        Args:
+            stage: MST stage (1, 2, 3)
+            panel: Panel name
+            theta_current: Current ability estimate
+            form_id: Form ID
+            excluded_ids: Already answered item IDs
+            exposure_control: Enable exposure control
+            max_candidates: Most informative candidates visited
+
+        Returns:
+            Selected item or None if the module has no remaining items
+        """
+        indices = self.group_indices(stage, panel, form_id)
+        excluded = self.excluded_positions(indices, excluded_ids)
+
+        n_available = len(indices) - len(excluded)
+        if n_available <= 0:
+            return None
+
+        # Excluded items sink below every real candidate in the ranking
+        info = self.information_at(theta_current, indices)
+        info[excluded] = -np.inf
+
+        choice = self.irt.sympson_hetter_choice(
+            info,
+            self.exposure_k[indices],
+            max_candidates=min(max_candidates, n_available),
+            exposure_control=exposure_control
+        )
+
+        return self.items[indices[choice]]
+
+    def record_exposure(self, item_id: int, count: int = 1):
+        """Increment the in-memory exposure count of an item"""
+        idx = self._index_by_id.get(item_id)
+        if idx is not None:
+            self.exposure_counts[idx] += count
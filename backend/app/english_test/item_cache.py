@@ -0,0 +1,258 @@
+"""
+Process-wide Item Bank Cache for English Adaptive Testing
+=========================================================
+
+The active bank changes only when admins insert, regenerate or
+recalibrate items, yet every /submit-response used to re-run the
+items ⋈ passages query and re-parse options JSON for each candidate.
+This cache loads all active items once into an ItemBank (which serves
+selection with exclusion sets from arrays) and shares each passage's
+text between its items instead of copying it per row.
+
+Invalidation:
+- item_bank_version (bumped by trigger, see
+  migrations/add_item_bank_version.sql) is checked at most every
+  check_interval seconds; a new version triggers a reload
+- an optional LISTEN task on 'item_bank_changed' (started after the
+  first load) marks the cache stale as soon as the trigger fires
+- invalidate() for changes made by this process
+- without the version table, the bank is reloaded every max_age seconds
+
+Reloads build a new ItemBank off to the side and swap it in, so requests
+keep using the previous bank until the new one is ready. Loading and
+version checks await the async data layer; lookups themselves are pure
+in-memory work.
+"""
+
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional
+
+from .async_database import AsyncEnglishTestDB
+from .irt_engine import IRTEngine
+from .item_bank import ItemBank
+
+
+NOTIFY_CHANNEL = 'item_bank_changed'
+
+
+class ItemBankCache:
+    """
+    Lazily loaded, version-checked ItemBank shared by all requests.
+
+    Attributes:
+        check_interval (float): Seconds between item_bank_version checks
+        max_age (float): Reload interval when no version table exists
+        listen (bool): Start the LISTEN task after the first load
+        version (int): Version of the loaded bank (None if unversioned)
+        reloads (int): Number of loads since creation
+    """
+
+    def __init__(
+        self,
+        db: AsyncEnglishTestDB,
+        irt_engine: Optional[IRTEngine] = None,
+        check_interval: float = 5.0,
+        max_age: float = 300.0,
+        listen: bool = False
+    ):
+        self.db = db
+        self.irt = irt_engine or IRTEngine()
+        self.check_interval = check_interval
+        self.max_age = max_age
+        self.listen = listen
+
+        self._bank: Optional[ItemBank] = None
+        self._passage_count = 0
+        self._stale = False
+        self._reload_lock = asyncio.Lock()
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+
+        self._listener: Optional[asyncio.Task] = None
+        self._listening = False
+
+        self.version: Optional[int] = None
+        self.reloads = 0
+
+    # ----- Loading -----
+
+    async def bank(self) -> ItemBank:
+        """Current bank, reloading first if it is missing or out of date"""
+        if self._bank is None or self._stale or await self._version_changed():
+            await self.reload()
+        return self._bank
+
+    async def _version_changed(self) -> bool:
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+
+        try:
+            version = await self.db.get_item_bank_version()
+        except Exception as e:
+            print(f"⚠️ Item bank version check failed: {e}")
+            return False
+
+        if version is None:
+            return now - self._loaded_at >= self.max_age
+        return version != self.version
+
+    async def reload(self):
+        """Load all active items and passages and swap in a new bank"""
+        async with self._reload_lock:
+            # Another request may have reloaded while we waited
+            if self._bank is not None and not self._stale and time.monotonic() - self._loaded_at < 1.0:
+                return
+
+            self._stale = False
+            try:
+                # Read the version first: a change during the load bumps it
+                # again and is picked up by the next check
+                version = await self.db.get_item_bank_version()
+                items = await self.db.get_active_items()
+                passages = await self.db.get_passages(
+                    sorted({item['passage_id'] for item in items if item.get('passage_id')})
+                )
+            except Exception as e:
+                if self._bank is None:
+                    raise
+                print(f"⚠️ Item bank reload failed, keeping version {self.version}: {e}")
+                return
+
+            bank = ItemBank(self._prepare(items, passages), self.irt)
+
+            self._bank = bank
+            self._passage_count = len(passages)
+            self.version = version
+            self._loaded_at = self._checked_at = time.monotonic()
+            self.reloads += 1
+
+        # Only connect the listener once the database is known to be reachable
+        if self.listen:
+            self.start_listener()
+
+        print(f"✅ Item bank cache loaded: {len(bank)} items, {len(passages)} passages (version {version})")
+
+    @staticmethod
+    def _prepare(items: List[Dict], passages: Dict[int, Dict]) -> List[Dict]:
+        """Attach shared passage text and drop items that cannot be scored"""
+        prepared = []
+        for item in items:
+            if item.get('a') is None or item.get('b') is None:
+                continue  # Uncalibrated
+            if item.get('c') is None:
+                item['c'] = 0.25
+
+            # Every item of a passage references the same str objects
+            passage = passages.get(item.get('passage_id'))
+            if passage is not None:
+                item['passage_title'] = passage['title']
+                item['passage_content'] = passage['content']
+            else:
+                item.setdefault('passage_title', None)
+                item.setdefault('passage_content', None)
+            prepared.append(item)
+
+        return prepared
+
+    def invalidate(self):
+        """Reload on next access (e.g. after this process changed items)"""
+        self._stale = True
+
+    # ----- Lookups -----
+
+    async def get_item(self, item_id: int) -> Optional[Dict]:
+        """
+        Get an active item by ID.
+
+        Returns:
+            Copy of the item dictionary, or None if not cached
+        """
+        item = (await self.bank()).get(item_id)
+        return dict(item) if item is not None else None
+
+    async def select_item(
+        self,
+        stage: int,
+        panel: str,
+        theta_current: float,
+        form_id: int = 1,
+        excluded_ids: Optional[Iterable[int]] = None
+    ) -> Optional[Dict]:
+        """
+        Select the next item from memory (see ItemBank.select_item).
+
+        Returns:
+            Copy of the selected item, or None if the module is exhausted
+        """
+        item = (await self.bank()).select_item(
+            stage=stage,
+            panel=panel,
+            theta_current=theta_current,
+            form_id=form_id,
+            excluded_ids=excluded_ids
+        )
+        return dict(item) if item is not None else None
+
+    # ----- LISTEN/NOTIFY -----
+
+    def start_listener(self, channel: str = NOTIFY_CHANNEL, reconnect_delay: float = 5.0):
+        """
+        Mark the cache stale whenever the version trigger sends NOTIFY.
+
+        Runs as a task on the running event loop with its own connection
+        and reconnects after errors; version polling keeps working if the
+        listener is down.
+        """
+        if self._listener is not None:
+            return
+
+        self._listener = asyncio.get_running_loop().create_task(
+            self._listen(channel, reconnect_delay)
+        )
+
+    def stop_listener(self):
+        """Cancel the LISTEN task"""
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+
+    async def _listen(self, channel: str, reconnect_delay: float):
+        while True:
+            conn = None
+            try:
+                conn = await self.db.listen(channel, lambda *args: self.invalidate())
+                self._listening = True
+
+                while not conn.is_closed():
+                    await asyncio.sleep(reconnect_delay)
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as e:
+                print(f"⚠️ Item bank listener error, reconnecting: {e}")
+
+            finally:
+                self._listening = False
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+
+            await asyncio.sleep(reconnect_delay)
+
+    # ----- Monitoring -----
+
+    def stats(self) -> Dict:
+        """Cache state for monitoring"""
+        bank = self._bank
+        return {
+            'loaded': bank is not None,
+            'version': self.version,
+            'items': len(bank) if bank is not None else 0,
+            'passages': self._passage_count,
+            'reloads': self.reloads,
+            'age_seconds': round(time.monotonic() - self._loaded_at, 1) if bank is not None else None,
+            'listening': self._listening
+        }
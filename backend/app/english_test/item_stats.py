@@ -0,0 +1,297 @@
+"""
+Incremental Classical Item Statistics for English Adaptive Testing
+==================================================================
+
+Keeps running sums per item instead of recomputing statistics from
+english_test_responses:
+
+- p-value: responses and correct answers, counted as responses are
+  recorded
+- point-biserial against final θ: for each completed session, the
+  answered items add 1, x, θ, θ² and x·θ (x = 1 if correct), from which
+  r_pb = (m·Σxθ − Σx·Σθ) / √((m·Σx − (Σx)²)(m·Σθ² − (Σθ)²))
+- response time: count, sum and sum of squares (mean, SD) plus a
+  log-bucketed sketch for quantiles; bucket k > 0 covers
+  (RT_MIN_MS·γ^(k−1), RT_MIN_MS·γ^k], so any quantile is within about
+  ±(γ−1)/2 relative error and sketches merge by adding counts
+
+Like ExposureAggregator, deltas are collected in memory and a background
+thread adds them to item_statistics with one statement per flush
+(EnglishTestDB.apply_item_statistics), which also refreshes
+items.correct_rate and items.point_biserial. Reports then read one row
+per item.
+"""
+
+import atexit
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .database import EnglishTestDB
+
+
+# Response-time sketch: 100 ms .. 10 min in ~10% steps (93 buckets)
+RT_MIN_MS = 100.0
+RT_MAX_MS = 600000.0
+RT_GAMMA = 1.1
+RT_BUCKETS = 1 + math.ceil(math.log(RT_MAX_MS / RT_MIN_MS) / math.log(RT_GAMMA))
+
+
+def rt_bucket(response_time: float) -> int:
+    """Sketch bucket of a response time in ms (clamped to the sketch range)"""
+    if response_time <= RT_MIN_MS:
+        return 0
+    k = math.ceil(math.log(response_time / RT_MIN_MS) / math.log(RT_GAMMA))
+    return min(k, RT_BUCKETS - 1)
+
+
+def rt_quantile(buckets: List[int], q: float) -> Optional[float]:
+    """
+    Estimate a response-time quantile (ms) from sketch counts.
+
+    Returns:
+        The q-quantile, or None for an empty sketch
+    """
+    total = sum(buckets)
+    if total == 0:
+        return None
+
+    rank = q * (total - 1)
+    seen = 0
+    for k, count in enumerate(buckets):
+        seen += count
+        if seen > rank:
+            if k == 0:
+                return RT_MIN_MS
+            # Value with equal relative error to both bucket bounds
+            return RT_MIN_MS * 2 * RT_GAMMA ** k / (RT_GAMMA + 1)
+    return RT_MAX_MS
+
+
+class _ItemDelta:
+    """Pending increments of one item's statistics"""
+
+    __slots__ = (
+        'responses', 'correct', 'scored', 'scored_correct',
+        'sum_theta', 'sum_theta_sq', 'sum_correct_theta',
+        'rt_count', 'rt_sum', 'rt_sum_sq', 'rt_buckets'
+    )
+
+    def __init__(self):
+        self.responses = 0
+        self.correct = 0
+        self.scored = 0
+        self.scored_correct = 0
+        self.sum_theta = 0.0
+        self.sum_theta_sq = 0.0
+        self.sum_correct_theta = 0.0
+        self.rt_count = 0
+        self.rt_sum = 0.0
+        self.rt_sum_sq = 0.0
+        self.rt_buckets: Dict[int, int] = {}
+
+    def merge(self, other: '_ItemDelta'):
+        for name in self.__slots__[:-1]:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for k, count in other.rt_buckets.items():
+            self.rt_buckets[k] = self.rt_buckets.get(k, 0) + count
+
+    def to_dict(self) -> Dict:
+        """Column values for EnglishTestDB.apply_item_statistics"""
+        values = {name: getattr(self, name) for name in self.__slots__[:-1]}
+        buckets = [0] * (max(self.rt_buckets) + 1 if self.rt_buckets else 0)
+        for k, count in self.rt_buckets.items():
+            buckets[k] = count
+        values['rt_buckets'] = buckets
+        return values
+
+
+class ItemStatsAggregator:
+    """
+    In-memory item statistic deltas with periodic batched flushes.
+
+    Attributes:
+        flush_interval (float): Seconds between flushes
+    """
+
+    def __init__(self, db: EnglishTestDB, flush_interval: float = 10.0):
+        self.db = db
+        self.flush_interval = flush_interval
+
+        self._pending: Dict[int, _ItemDelta] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.responses = 0
+        self.sessions = 0
+        self.flushes = 0
+        self.failures = 0
+
+    def _delta(self, item_id: int) -> _ItemDelta:
+        """Pending delta of an item (lock held)"""
+        delta = self._pending.get(item_id)
+        if delta is None:
+            delta = self._pending[item_id] = _ItemDelta()
+        return delta
+
+    def record_response(self, item_id: int, is_correct: bool, response_time: Optional[float] = None):
+        """Count one recorded response (p-value and response time)"""
+        with self._lock:
+            delta = self._delta(item_id)
+            delta.responses += 1
+            delta.correct += bool(is_correct)
+
+            if response_time is not None and response_time >= 0:
+                delta.rt_count += 1
+                delta.rt_sum += response_time
+                delta.rt_sum_sq += response_time * response_time
+                k = rt_bucket(response_time)
+                delta.rt_buckets[k] = delta.rt_buckets.get(k, 0) + 1
+
+            self.responses += 1
+
+        if self._thread is None:
+            self.start()
+
+    def record_session(self, responses: Iterable[Tuple[int, bool]], final_theta: float):
+        """
+        Add a completed session's answers against its final θ (point-biserial).
+
+        Args:
+            responses: (item_id, is_correct) of every answered item
+            final_theta: The session's final ability estimate
+        """
+        theta = float(final_theta)
+        with self._lock:
+            for item_id, is_correct in responses:
+                delta = self._delta(item_id)
+                delta.scored += 1
+                delta.sum_theta += theta
+                delta.sum_theta_sq += theta * theta
+                if is_correct:
+                    delta.scored_correct += 1
+                    delta.sum_correct_theta += theta
+
+            self.sessions += 1
+
+        if self._thread is None:
+            self.start()
+
+    def pending(self) -> int:
+        """Items with unwritten deltas"""
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write pending deltas in one statement.
+
+        Returns:
+            Number of items updated
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+
+            if not batch:
+                return 0
+
+            try:
+                updated = self.db.apply_item_statistics(
+                    {item_id: delta.to_dict() for item_id, delta in batch.items()}
+                )
+            except Exception as e:
+                # Keep the deltas for the next attempt
+                with self._lock:
+                    for item_id, delta in batch.items():
+                        self._delta(item_id).merge(delta)
+                    self.failures += 1
+                print(f"⚠️ Item statistics flush failed ({len(batch)} items pending): {e}")
+                return 0
+
+            self.flushes += 1
+            return updated
+
+    def start(self):
+        """Start the background flush thread (idempotent)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name='item-stats-flush',
+                daemon=True
+            )
+            self._thread.start()
+
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Stop the flush thread and write whatever is still pending"""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def stats(self) -> Dict:
+        """Counters for monitoring"""
+        return {
+            'pending_items': self.pending(),
+            'responses': self.responses,
+            'sessions': self.sessions,
+            'flushes': self.flushes,
+            'failures': self.failures,
+            'flush_interval': self.flush_interval
+        }
+
+
+def summarize(row: Dict) -> Dict:
+    """
+    Classical statistics of one item from its item_statistics sums.
+
+    Args:
+        row: item_statistics row (plus any item columns to pass through)
+
+    Returns:
+        Dictionary with p_value, point_biserial and response-time summary
+        (None where there is not enough data)
+    """
+    responses = row['responses']
+    m, k = row['scored'], row['scored_correct']
+
+    point_biserial = None
+    var_x = m * k - k * k
+    var_theta = m * row['sum_theta_sq'] - row['sum_theta'] ** 2
+    if var_x > 0 and var_theta > 1e-12:
+        point_biserial = (m * row['sum_correct_theta'] - k * row['sum_theta']) / math.sqrt(var_x * var_theta)
+
+    n_rt = row['rt_count']
+    rt_mean = rt_sd = None
+    if n_rt:
+        rt_mean = row['rt_sum'] / n_rt
+        if n_rt > 1:
+            rt_sd = math.sqrt(max(row['rt_sum_sq'] - n_rt * rt_mean ** 2, 0.0) / (n_rt - 1))
+
+    buckets = list(row.get('rt_buckets') or [])
+
+    def rounded(value, digits):
+        return round(value, digits) if value is not None else None
+
+    return {
+        'responses': responses,
+        'correct': row['correct'],
+        'p_value': round(row['correct'] / responses, 4) if responses else None,
+        'scored_sessions': m,
+        'point_biserial': rounded(point_biserial, 4),
+        'rt_count': n_rt,
+        'rt_mean_ms': rounded(rt_mean, 1),
+        'rt_sd_ms': rounded(rt_sd, 1),
+        'rt_median_ms': rounded(rt_quantile(buckets, 0.5), 1),
+        'rt_p90_ms': rounded(rt_quantile(buckets, 0.9), 1)
+    }
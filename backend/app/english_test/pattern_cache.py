@@ -0,0 +1,163 @@
+"""
+Response-Pattern Cache for English Adaptive Testing
+===================================================
+
+Every examinee starts on the same small Stage 1 routing pool, so early
+response patterns ((item_id, is_correct), ...) repeat across thousands of
+sessions. This cache memoizes the posterior reached after each pattern
+prefix, so a repeated prefix skips the likelihood update and EAP summary.
+
+Only prefixes up to max_depth responses are cached (by default the
+8-item routing stage); deeper patterns are almost always unique.
+
+Cached posteriors are only valid for the item parameters and quadrature
+grid they were computed with, so every lookup passes a context (item bank
+generation and quadrature settings). A different context drops all
+entries, e.g. after a recalibration reloads the item bank.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+
+Pattern = Tuple[Tuple[int, bool], ...]
+
+
+class CachedPosterior:
+    """
+    Posterior snapshot stored for one response pattern.
+
+    Attributes:
+        log_posterior (np.ndarray): Read-only log posterior on the quadrature grid
+        theta (float): EAP estimate
+        se (float): Posterior standard deviation
+    """
+
+    __slots__ = ('log_posterior', 'theta', 'se')
+
+    def __init__(self, log_posterior: np.ndarray, theta: float, se: float):
+        self.log_posterior = np.array(log_posterior, dtype=float)
+        self.log_posterior.flags.writeable = False
+        self.theta = theta
+        self.se = se
+
+
+class ResponsePatternCache:
+    """
+    Bounded LRU cache of posteriors keyed on response-pattern prefixes.
+
+    Attributes:
+        max_entries (int): Maximum cached patterns before LRU eviction
+        max_depth (int): Longest pattern (number of responses) that is cached
+        hits, misses, evictions (int): Counters since creation or reset
+        invalidations (int): Times the entries were dropped for a new context
+    """
+
+    def __init__(self, max_entries: int = 50000, max_depth: int = 8):
+        self.max_entries = max_entries
+        self.max_depth = max_depth
+
+        self._entries: "OrderedDict[Pattern, CachedPosterior]" = OrderedDict()
+        self._context: Hashable = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def cacheable(self, pattern: Pattern) -> bool:
+        """Whether a pattern is short enough to be cached"""
+        return 0 < len(pattern) <= self.max_depth
+
+    def _use_context(self, context: Hashable):
+        """Drop all entries if they were cached under another context (lock held)"""
+        if context != self._context:
+            if self._entries:
+                self._entries.clear()
+                self.invalidations += 1
+            self._context = context
+
+    def get(self, pattern: Pattern, context: Hashable = None) -> Optional[CachedPosterior]:
+        """
+        Look up a pattern, counting the hit or miss.
+
+        Args:
+            pattern: ((item_id, is_correct), ...) in response order
+            context: Item parameters / quadrature the posterior must match
+
+        Returns:
+            CachedPosterior or None (also None for uncacheable patterns,
+            which are not counted)
+        """
+        if not self.cacheable(pattern):
+            return None
+
+        with self._lock:
+            self._use_context(context)
+            entry = self._entries.get(pattern)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(pattern)
+            self.hits += 1
+            return entry
+
+    def put(
+        self,
+        pattern: Pattern,
+        log_posterior: np.ndarray,
+        theta: float,
+        se: float,
+        context: Hashable = None
+    ):
+        """
+        Store the posterior reached after a pattern.
+
+        Args:
+            pattern: ((item_id, is_correct), ...) in response order
+            log_posterior: Log posterior after the last response
+            theta: EAP estimate after the last response
+            se: Standard error after the last response
+            context: Item parameters / quadrature the posterior was computed with
+        """
+        if not self.cacheable(pattern):
+            return
+
+        entry = CachedPosterior(log_posterior, theta, se)
+
+        with self._lock:
+            self._use_context(context)
+            self._entries[pattern] = entry
+            self._entries.move_to_end(pattern)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries (e.g. after item recalibration) and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict:
+        """Hit-rate counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'max_depth': self.max_depth,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
@@ -13,21 +13,103 @@ from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 from datetime import datetime
+import asyncio
+import os
 
-from .irt_engine import IRTEngine
+from .irt_engine import IRTEngine, StoppingRule
 from .service_v2 import EnglishTestServiceV2
 from .database import EnglishTestDB
+from .async_database import AsyncEnglishTestDB
+from .exposure import ExposureAggregator
+from .item_stats import ItemStatsAggregator
+from .item_cache import ItemBankCache
 
 router = APIRouter(tags=["English Adaptive Test"])
 
 # Initialize IRT engine and database
-irt_engine = IRTEngine()
+# Quadrature is configurable so node count can be traded for CPU per response
+# (see scripts/benchmark_quadrature.py for accuracy at each setting).
+# 'adaptive' only applies to eap_estimate and is rejected at startup
+irt_engine = IRTEngine(
+    quadrature=os.environ.get('IRT_QUADRATURE', 'trapezoid'),
+    quadrature_points=int(os.environ.get('IRT_QUADRATURE_POINTS', '41'))
+)
+EnglishTestServiceV2.check_engine(irt_engine)
 db_layer = EnglishTestDB()
 
+# Request handlers await the asyncpg layer so queries never block the event
+# loop; the sync layer above serves the background exposure flush thread
+async_db = AsyncEnglishTestDB()
+
+# Item exposure counts are batched and flushed in the background
+exposure_aggregator = ExposureAggregator(
+    db_layer,
+    flush_interval=float(os.environ.get('EXPOSURE_FLUSH_INTERVAL', '5'))
+)
+
+# Running per-item statistics are batched and flushed the same way
+item_stats_aggregator = ItemStatsAggregator(
+    db_layer,
+    flush_interval=float(os.environ.get('ITEM_STATS_FLUSH_INTERVAL', '10'))
+)
+
+# Active items and passages are loaded once per process and reloaded when
+# item_bank_version changes (polled, plus LISTEN item_bank_changed)
+item_cache = ItemBankCache(
+    async_db,
+    irt_engine,
+    check_interval=float(os.environ.get('ITEM_BANK_CHECK_INTERVAL', '5')),
+    listen=os.environ.get('ITEM_BANK_LISTEN', '1') == '1'
+)
+
+# Variable-length stopping rule; an empty IRT_TARGET_SE /
+# IRT_CLASSIFICATION_CONFIDENCE disables that criterion, and
+# IRT_MIN_ITEMS == IRT_MAX_ITEMS restores a fixed-length test
+def _optional_float(name: str, default: str) -> Optional[float]:
+    value = os.environ.get(name, default)
+    return float(value) if value else None
+
+
+stopping_rule = StoppingRule(
+    target_se=_optional_float('IRT_TARGET_SE', '0.30'),
+    min_items=int(os.environ.get('IRT_MIN_ITEMS', '24')),
+    max_items=int(os.environ.get('IRT_MAX_ITEMS', '40')),
+    classification_confidence=_optional_float('IRT_CLASSIFICATION_CONFIDENCE', '0.95')
+)
+
 # Create service instance
 def get_service() -> EnglishTestServiceV2:
     """Get English Test Service instance"""
-    return EnglishTestServiceV2(db=db_layer, irt_engine=irt_engine)
+    return EnglishTestServiceV2(
+        db=async_db,
+        irt_engine=irt_engine,
+        exposure=exposure_aggregator,
+        stopping_rule=stopping_rule,
+        item_cache=item_cache,
+        item_stats=item_stats_aggregator
+    )
+
+
+@router.on_event("startup")
+async def startup():
+    """Open the sync pool's minimum connections before the first request"""
+    try:
+        opened = await asyncio.to_thread(db_layer.warm_pool)
+        print(f"✅ Connection pool warmed ({opened} connections)")
+    except Exception as e:
+        # Connections are still opened on demand
+        print(f"⚠️ Connection pool warm-up failed: {e}")
+
+
+@router.on_event("shutdown")
+async def shutdown():
+    """Flush pending exposure counts and item statistics and close database connections"""
+    item_cache.stop_listener()
+    exposure_aggregator.stop()
+    item_stats_aggregator.stop()
+    await async_db.close()
+    if EnglishTestDB._connection_pool is not None:
+        EnglishTestDB._connection_pool.closeall()
 
 
 # ===== Request/Response Models =====
@@ -66,6 +148,7 @@ class SubmitResponseResponse(BaseModel):
     stage: int
     panel: str
     test_completed: bool = False
+    stop_reason: Optional[str] = None
 
 
 class SessionStatusResponse(BaseModel):
@@ -125,7 +208,7 @@ async def start_test(request: StartTestRequest):
         service = get_service()
         logger.info("✅ Service instance created")
 
-        result = service.start_session(request.user_id)
+        result = await service.start_session(request.user_id)
         logger.info(f"✅ Session started: {result.get('session_id')}")
 
         return StartTestResponse(
@@ -165,7 +248,7 @@ async def submit_response(request: SubmitResponseRequest):
         service = get_service()
         logger.info("✅ Service instance created")
 
-        result = service.submit_response(
+        result = await service.submit_response(
             session_id=request.session_id,
             item_id=request.item_id,
             selected_answer=request.selected_answer,
@@ -195,7 +278,7 @@ async def get_session_status(session_id: int):
     """
     try:
         service = get_service()
-        session_data = service.get_session_status(session_id)
+        session_data = await service.get_session_status(session_id)
 
         return SessionStatusResponse(**session_data)
 
@@ -219,7 +302,7 @@ async def finalize_test(request: FinalizeTestRequest):
     """
     try:
         service = get_service()
-        final_results = service.finalize_session(request.session_id)
+        final_results = await service.finalize_session(request.session_id)
 
         return FinalizeTestResponse(**final_results)
 
@@ -236,5 +319,13 @@ async def health_check():
         "status": "healthy",
         "service": "English Adaptive Test API",
         "version": "1.0.0",
-        "irt_engine": "3PL EAP"
+        "irt_engine": "3PL EAP",
+        "pattern_cache": EnglishTestServiceV2.pattern_cache_stats(),
+        "session_cache": EnglishTestServiceV2.session_cache_stats(),
+        "exposure": exposure_aggregator.stats(),
+        "item_stats": item_stats_aggregator.stats(),
+        "db_pool": async_db.pool_stats(),
+        "sync_db_pool": db_layer.pool_stats(),
+        "item_bank": item_cache.stats(),
+        "stopping_rule": stopping_rule.to_dict()
     }
@@ -5,11 +5,25 @@ English Adaptive Test Service Layer v2
 Business logic for MST-based English proficiency testing with database integration.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+import asyncio
 import random
 
-from .irt_engine import IRTEngine
-from .database import EnglishTestDB
+import numpy as np
+
+from .irt_engine import IRTEngine, PosteriorState, StoppingRule
+from .async_database import AsyncEnglishTestDB
+from .pattern_cache import ResponsePatternCache
+from .exposure import ExposureAggregator
+from .item_stats import ItemStatsAggregator
+from .item_cache import ItemBankCache
+from .session_state import Branch, SessionState, SessionStateCache
+
+
+def _report_speculation_failure(task: asyncio.Task):
+    """Log speculation errors (submit_response then computes inline)"""
+    if not task.cancelled() and task.exception() is not None:
+        print(f"⚠️ Next-item speculation failed: {task.exception()}")
 
 
 class EnglishTestServiceV2:
@@ -19,10 +33,70 @@ class EnglishTestServiceV2:
     Integrates IRT engine with database layer for complete test management.
     """
 
-    def __init__(self, db: EnglishTestDB, irt_engine: IRTEngine):
+    # Class-level per-session state (shared across per-request instances):
+    # stage/panel, counts, θ/SE and the incremental posterior of active
+    # sessions, so answers need no session or history reads
+    _session_states = SessionStateCache(ttl=1800.0, max_entries=10000)
+
+    # Class-level memo of posteriors for repeated early response patterns
+    # (Stage 1 routing items are shared by every examinee)
+    _pattern_cache = ResponsePatternCache(max_entries=50000, max_depth=8)
+
+    @staticmethod
+    def check_engine(irt_engine: IRTEngine):
+        """
+        Reject quadrature schemes the live scoring path cannot use.
+
+        Routing and stopping score incrementally (update_posterior /
+        posterior_estimate) while finalize_session calls eap_estimate; with
+        'adaptive' the two would disagree on θ for the same responses.
+
+        Raises:
+            ValueError: If irt_engine.quadrature is not incremental
+        """
+        if irt_engine.quadrature not in IRTEngine.INCREMENTAL_SCHEMES:
+            raise ValueError(
+                f"Quadrature '{irt_engine.quadrature}' is not supported for live sessions "
+                f"(expected one of {', '.join(IRTEngine.INCREMENTAL_SCHEMES)})"
+            )
+
+    def __init__(
+        self,
+        db: AsyncEnglishTestDB,
+        irt_engine: IRTEngine,
+        ai_fallback: bool = True,
+        exposure: Optional[ExposureAggregator] = None,
+        stopping_rule: Optional[StoppingRule] = None,
+        item_cache: Optional[ItemBankCache] = None,
+        speculate: bool = True,
+        item_stats: Optional[ItemStatsAggregator] = None
+    ):
+        self.check_engine(irt_engine)
+
         self.db = db
         self.irt = irt_engine
 
+        # In-memory item bank; without one, items are queried per request
+        self.item_cache = item_cache
+
+        # Variable-length termination (SE target / stable classification,
+        # bounded by min/max items)
+        self.stopping_rule = stopping_rule or StoppingRule()
+
+        # Write-behind exposure counter; without one, each administration
+        # is written immediately
+        self.exposure = exposure
+
+        # Write-behind running item statistics (p-value, point-biserial,
+        # response time); None disables them
+        self.item_stats = item_stats
+
+        # Generate items with Gemini when a module's pool is depleted
+        self.ai_fallback = ai_fallback
+
+        # Precompute both answer outcomes while the examinee reads an item
+        self.speculate = speculate
+
         # MST configuration
         self.STAGE_ITEMS = {
             1: 8,   # Routing module
@@ -33,7 +107,7 @@ class EnglishTestServiceV2:
         # Form rotation (1, 2, 3)
         self.FORM_COUNT = 3
 
-    def start_session(self, user_id: str) -> Dict:
+    async def start_session(self, user_id: str) -> Dict:
         """
         Start new English adaptive test session.
 
@@ -44,10 +118,10 @@ class EnglishTestServiceV2:
             Dictionary with session and first_item
         """
         # Create session in database
-        session = self.db.create_session(user_id)
+        session = await self.db.create_session(user_id)
 
         # Select first item from routing panel
-        first_item = self._select_item(
+        first_item = await self._select_item(
             stage=1,
             panel='routing',
             theta_current=0.0,
@@ -58,7 +132,21 @@ class EnglishTestServiceV2:
             raise ValueError("No items available for routing panel")
 
         # Increment exposure
-        self.db.increment_exposure(first_item['id'])
+        await self._record_exposure(first_item['id'])
+
+        # Cache the session state, seeding the posterior with the prior
+        state = SessionState(
+            session_id=session['id'],
+            user_id=session['user_id'],
+            started_at=session['started_at'],
+            posterior=self.irt.new_posterior(),
+            status=session['status'],
+            stage=session['stage'],
+            panel=session['panel'],
+            items_completed=session['items_completed']
+        )
+        EnglishTestServiceV2._session_states.put(state)
+        self._schedule_speculation(state, first_item)
 
         return {
             'session_id': session['id'],
@@ -67,11 +155,11 @@ class EnglishTestServiceV2:
             'stage': session['stage'],
             'panel': session['panel'],
             'items_completed': session['items_completed'],
-            'total_items': 40,
+            'total_items': self.stopping_rule.max_items,
             'first_item': self._format_item(first_item)
         }
 
-    def submit_response(
+    async def submit_response(
         self,
         session_id: int,
         item_id: int,
@@ -90,102 +178,82 @@ class EnglishTestServiceV2:
         Returns:
             Response result with next_item (or None if test complete)
         """
-        # Get session
-        session = self.db.get_session(session_id)
-        if not session:
-            raise ValueError(f"Session {session_id} not found")
+        # Get session state (cached; rebuilt from the database if missing)
+        state = await self._get_session_state(session_id)
 
         # Get item
-        item = self.db.get_item(item_id)
+        item = await self._get_item(item_id)
         if not item:
             raise ValueError(f"Item {item_id} not found")
 
         # Check correctness
         is_correct = (selected_answer == item['correct_answer'])
 
-        # Get all responses so far
-        responses = self.db.get_session_responses(session_id)
-
-        # Add current response
-        responses_bool = [r['is_correct'] for r in responses] + [is_correct]
-        items_params = [
-            {'a': r['discrimination'], 'b': r['difficulty'], 'c': r['guessing']}
-            for r in responses
-        ] + [
-            {'a': item['discrimination'], 'b': item['difficulty'], 'c': item['guessing']}
-        ]
+        # Outcome of this answer: precomputed while the item was on screen,
+        # or computed now (no speculation, other item, or it failed)
+        branch = await self._precomputed_branch(state, item_id, is_correct)
+        if branch is None:
+            branch = await self._branch(state, item, is_correct)
+        elif branch.next_item is None and branch.stop_reason is None:
+            # Speculation never generates items; do it now that it is needed
+            branch.next_item = await self._select_item(
+                stage=branch.stage,
+                panel=branch.panel,
+                theta_current=branch.theta,
+                excluded_ids=list(branch.posterior.item_ids)
+            )
 
-        # Update θ estimate using IRT EAP
-        theta_est, se = self.irt.eap_estimate(responses_bool, items_params)
+        theta_est, se = branch.theta, branch.se
+        new_stage, new_panel = branch.stage, branch.panel
+        stop_reason = branch.stop_reason
+        test_completed = stop_reason is not None
+        next_item = branch.next_item
 
         # Update session items_completed and current estimates
-        items_completed = session['items_completed'] + 1
-        current_stage = session['stage']
-
-        # Record response in database with stage tracking
-        self.db.create_response(
-            session_id=session_id,
-            item_id=item_id,
-            selected_answer=selected_answer,
-            is_correct=is_correct,
-            stage=current_stage,
-            item_order=items_completed,
-            theta_estimate=theta_est,
-            standard_error=se,
-            response_time=response_time
-        )
-
-        # Update session
-        self.db.update_session(session_id, {
-            'items_completed': items_completed,
-            'current_theta': theta_est,
-            'current_se': se
-        })
-
-        # Check if stage transition needed (count only responses from current stage)
-        # Note: Use r.get('stage', 1) with default=1 for backward compatibility with old responses
-        items_in_current_stage = len([r for r in responses if r.get('stage', 1) == current_stage]) + 1  # Include current
-        stage_complete = (items_in_current_stage >= self.STAGE_ITEMS[current_stage])
-
-        new_stage = current_stage
-        new_panel = session['panel']
-
-        if stage_complete and current_stage < 3:
-            if current_stage == 1:
-                # Route to Stage 2 panel based on theta
-                new_stage = 2
-                new_panel = self.irt.route_to_stage2_panel(theta_est)
+        current_stage = state.stage
+        state.posterior = branch.posterior
+        state.record_response(current_stage, theta_est, se)
+        items_completed = state.items_completed
+
+        # Persist response, session progress, routing and the next item's
+        # exposure in one transaction (the write-behind aggregator, when
+        # set, counts exposure instead)
+        batch_exposure = next_item is not None and self.exposure is not None
+        try:
+            recorded = await self.db.record_submission(
+                session_id=session_id,
+                item_id=item_id,
+                selected_answer=selected_answer,
+                is_correct=is_correct,
+                stage=current_stage,
+                item_order=items_completed,
+                theta_estimate=theta_est,
+                standard_error=se,
+                new_stage=new_stage,
+                new_panel=new_panel,
+                response_time=response_time,
+                exposure_item_id=next_item['id'] if next_item and not batch_exposure else None
+            )
+        except Exception:
+            # The cached state is now ahead of the database; rebuild it next time
+            EnglishTestServiceV2._session_states.pop(session_id)
+            raise
 
-            elif current_stage == 2:
-                # Route to Stage 3 subtrack
-                new_stage = 3
-                new_panel = self.irt.route_to_stage3_panel(theta_est, session['panel'])
+        if recorded is None:
+            EnglishTestServiceV2._session_states.pop(session_id)
+            raise ValueError(f"Session {session_id} was updated by another request; please retry")
 
-            # Update session stage/panel
-            self.db.update_session(session_id, {
-                'stage': new_stage,
-                'panel': new_panel
-            })
+        state.stage = new_stage
+        state.panel = new_panel
 
-        # Check if test complete (40 items total)
-        test_completed = (items_completed >= 40)
+        if batch_exposure:
+            self.exposure.record(next_item['id'])
 
-        if test_completed:
-            next_item = None
-        else:
-            # Get list of already answered item IDs
-            answered_ids = [r['item_id'] for r in responses] + [item_id]
+        if self.item_stats is not None:
+            self.item_stats.record_response(item_id, is_correct, response_time)
 
-            # Select next item
-            next_item = self._select_item(
-                stage=new_stage,
-                panel=new_panel,
-                theta_current=theta_est,
-                excluded_ids=answered_ids
-            )
-
-            if next_item:
-                self.db.increment_exposure(next_item['id'])
+        if next_item is not None:
+            self._schedule_speculation(state, next_item)
 
         return {
             'is_correct': is_correct,
@@ -193,13 +261,14 @@ class EnglishTestServiceV2:
             'current_theta': round(theta_est, 3),
             'standard_error': round(se, 3),
             'items_completed': items_completed,
-            'total_items': 40,
+            'total_items': self.stopping_rule.max_items,
             'stage': new_stage,
             'panel': new_panel,
-            'test_completed': test_completed
+            'test_completed': test_completed,
+            'stop_reason': stop_reason
         }
 
-    def get_session_status(self, session_id: int) -> Dict:
+    async def get_session_status(self, session_id: int) -> Dict:
         """
         Get current session status.
 
@@ -209,7 +278,7 @@ class EnglishTestServiceV2:
         Returns:
             Session status dictionary
         """
-        session = self.db.get_session(session_id)
+        session = await self.db.get_session(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
 
@@ -226,7 +295,7 @@ class EnglishTestServiceV2:
             'panel': session['panel']
         }
 
-    def finalize_session(self, session_id: int) -> Dict:
+    async def finalize_session(self, session_id: int) -> Dict:
         """
         Finalize test session and generate comprehensive report.
 
@@ -236,7 +305,7 @@ class EnglishTestServiceV2:
         Returns:
             Final test results (FR-005)
         """
-        session = self.db.get_session(session_id)
+        session = await self.db.get_session(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
 
@@ -244,7 +313,7 @@ class EnglishTestServiceV2:
             raise ValueError("Session already completed")
 
         # Get all responses
-        responses = self.db.get_session_responses(session_id)
+        responses = await self.db.get_session_responses(session_id)
 
         if not responses:
             raise ValueError("No responses found for session")
@@ -262,7 +331,7 @@ class EnglishTestServiceV2:
         proficiency_level = self.irt.ability_to_proficiency_level(final_theta)
 
         # Get statistics
-        stats = self.db.get_session_statistics(session_id)
+        stats = await self.db.get_session_statistics(session_id)
 
         # Estimate Lexile/AR (placeholder - requires ML model)
         lexile_score = self._estimate_lexile(final_theta)
@@ -286,7 +355,17 @@ class EnglishTestServiceV2:
         }
 
         # Update session in database
-        self.db.finalize_session(session_id, final_results)
+        await self.db.finalize_session(session_id, final_results)
+
+        if self.item_stats is not None:
+            self.item_stats.record_session(
+                ((r['item_id'], r['is_correct']) for r in responses),
+                final_theta
+            )
+
+        state = EnglishTestServiceV2._session_states.pop(session_id)
+        if state is not None:
+            state.cancel_speculation()
 
         # Add session info
         final_results.update({
@@ -299,12 +378,263 @@ class EnglishTestServiceV2:
 
     # ===== Helper Methods =====
 
-    def _select_item(
+    async def _get_session_state(self, session_id: int) -> SessionState:
+        """
+        Get the cached state of a session, rebuilding it from the session
+        row and response history when missing (process restart, expiry or
+        eviction).
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            SessionState covering every recorded response
+        """
+        state = EnglishTestServiceV2._session_states.get(session_id)
+        if state is not None:
+            return state
+
+        session = await self.db.get_session(session_id)
+        if not session:
+            raise ValueError(f"Session {session_id} not found")
+
+        responses = await self.db.get_session_responses(session_id)
+        posterior = self.irt.posterior_from_responses(
+            [r['is_correct'] for r in responses],
+            [
+                {'a': r['discrimination'], 'b': r['difficulty'], 'c': r['guessing']}
+                for r in responses
+            ],
+            item_ids=[r['item_id'] for r in responses]
+        )
+
+        stage_counts: Dict[int, int] = {}
+        for r in responses:
+            stage = r.get('stage') or session['stage']
+            stage_counts[stage] = stage_counts.get(stage, 0) + 1
+
+        state = SessionState(
+            session_id=session['id'],
+            user_id=session['user_id'],
+            started_at=session['started_at'],
+            posterior=posterior,
+            status=session['status'],
+            stage=session['stage'],
+            panel=session['panel'],
+            items_completed=session['items_completed'],
+            theta=session.get('current_theta'),
+            se=session.get('current_se'),
+            stage_counts=stage_counts
+        )
+        EnglishTestServiceV2._session_states.put(state)
+        return state
+
+    async def _branch(
+        self,
+        state: SessionState,
+        item: Dict,
+        is_correct: bool,
+        ai_fallback: bool = True
+    ) -> Branch:
+        """
+        Outcome of answering an item, without modifying the session state.
+
+        Args:
+            state: Session state before the answer
+            item: Answered item with 'id' and IRT parameters
+            is_correct: Outcome to evaluate
+            ai_fallback: Allow AI generation if the next module is depleted
+
+        Returns:
+            Branch with the updated posterior, θ/SE, routing, stopping
+            decision and next item
+        """
+        # Fold only the new response into a copy of the session posterior
+        # (O(Q) update)
+        current = state.posterior
+        posterior = PosteriorState(current.log_posterior, current.item_ids, current.responses)
+        theta_est, se = self._advance_posterior(posterior, is_correct, item)
+
+        # Check if stage transition needed (count only responses from current stage)
+        current_stage = state.stage
+        items_in_current_stage = state.stage_counts.get(current_stage, 0) + 1
+        stage_complete = (items_in_current_stage >= self.STAGE_ITEMS[current_stage])
+
+        new_stage = current_stage
+        new_panel = state.panel
+
+        if stage_complete and current_stage < 3:
+            if current_stage == 1:
+                # Route to Stage 2 panel based on theta
+                new_stage = 2
+                new_panel = self.irt.route_to_stage2_panel(theta_est)
+
+            elif current_stage == 2:
+                # Route to Stage 3 subtrack
+                new_stage = 3
+                new_panel = self.irt.route_to_stage3_panel(theta_est, state.panel)
+
+        # Check if test complete (stopping rule: SE target, stable
+        # classification or max items, never before min items)
+        stop_reason = self.irt.stopping_reason(posterior, theta_est, se, self.stopping_rule)
+
+        next_item = None
+        if stop_reason is None:
+            # Already answered item IDs (tracked by the posterior state)
+            next_item = await self._select_item(
+                stage=new_stage,
+                panel=new_panel,
+                theta_current=theta_est,
+                excluded_ids=list(posterior.item_ids),
+                ai_fallback=ai_fallback
+            )
+
+        return Branch(
+            posterior=posterior,
+            theta=theta_est,
+            se=se,
+            stage=new_stage,
+            panel=new_panel,
+            stop_reason=stop_reason,
+            next_item=next_item
+        )
+
+    def _schedule_speculation(self, state: SessionState, item: Dict):
+        """Start computing both outcomes of the item just served"""
+        if not self.speculate:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._speculate(state, item['id']))
+        task.add_done_callback(_report_speculation_failure)
+        state.speculate(item['id'], task)
+
+    async def _speculate(self, state: SessionState, item_id: int) -> Dict[bool, Branch]:
+        """Branches for a correct and an incorrect answer to item_id"""
+        item = await self._get_item(item_id)
+        if not item:
+            raise ValueError(f"Item {item_id} not found")
+
+        return {
+            outcome: await self._branch(state, item, outcome, ai_fallback=False)
+            for outcome in (True, False)
+        }
+
+    async def _precomputed_branch(
+        self,
+        state: SessionState,
+        item_id: int,
+        is_correct: bool
+    ) -> Optional[Branch]:
+        """
+        Precomputed outcome for this answer, waiting for the speculation if
+        it is still running.
+
+        Returns:
+            Branch, or None if nothing usable was precomputed
+        """
+        task = state.take_speculation(item_id)
+        if task is None:
+            return None
+
+        try:
+            branches = await task
+        except Exception:
+            return None
+
+        return branches[is_correct]
+
+    def _advance_posterior(
+        self,
+        posterior: PosteriorState,
+        is_correct: bool,
+        item: Dict
+    ) -> Tuple[float, float]:
+        """
+        Fold a response into the posterior, reusing the memoized result
+        when this exact response pattern has been seen before.
+
+        Args:
+            posterior: Session posterior (updated in place)
+            is_correct: Whether the item was answered correctly
+            item: Answered item with 'id' and IRT parameters
+
+        Returns:
+            Tuple of (theta_estimate, standard_error)
+        """
+        cache = EnglishTestServiceV2._pattern_cache
+        pattern = None
+        context = self._pattern_context()
+
+        if context is not None and posterior.n_responses < cache.max_depth:
+            pattern = posterior.pattern + ((item['id'], bool(is_correct)),)
+            cached = cache.get(pattern, context)
+
+            if cached is not None:
+                posterior.log_posterior = np.array(cached.log_posterior)
+                posterior.item_ids.append(item['id'])
+                posterior.responses.append(bool(is_correct))
+                return cached.theta, cached.se
+
+        self.irt.update_posterior(posterior, is_correct, item)
+        theta_est, se = self.irt.posterior_estimate(posterior)
+
+        if pattern is not None:
+            cache.put(pattern, posterior.log_posterior, theta_est, se, context)
+
+        return theta_est, se
+
+    def _pattern_context(self) -> Optional[Tuple]:
+        """
+        What cached pattern posteriors depend on besides the pattern itself:
+        the loaded item bank (parameters change on recalibration) and the
+        quadrature grid and prior.
+
+        Returns:
+            Hashable context, or None when items are read per request and
+            parameter changes cannot be detected (the cache is not used)
+        """
+        if self.item_cache is None:
+            return None
+
+        irt = self.irt
+        return (
+            self.item_cache.version, self.item_cache.reloads,
+            irt.quadrature, irt.quadrature_points,
+            irt.prior_mean, irt.prior_sd, irt.theta_min, irt.theta_max
+        )
+
+    @classmethod
+    def pattern_cache_stats(cls) -> Dict:
+        """Hit-rate counters of the response-pattern cache"""
+        return cls._pattern_cache.stats()
+
+    @classmethod
+    def session_cache_stats(cls) -> Dict:
+        """Hit-rate counters of the per-session state cache"""
+        return cls._session_states.stats()
+
+    async def _get_item(self, item_id: int) -> Optional[Dict]:
+        """Get item by ID from the cached bank, falling back to the database"""
+        if self.item_cache is not None:
+            item = await self.item_cache.get_item(item_id)
+            if item:
+                return item
+        return await self.db.get_item(item_id)
+
+    async def _record_exposure(self, item_id: int):
+        """Count an item administration (batched when an aggregator is set)"""
+        if self.exposure is not None:
+            self.exposure.record(item_id)
+        else:
+            await self.db.increment_exposure(item_id)
+
+    async def _select_item(
         self,
         stage: int,
         panel: str,
         theta_current: float,
-        excluded_ids: List[int]
+        excluded_ids: List[int],
+        ai_fallback: bool = True
     ) -> Optional[Dict]:
         """
         Select optimal item using Fisher Information with exposure control.
@@ -314,6 +644,8 @@ class EnglishTestServiceV2:
             panel: Panel name
             theta_current: Current ability estimate
             excluded_ids: Already answered item IDs
+            ai_fallback: Generate items if the module is depleted (and the
+                service allows it)
 
         Returns:
             Selected item or None
@@ -321,13 +653,29 @@ class EnglishTestServiceV2:
         # Select form using rotation (currently only form 1 is available)
         form_id = 1  # TODO: Implement proper form rotation when forms 2 and 3 are added
 
-        # Get candidate items from database
-        candidates = self.db.get_items_for_selection(
-            stage=stage,
-            panel=panel,
-            form_id=form_id,
-            excluded_ids=excluded_ids
-        )
+        if self.item_cache is not None:
+            # Select straight from the cached bank's information tables
+            selected_item = await self.item_cache.select_item(
+                stage=stage,
+                panel=panel,
+                theta_current=theta_current,
+                form_id=form_id,
+                excluded_ids=excluded_ids
+            )
+            if selected_item:
+                return selected_item
+            candidates = []
+        else:
+            # Get candidate items from database
+            candidates = await self.db.get_items_for_selection(
+                stage=stage,
+                panel=panel,
+                form_id=form_id,
+                excluded_ids=excluded_ids
+            )
+
+        if not candidates and not (self.ai_fallback and ai_fallback):
+            return None
 
         if not candidates:
             # Fallback: Generate items using AI when database pool is depleted
@@ -338,7 +686,9 @@ class EnglishTestServiceV2:
                 from app.english_test.ai_item_generator import get_generator
 
                 ai_generator = get_generator()
-                generated_items = ai_generator.generate_items(
+                # Gemini client is synchronous; keep it off the event loop
+                generated_items = await asyncio.to_thread(
+                    ai_generator.generate_items,
                     stage=stage,
                     panel=panel,
                     count=5  # Generate 5 items to replenish pool
@@ -350,10 +700,13 @@ class EnglishTestServiceV2:
                     # Save generated items to database
                     for item in generated_items:
                         try:
-                            self.db.insert_item(item)
+                            await self.db.insert_item(item)
                         except Exception as insert_error:
                             print(f"⚠️ Failed to save item {item.get('id')}: {insert_error}")
 
+                    if self.item_cache is not None:
+                        self.item_cache.invalidate()
+
                     # Use first generated item as candidate
                     candidates = [generated_items[0]]
                     print(f"🎯 Selected AI-generated item: {generated_items[0]['id']}")
@@ -389,7 +742,8 @@ class EnglishTestServiceV2:
             'source': item.get('source', 'manual')  # Add source: 'manual' or 'ai_generated'
         }
 
-    def _estimate_lexile(self, theta: float) -> int:
+    @staticmethod
+    def _estimate_lexile(theta: float) -> int:
         """
         Estimate Lexile score from θ.
 
@@ -401,7 +755,8 @@ class EnglishTestServiceV2:
         lexile = lexile_min + (theta - theta_min) / (theta_max - theta_min) * (lexile_max - lexile_min)
         return int(max(lexile_min, min(lexile_max, lexile)))
 
-    def _estimate_ar(self, theta: float) -> float:
+    @staticmethod
+    def _estimate_ar(theta: float) -> float:
         """
         Estimate AR level from θ.
 
@@ -0,0 +1,260 @@
+"""
+Per-Session State Cache for English Adaptive Testing
+====================================================
+
+Keeps everything submit_response needs about an active session in
+memory: session metadata (stage, panel, items_completed), the current
+θ/SE, per-stage response counts and the incremental posterior, which
+itself tracks the answered item IDs and response bits. With the state
+cached, an answer needs no session or response-history reads.
+
+While the examinee works on an item, the service precomputes the
+outcome of both possible answers (posterior, θ/SE, routing, stopping
+decision and next item) into a speculation task held on the state, so
+submit_response only has to pick a branch and persist it.
+
+Entries expire after ttl seconds without activity and the least recently
+used are dropped beyond max_entries. A missing entry (expiry, eviction,
+process restart) is rebuilt from english_test_sessions and
+english_test_responses by the service, so the cache is purely an
+optimization. The state is per process: deployments with several worker
+processes need session-affine routing for the cache to be effective.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+from .irt_engine import PosteriorState
+
+
+class Branch:
+    """
+    Precomputed result of one answer to the current item.
+
+    Attributes:
+        posterior (PosteriorState): Posterior including the answer
+        theta (float): EAP estimate after the answer
+        se (float): Standard error after the answer
+        stage (int): Stage after routing
+        panel (str): Panel after routing
+        stop_reason (str): Stopping-rule result (None to continue)
+        next_item (Dict): Item to serve next (None if stopping or the
+            module needs AI generation)
+    """
+
+    __slots__ = ('posterior', 'theta', 'se', 'stage', 'panel', 'stop_reason', 'next_item')
+
+    def __init__(
+        self,
+        posterior: PosteriorState,
+        theta: float,
+        se: float,
+        stage: int,
+        panel: str,
+        stop_reason: Optional[str],
+        next_item: Optional[Dict]
+    ):
+        self.posterior = posterior
+        self.theta = theta
+        self.se = se
+        self.stage = stage
+        self.panel = panel
+        self.stop_reason = stop_reason
+        self.next_item = next_item
+
+
+class SessionState:
+    """
+    Cached state of one active test session.
+
+    Attributes:
+        session_id (int): Session ID
+        user_id (str): User identifier
+        started_at (datetime): Session start time
+        status (str): Session status ('active', 'completed')
+        stage (int): Current MST stage
+        panel (str): Current panel
+        items_completed (int): Responses recorded so far
+        theta (float): Current ability estimate (None before the first response)
+        se (float): Current standard error (None before the first response)
+        stage_counts (Dict[int, int]): Responses recorded per stage
+        posterior (PosteriorState): Incremental posterior with answered IDs
+        speculation_item_id (int): Item the pending speculation is for
+        speculation (asyncio.Task): Task resolving to {is_correct: Branch}
+    """
+
+    __slots__ = (
+        'session_id', 'user_id', 'started_at', 'status', 'stage', 'panel',
+        'items_completed', 'theta', 'se', 'stage_counts', 'posterior', 'touched',
+        'speculation_item_id', 'speculation'
+    )
+
+    def __init__(
+        self,
+        session_id: int,
+        user_id: str,
+        started_at: datetime,
+        posterior: PosteriorState,
+        status: str = 'active',
+        stage: int = 1,
+        panel: str = 'routing',
+        items_completed: int = 0,
+        theta: Optional[float] = None,
+        se: Optional[float] = None,
+        stage_counts: Optional[Dict[int, int]] = None
+    ):
+        self.session_id = session_id
+        self.user_id = user_id
+        self.started_at = started_at
+        self.status = status
+        self.stage = stage
+        self.panel = panel
+        self.items_completed = items_completed
+        self.theta = theta
+        self.se = se
+        self.stage_counts = dict(stage_counts) if stage_counts else {}
+        self.posterior = posterior
+        self.touched = time.monotonic()
+
+        self.speculation_item_id: Optional[int] = None
+        self.speculation: Optional[asyncio.Task] = None
+
+    @property
+    def answered_ids(self):
+        """IDs of the answered items, in response order"""
+        return self.posterior.item_ids
+
+    def record_response(self, stage: int, theta: float, se: float):
+        """Count a response folded into the posterior and store the new estimate"""
+        self.items_completed += 1
+        self.stage_counts[stage] = self.stage_counts.get(stage, 0) + 1
+        self.theta = theta
+        self.se = se
+
+    def speculate(self, item_id: int, task: asyncio.Task):
+        """Attach the precomputation for the item just served"""
+        self.cancel_speculation()
+        self.speculation_item_id = item_id
+        self.speculation = task
+
+    def take_speculation(self, item_id: int) -> Optional[asyncio.Task]:
+        """
+        Detach the pending speculation if it was computed for item_id.
+
+        Returns:
+            The task, or None (nothing pending, or it is for another item
+            and has been cancelled)
+        """
+        task = self.speculation
+        if task is None or self.speculation_item_id != item_id:
+            self.cancel_speculation()
+            return None
+
+        self.speculation_item_id = None
+        self.speculation = None
+        return task
+
+    def cancel_speculation(self):
+        """Drop the pending speculation"""
+        if self.speculation is not None:
+            self.speculation.cancel()
+        self.speculation_item_id = None
+        self.speculation = None
+
+
+class SessionStateCache:
+    """
+    Thread-safe LRU of SessionState with idle expiry.
+
+    Attributes:
+        ttl (float): Seconds of inactivity after which a state expires
+        max_entries (int): Maximum cached sessions before LRU eviction
+        hits, misses, expirations, evictions (int): Counters since creation
+    """
+
+    def __init__(self, ttl: float = 1800.0, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._states: "OrderedDict[int, SessionState]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def get(self, session_id: int) -> Optional[SessionState]:
+        """Cached state of a session, or None if missing or expired"""
+        now = time.monotonic()
+
+        with self._lock:
+            state = self._states.get(session_id)
+            if state is None:
+                self.misses += 1
+                return None
+
+            if now - state.touched > self.ttl:
+                del self._states[session_id]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            state.touched = now
+            self._states.move_to_end(session_id)
+            self.hits += 1
+            return state
+
+    def put(self, state: SessionState):
+        """Cache a session state, dropping expired and excess entries"""
+        now = time.monotonic()
+        state.touched = now
+
+        with self._lock:
+            self._states[state.session_id] = state
+            self._states.move_to_end(state.session_id)
+
+            # Oldest-touched entries sit at the front, so expiry stops at
+            # the first live one
+            while self._states:
+                oldest = next(iter(self._states.values()))
+                if now - oldest.touched <= self.ttl:
+                    break
+                self._states.popitem(last=False)
+                self.expirations += 1
+
+            while len(self._states) > self.max_entries:
+                self._states.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, session_id: int) -> Optional[SessionState]:
+        """Remove a session's state (e.g. after finalization)"""
+        with self._lock:
+            return self._states.pop(session_id, None)
+
+    def clear(self):
+        """Drop all states and reset counters"""
+        with self._lock:
+            self._states.clear()
+            self.hits = self.misses = self.expirations = self.evictions = 0
+
+    def stats(self) -> Dict:
+        """Counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._states),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'expirations': self.expirations,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
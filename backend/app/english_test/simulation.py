@@ -0,0 +1,555 @@
+"""
+Monte Carlo MST Simulation for English Adaptive Testing
+=======================================================
+
+Drives simulated examinees (simulees) with known θ through the real
+EnglishTestServiceV2 + IRTEngine, against an offline snapshot of the
+item bank, to evaluate the MST design:
+
+- Routing thresholds (route_to_stage2_panel / route_to_stage3_panel)
+- Stage lengths (STAGE_ITEMS)
+- Item exposure under Sympson-Hetter selection, and the K parameters
+  that keep it below a target rate (sympson_hetter_parameters)
+
+Work is split into chunks of simulees and spread over a process pool.
+Nothing here touches the database: the bank is exported once from
+`items` (export_item_bank) and loaded from JSON afterwards.
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .irt_engine import IRTEngine, StoppingRule
+
+
+# Item fields kept in a bank snapshot (enough for selection and formatting)
+SNAPSHOT_FIELDS = (
+    'id', 'stage', 'panel', 'form_id', 'status', 'domain', 'skill_tag',
+    'discrimination', 'difficulty', 'guessing', 'correct_answer',
+    'stem', 'options', 'passage_content', 'exposure_count', 'exposure_rate',
+    'frequency_band', 'is_pseudoword', 'band_size', 'source', 'sympson_hetter_k'
+)
+
+# True-θ bins used for conditional statistics
+CONDITIONAL_BINS = (-np.inf, -2.0, -1.0, 0.0, 1.0, 2.0, np.inf)
+
+
+# ===== Item Bank Snapshot =====
+
+def export_item_bank(db, path: str) -> int:
+    """
+    Export all active items (with passages) to a JSON snapshot.
+
+    Args:
+        db: EnglishTestDB instance
+        path: Output file path
+
+    Returns:
+        Number of exported items
+    """
+    from psycopg2.extras import RealDictCursor
+
+    conn = db._get_connection()
+    cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+    try:
+        cursor.execute("""
+            SELECT i.*, p.content as passage_content
+            FROM items i
+            LEFT JOIN passages p ON i.passage_id = p.id
+            WHERE i.status = 'active'
+            ORDER BY i.id;
+        """)
+        items = []
+        for row in cursor.fetchall():
+            item = {field: row.get(field) for field in SNAPSHOT_FIELDS}
+            if isinstance(item['options'], str):
+                item['options'] = json.loads(item['options'])
+            items.append(item)
+
+    finally:
+        cursor.close()
+        db._return_connection(conn)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'exported_at': datetime.now().isoformat(), 'items': items}, f, ensure_ascii=False)
+
+    return len(items)
+
+
+def load_item_bank(path: str) -> List[Dict]:
+    """Load the items of a snapshot written by export_item_bank()"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['items']
+
+
+class SnapshotDB:
+    """
+    In-memory stand-in for AsyncEnglishTestDB backed by an item bank snapshot.
+
+    Implements the subset of the AsyncEnglishTestDB API that
+    EnglishTestServiceV2 and ItemBankCache use, so the service's own
+    stage/panel logic runs unchanged during simulation.
+    """
+
+    def __init__(self, items: List[Dict]):
+        self.items = {}
+        for item in items:
+            item = dict(item)
+            item['a'] = item['discrimination']
+            item['b'] = item['difficulty']
+            item['c'] = item['guessing'] if item.get('guessing') is not None else 0.25
+            item['exposure_count'] = item.get('exposure_count') or 0
+            self.items[item['id']] = item
+
+        self.sessions: Dict[int, Dict] = {}
+        self.responses: Dict[int, List[Dict]] = {}
+
+    # ----- Sessions -----
+
+    async def create_session(self, user_id: str) -> Dict:
+        now = datetime.now()
+        session = {
+            'id': len(self.sessions) + 1,
+            'user_id': user_id,
+            'started_at': now,
+            'updated_at': now,
+            'completed_at': None,
+            'status': 'active',
+            'items_completed': 0,
+            'stage': 1,
+            'panel': 'routing',
+            'current_theta': None,
+            'current_se': None
+        }
+        self.sessions[session['id']] = session
+        self.responses[session['id']] = []
+        return dict(session)
+
+    async def get_session(self, session_id: int) -> Optional[Dict]:
+        session = self.sessions.get(session_id)
+        return dict(session) if session else None
+
+    async def update_session(self, session_id: int, updates: Dict) -> Dict:
+        session = self.sessions[session_id]
+        session.update(updates)
+        session['updated_at'] = datetime.now()
+        return dict(session)
+
+    async def finalize_session(self, session_id: int, final_results: Dict) -> Dict:
+        return await self.update_session(session_id, {'status': 'completed', 'completed_at': datetime.now()})
+
+    async def record_submission(
+        self,
+        session_id: int,
+        item_id: int,
+        selected_answer: str,
+        is_correct: bool,
+        stage: int,
+        item_order: int,
+        theta_estimate: float,
+        standard_error: float,
+        new_stage: int,
+        new_panel: str,
+        response_time: Optional[int] = None,
+        exposure_item_id: Optional[int] = None
+    ) -> Optional[Dict]:
+        session = self.sessions[session_id]
+        if session['items_completed'] != item_order - 1:
+            return None
+
+        await self.create_response(
+            session_id, item_id,
+            selected_answer=selected_answer, is_correct=is_correct,
+            stage=stage, item_order=item_order,
+            theta_estimate=theta_estimate, standard_error=standard_error,
+            response_time=response_time
+        )
+        if exposure_item_id is not None:
+            await self.increment_exposure(exposure_item_id)
+
+        return await self.update_session(session_id, {
+            'items_completed': item_order,
+            'current_theta': theta_estimate,
+            'current_se': standard_error,
+            'stage': new_stage,
+            'panel': new_panel
+        })
+
+    # ----- Items -----
+
+    async def get_item(self, item_id: int) -> Optional[Dict]:
+        item = self.items.get(item_id)
+        return dict(item) if item else None
+
+    async def get_items_for_selection(
+        self,
+        stage: int,
+        panel: str,
+        form_id: int = 1,
+        domain: Optional[str] = None,
+        excluded_ids: Optional[List[int]] = None
+    ) -> List[Dict]:
+        excluded = set(excluded_ids or ())
+        candidates = [
+            dict(item) for item in self.items.values()
+            if item['stage'] == stage
+            and item['panel'] == panel
+            and (item.get('form_id') or 1) == form_id
+            and (domain is None or item['domain'] == domain)
+            and item['id'] not in excluded
+        ]
+        candidates.sort(key=lambda item: item['exposure_count'])
+        return candidates
+
+    async def increment_exposure(self, item_id: int):
+        self.items[item_id]['exposure_count'] += 1
+
+    # ----- Item bank cache -----
+
+    async def get_active_items(self) -> List[Dict]:
+        return [dict(item) for item in self.items.values() if item.get('status', 'active') == 'active']
+
+    async def get_passages(self, passage_ids: List[int]) -> Dict[int, Dict]:
+        return {}
+
+    async def get_item_bank_version(self) -> Optional[int]:
+        return 0
+
+    # ----- Responses -----
+
+    async def create_response(self, session_id: int, item_id: int, **fields) -> Dict:
+        response = {'session_id': session_id, 'item_id': item_id, **fields}
+        self.responses[session_id].append(response)
+        return response
+
+    async def get_session_responses(self, session_id: int) -> List[Dict]:
+        joined = []
+        for response in self.responses[session_id]:
+            item = self.items[response['item_id']]
+            joined.append({
+                **response,
+                'discrimination': item['discrimination'],
+                'difficulty': item['difficulty'],
+                'guessing': item['c'],
+                'domain': item['domain'],
+                'frequency_band': item.get('frequency_band'),
+                'is_pseudoword': item.get('is_pseudoword'),
+                'band_size': item.get('band_size')
+            })
+        return joined
+
+    async def get_session_statistics(self, session_id: int) -> Dict:
+        responses = self.responses[session_id]
+        correct = sum(1 for r in responses if r['is_correct'])
+        return {
+            'total_items': len(responses),
+            'correct_count': correct,
+            'accuracy_percentage': round(correct / len(responses) * 100, 2) if responses else 0.0,
+            'avg_response_time': None
+        }
+
+
+# ===== Simulation =====
+
+def simulate_chunk(
+    items: List[Dict],
+    thetas: List[float],
+    seed: int,
+    stopping_rule: Optional[StoppingRule] = None
+) -> List[Dict]:
+    """
+    Run a chunk of simulees through the real service against a snapshot.
+
+    Runs in a worker process; each chunk gets its own SnapshotDB, so
+    exposure counts evolve per chunk as they would per server process.
+
+    Args:
+        items: Item bank snapshot
+        thetas: True θ of each simulee
+        seed: Seed for responses and Sympson-Hetter draws
+        stopping_rule: Termination policy (default: the service default)
+
+    Returns:
+        One result dict per simulee
+    """
+    return asyncio.run(_simulate_chunk(items, thetas, seed, stopping_rule))
+
+
+async def _simulate_chunk(
+    items: List[Dict],
+    thetas: List[float],
+    seed: int,
+    stopping_rule: Optional[StoppingRule]
+) -> List[Dict]:
+    from .item_cache import ItemBankCache
+    from .service_v2 import EnglishTestServiceV2
+
+    rng = np.random.default_rng(seed)
+    np.random.seed(seed % (2 ** 32))
+
+    db = SnapshotDB(items)
+    irt = IRTEngine()
+    service = EnglishTestServiceV2(
+        db=db,
+        irt_engine=irt,
+        ai_fallback=False,
+        stopping_rule=stopping_rule,
+        item_cache=ItemBankCache(db, irt),
+        # Simulees answer instantly; precomputing both outcomes would only
+        # double the work and shift the exposure-control random draws
+        speculate=False
+    )
+
+    results = []
+    for theta_true in thetas:
+        started = await service.start_session('simulee')
+        session_id = started['session_id']
+        item = started['first_item']
+
+        administered = []
+        routed = {}
+        stop_reason = None
+        while item is not None:
+            params = db.items[item['id']]
+            p_correct = irt.three_pl_probability(theta_true, params['a'], params['b'], params['c'])
+            if rng.random() < p_correct:
+                answer = params['correct_answer']
+            else:
+                answer = next(option for option in 'ABCD' if option != params['correct_answer'])
+
+            outcome = await service.submit_response(session_id, item['id'], answer)
+            administered.append(item['id'])
+            routed.setdefault(outcome['stage'], outcome['panel'])
+
+            if outcome['test_completed']:
+                stop_reason = outcome['stop_reason']
+                break
+            item = outcome['next_item']
+
+        final = await service.finalize_session(session_id)
+        results.append({
+            'theta_true': float(theta_true),
+            'theta_hat': float(final['final_theta']),
+            'se': float(final['standard_error']),
+            'n_items': len(administered),
+            'stage2_panel': routed.get(2),
+            'stage3_panel': routed.get(3),
+            'stop_reason': stop_reason,
+            'item_ids': administered
+        })
+
+    return results
+
+
+def summarize(results: List[Dict], irt: Optional[IRTEngine] = None) -> Dict:
+    """
+    Aggregate simulee results into recovery, routing and exposure metrics.
+
+    Args:
+        results: Output of simulate_chunk (concatenated)
+        irt: Engine supplying the routing rules
+
+    Returns:
+        Report dictionary
+    """
+    irt = irt or IRTEngine()
+
+    theta_true = np.array([r['theta_true'] for r in results])
+    theta_hat = np.array([r['theta_hat'] for r in results])
+    se = np.array([r['se'] for r in results])
+    error = theta_hat - theta_true
+
+    # Conditional statistics by true-θ bin
+    conditional = []
+    bins = np.digitize(theta_true, CONDITIONAL_BINS[1:-1])
+    for b in range(len(CONDITIONAL_BINS) - 1):
+        in_bin = bins == b
+        if not in_bin.any():
+            continue
+        conditional.append({
+            'theta_range': [float(CONDITIONAL_BINS[b]), float(CONDITIONAL_BINS[b + 1])],
+            'count': int(in_bin.sum()),
+            'bias': round(float(error[in_bin].mean()), 4),
+            'rmse': round(float(np.sqrt((error[in_bin] ** 2).mean())), 4),
+            'mean_se': round(float(se[in_bin].mean()), 4)
+        })
+
+    # Routing accuracy: routed panel vs the panel true θ would be routed to
+    stage2_hits = stage3_hits = 0
+    for r in results:
+        ideal_stage2 = irt.route_to_stage2_panel(r['theta_true'])
+        stage2_hits += r['stage2_panel'] == ideal_stage2
+        stage3_hits += r['stage3_panel'] == irt.route_to_stage3_panel(r['theta_true'], ideal_stage2)
+
+    # Exposure: fraction of simulees who saw each item
+    counts: Dict[int, int] = {}
+    for r in results:
+        for item_id in r['item_ids']:
+            counts[item_id] = counts.get(item_id, 0) + 1
+    rates = np.array(list(counts.values()), dtype=float) / len(results)
+
+    stop_reasons: Dict[str, int] = {}
+    for r in results:
+        reason = r.get('stop_reason') or 'pool_exhausted'
+        stop_reasons[reason] = stop_reasons.get(reason, 0) + 1
+
+    return {
+        'n_simulees': len(results),
+        'bias': round(float(error.mean()), 4),
+        'rmse': round(float(np.sqrt((error ** 2).mean())), 4),
+        'mean_se': round(float(se.mean()), 4),
+        'mean_items': round(float(np.mean([r['n_items'] for r in results])), 2),
+        'stop_reasons': stop_reasons,
+        'conditional': conditional,
+        'routing_accuracy': {
+            'stage2': round(stage2_hits / len(results), 4),
+            'stage3': round(stage3_hits / len(results), 4)
+        },
+        'exposure': {
+            'items_used': len(counts),
+            'max_rate': round(float(rates.max()), 4) if len(rates) else 0.0,
+            'mean_rate': round(float(rates.mean()), 4) if len(rates) else 0.0,
+            'items_over_0.25': int((rates > 0.25).sum())
+        }
+    }
+
+
+def run_simulation(
+    items: List[Dict],
+    n_simulees: int = 1000,
+    theta_mean: float = 0.0,
+    theta_sd: float = 1.0,
+    workers: Optional[int] = None,
+    chunk_size: int = 100,
+    seed: int = 2025,
+    stopping_rule: Optional[StoppingRule] = None
+) -> Dict:
+    """
+    Simulate n_simulees with θ ~ N(theta_mean, theta_sd) over a process pool.
+
+    Args:
+        items: Item bank snapshot (load_item_bank)
+        n_simulees: Number of simulated examinees
+        theta_mean: Mean of the generating θ distribution
+        theta_sd: SD of the generating θ distribution
+        workers: Worker processes (default: CPU count; 1 runs inline)
+        chunk_size: Simulees per task
+        seed: Master seed
+        stopping_rule: Termination policy (default: the service default)
+
+    Returns:
+        Report dictionary (see summarize) plus timing
+    """
+    started = time.perf_counter()
+    results = _simulate_population(
+        items, n_simulees, theta_mean, theta_sd, workers, chunk_size, seed, stopping_rule
+    )
+    elapsed = time.perf_counter() - started
+
+    report = summarize(results)
+    report['elapsed_seconds'] = round(elapsed, 2)
+    report['simulees_per_second'] = round(n_simulees / elapsed, 1) if elapsed > 0 else None
+    return report
+
+
+def _simulate_population(
+    items: List[Dict],
+    n_simulees: int,
+    theta_mean: float,
+    theta_sd: float,
+    workers: Optional[int],
+    chunk_size: int,
+    seed: int,
+    stopping_rule: Optional[StoppingRule] = None
+) -> List[Dict]:
+    """Draw θ ~ N(theta_mean, theta_sd) and simulate in chunks (see run_simulation)"""
+    rng = np.random.default_rng(seed)
+    thetas = rng.normal(theta_mean, theta_sd, size=n_simulees)
+
+    chunks = [thetas[i:i + chunk_size].tolist() for i in range(0, n_simulees, chunk_size)]
+    seeds = [seed + 1 + i for i in range(len(chunks))]
+
+    results: List[Dict] = []
+
+    if workers == 1:
+        for chunk, chunk_seed in zip(chunks, seeds):
+            results.extend(simulate_chunk(items, chunk, chunk_seed, stopping_rule))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunk_results_iter = executor.map(
+                simulate_chunk, [items] * len(chunks), chunks, seeds, [stopping_rule] * len(chunks)
+            )
+            for chunk_results in chunk_results_iter:
+                results.extend(chunk_results)
+
+    return results
+
+
+# ===== Sympson-Hetter Exposure Parameters =====
+
+def sympson_hetter_parameters(
+    items: List[Dict],
+    r_max: float = 0.25,
+    n_simulees: int = 2000,
+    iterations: int = 6,
+    theta_mean: float = 0.0,
+    theta_sd: float = 1.0,
+    workers: Optional[int] = None,
+    chunk_size: int = 100,
+    seed: int = 2025,
+    log=print
+) -> Dict[int, float]:
+    """
+    Compute Sympson-Hetter K parameters by iterated simulation.
+
+    Each iteration simulates the population with the current K, estimates
+    each item's selection rate P(S) = P(A) / K from its administration
+    rate P(A), and sets K = 1 if P(S) <= r_max, else r_max / P(S).
+
+    Args:
+        items: Item bank snapshot (load_item_bank); not modified
+        r_max: Target maximum exposure rate
+        n_simulees: Simulees per iteration
+        iterations: Number of adjustment rounds
+        theta_mean: Mean of the generating θ distribution
+        theta_sd: SD of the generating θ distribution
+        workers: Worker processes (default: CPU count; 1 runs inline)
+        chunk_size: Simulees per task
+        seed: Master seed
+        log: Progress callback (None to silence)
+
+    Returns:
+        Mapping of item ID to K
+    """
+    k = {item['id']: 1.0 for item in items}
+
+    for iteration in range(iterations):
+        current = [{**item, 'sympson_hetter_k': k[item['id']]} for item in items]
+        results = _simulate_population(
+            current, n_simulees, theta_mean, theta_sd, workers, chunk_size, seed + iteration
+        )
+
+        administered: Dict[int, int] = {}
+        for r in results:
+            for item_id in r['item_ids']:
+                administered[item_id] = administered.get(item_id, 0) + 1
+
+        max_rate = 0.0
+        for item_id in k:
+            p_administered = administered.get(item_id, 0) / n_simulees
+            p_selected = p_administered / k[item_id]
+            k[item_id] = 1.0 if p_selected <= r_max else r_max / p_selected
+            max_rate = max(max_rate, p_administered)
+
+        if log:
+            restricted = sum(1 for value in k.values() if value < 1.0)
+            log(f"  iteration {iteration + 1}: max exposure {max_rate:.3f}, {restricted} items with K < 1")
+
+    return {item_id: round(value, 4) for item_id, value in k.items()}
@@ -0,0 +1,135 @@
+"""
+Vision WebSocket 바이너리 프레임 프로토콜
+
+JSON 메시지(`data:image/jpeg;base64,...`)는 base64로 대역폭이 ~33% 늘고
+json.loads → split → b64decode 단계마다 프레임 전체가 복사된다.
+바이너리 메시지는 고정 헤더 + JPEG 원본 바이트로 구성되며, 수신한 버퍼를
+memoryview로 감싸 헤더는 struct.unpack_from, JPEG는 np.frombuffer로
+복사 없이 cv2.imdecode에 넘긴다.
+
+v1 레이아웃 (little-endian, 20 bytes + JPEG):
+
+    offset  size  field
+    0       1     version        (= 1)
+    1       1     flags          (bit 0: enableDebug)
+    2       2     header_length  (JPEG 시작 위치; 이후 버전이 필드를 덧붙여도
+                                  v1 서버는 이 길이만큼 건너뛴다)
+    4       8     timestamp      (float64, ms since epoch - JS Date.now())
+    12      2     screenWidth
+    14      2     screenHeight
+    16      2     frameWidth     (0 = screenWidth)
+    18      2     frameHeight    (0 = screenHeight)
+    20      ...   JPEG bytes
+
+텍스트(JSON) 메시지는 기존 클라이언트를 위해 그대로 지원한다.
+"""
+import base64
+import struct
+from typing import Dict, NamedTuple, Tuple
+
+import numpy as np
+
+PROTOCOL_VERSION = 1
+SUPPORTED_VERSIONS = (1,)
+
+FLAG_DEBUG = 0x01
+
+_HEADER_V1 = struct.Struct('<BBHdHHHH')
+HEADER_SIZE = _HEADER_V1.size  # 20
+
+
+class FrameProtocolError(ValueError):
+    """잘못된 프레임 메시지 (클라이언트에 error로 응답)"""
+
+
+class FrameMeta(NamedTuple):
+    """프레임 메타데이터 (JSON/바이너리 공통)"""
+    timestamp: float
+    screen_width: int
+    screen_height: int
+    frame_width: int
+    frame_height: int
+    enable_debug: bool
+
+
+def decode_binary_frame(data) -> Tuple[FrameMeta, np.ndarray]:
+    """
+    바이너리 프레임 디코딩 (복사 없음)
+
+    Args:
+        data: bytes / bytearray / memoryview
+
+    Returns:
+        (메타데이터, JPEG 바이트를 가리키는 uint8 배열 - data의 view)
+    """
+    view = memoryview(data)
+    if len(view) < HEADER_SIZE:
+        raise FrameProtocolError(f"Binary frame too short ({len(view)} bytes)")
+
+    version = view[0]
+    if version not in SUPPORTED_VERSIONS:
+        raise FrameProtocolError(
+            f"Unsupported frame protocol version {version} (supported: {list(SUPPORTED_VERSIONS)})"
+        )
+
+    (_, flags, header_length, timestamp,
+     screen_width, screen_height, frame_width, frame_height) = _HEADER_V1.unpack_from(view)
+
+    if header_length < HEADER_SIZE or header_length >= len(view):
+        raise FrameProtocolError(f"Invalid header length {header_length}")
+    if not screen_width or not screen_height:
+        raise FrameProtocolError("Screen size missing in frame header")
+
+    meta = FrameMeta(
+        # Date.now()는 정수 ms이므로 JSON 응답에서도 정수로 되돌린다
+        timestamp=int(timestamp) if timestamp.is_integer() else timestamp,
+        screen_width=screen_width,
+        screen_height=screen_height,
+        frame_width=frame_width or screen_width,
+        frame_height=frame_height or screen_height,
+        enable_debug=bool(flags & FLAG_DEBUG)
+    )
+    return meta, np.frombuffer(view, dtype=np.uint8, offset=header_length)
+
+
+def decode_json_frame(frame_data: Dict) -> Tuple[FrameMeta, np.ndarray]:
+    """
+    기존 JSON 프레임 디코딩 (하위 호환)
+
+    Args:
+        frame_data: {"image": "data:image/jpeg;base64,...", "screenWidth", "screenHeight",
+                     "frameWidth"?, "frameHeight"?, "enableDebug"?, "timestamp"}
+    """
+    try:
+        image = frame_data['image']
+        # data URL 접두어가 있으면 건너뛰고 나머지만 디코딩
+        comma = image.find(',', 0, 64)
+        jpeg = base64.b64decode(image[comma + 1:] if comma >= 0 else image)
+
+        meta = FrameMeta(
+            timestamp=frame_data['timestamp'],
+            screen_width=frame_data['screenWidth'],
+            screen_height=frame_data['screenHeight'],
+            frame_width=frame_data.get('frameWidth', frame_data['screenWidth']),
+            frame_height=frame_data.get('frameHeight', frame_data['screenHeight']),
+            enable_debug=bool(frame_data.get('enableDebug', False))
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        raise FrameProtocolError(f"Invalid JSON frame: {e}") from e
+
+    return meta, np.frombuffer(jpeg, dtype=np.uint8)
+
+
+def encode_binary_frame(jpeg: bytes, meta: FrameMeta) -> bytes:
+    """바이너리 프레임 인코딩 (테스트 / Python 클라이언트용)"""
+    header = _HEADER_V1.pack(
+        PROTOCOL_VERSION,
+        FLAG_DEBUG if meta.enable_debug else 0,
+        HEADER_SIZE,
+        float(meta.timestamp),
+        meta.screen_width,
+        meta.screen_height,
+        meta.frame_width,
+        meta.frame_height
+    )
+    return header + bytes(jpeg)
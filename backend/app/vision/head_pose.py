@@ -1,6 +1,21 @@
 """
 3D 헤드 포즈 추정 (MediaPipe Face Mesh 기반)
 JEO의 3D gaze ray computation 방식 적용
+
+ROI 추적 (선택, 기본 꺼짐): HD 카메라 프레임 전체를 매번 RGB 변환해
+FaceMesh에 넣는 대신, 이전 프레임 얼굴 bounding box + 여백을 정사각형으로
+잘라 고정 크기(inference_size)로 축소한 뒤 추론하고 랜드마크를 전체 프레임
+좌표로 되돌린다. 얼굴을 놓치면 같은 프레임을 전체 해상도로 다시 검출한다.
+이후 코드(PnP, 눈 영역, 디버그 오버레이)는 항상 전체 프레임 기준 정규화
+좌표를 받는다.
+
+FaceMesh는 video 모드에서 이전 프레임 랜드마크로 만든 자체 ROI(그 이미지
+기준 정규화 좌표)를 다음 프레임에 쓴다. 잘라낸 영역과 전체 프레임을 한
+인스턴스에 번갈아 넣으면 그 ROI가 다른 좌표계로 넘어가므로, ROI 경로는
+추적 상태가 없는 별도 인스턴스(static_image_mode=True)를 쓴다. video 모드도
+내부적으로 얼굴을 잘라 낮은 해상도로 추론하므로 이득은 주로 색 변환
+크기뿐일 수 있다 - 켜기 전에 scripts/benchmark_head_pose.py로 전체 프레임
+경로와 fps를 비교한다 (VISION_ROI_TRACKING=1).
 """
 import mediapipe as mp
 import numpy as np
@@ -8,9 +23,25 @@ import cv2
 from typing import Tuple, Optional, Dict
 
 class HeadPoseEstimator:
-    """3D 헤드 포즈 추정 (pitch, yaw, roll)"""
+    """
+    3D 헤드 포즈 추정 (pitch, yaw, roll)
+
+    Attributes:
+        roi_tracking (bool): 이전 얼굴 영역만 잘라 추론 (False = 매 프레임 전체)
+        inference_size (int): ROI를 축소할 정사각형 크기 (px)
+        roi_margin (float): 얼굴 bounding box 각 변에 더할 여백 (얼굴 크기 비율)
+    """
 
-    def __init__(self):
+    INFERENCE_SIZE = 256
+    ROI_MARGIN = 0.3
+    MIN_ROI_SIZE = 96
+
+    def __init__(
+        self,
+        roi_tracking: bool = False,
+        inference_size: int = INFERENCE_SIZE,
+        roi_margin: float = ROI_MARGIN
+    ):
         self.mp_face_mesh = mp.solutions.face_mesh
         self.face_mesh = self.mp_face_mesh.FaceMesh(
             max_num_faces=1,
@@ -19,6 +50,17 @@ class HeadPoseEstimator:
             min_tracking_confidence=0.3
         )
 
+        # ROI 경로 전용 FaceMesh: 잘라낸 영역이 프레임마다 움직이므로
+        # 프레임 간 추적 상태 없이 매번 검출한다
+        self.roi_face_mesh = None
+        if roi_tracking:
+            self.roi_face_mesh = self.mp_face_mesh.FaceMesh(
+                static_image_mode=True,
+                max_num_faces=1,
+                refine_landmarks=True,
+                min_detection_confidence=0.3
+            )
+
         # 카메라 매트릭스 (기본값, 나중에 캘리브레이션으로 개선)
         self.camera_matrix = None
         self.dist_coeffs = np.zeros((4, 1))
@@ -26,6 +68,19 @@ class HeadPoseEstimator:
         # 디버그용: 마지막 얼굴 랜드마크 저장
         self.last_face_landmarks = None
 
+        # ROI 추적 상태: 다음 프레임에서 잘라낼 영역 (x0, y0, side), 얼굴을 놓치면 None
+        self.roi_tracking = roi_tracking
+        self.inference_size = inference_size
+        self.roi_margin = roi_margin
+        self.roi: Optional[Tuple[int, int, int]] = None
+        self.last_roi: Optional[Tuple[int, int, int]] = None  # 디버그용: 이번 프레임에 사용한 영역
+        self._frame_shape: Optional[Tuple[int, int]] = None  # roi를 계산한 프레임의 (h, w)
+
+        # 지표: ROI 추론 / 전체 프레임 추론 / ROI 추적 실패 후 재검출 횟수
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.redetections = 0
+
     def estimate(self, frame: np.ndarray) -> Optional[Dict]:
         """
         프레임에서 헤드 포즈 추정
@@ -38,20 +93,37 @@ class HeadPoseEstimator:
                 "translation": (x, y, z)
             }
         """
-        # MediaPipe 처리
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.face_mesh.process(rgb_frame)
+        h, w = frame.shape[:2]
 
-        if not results.multi_face_landmarks:
+        # MediaPipe 처리: 이전 얼굴 영역 → 실패하면 전체 프레임 재검출
+        face_landmarks = None
+        self.last_roi = None
+        if (h, w) != self._frame_shape:
+            # 카메라 해상도가 바뀜 (adaptive resolution) - 이전 좌표의 ROI는
+            # 프레임 안에 들어가더라도 얼굴 위치와 맞지 않는다
+            self.roi = None
+            self._frame_shape = (h, w)
+
+        if self.roi_tracking and self.roi is not None:
+            face_landmarks = self._process_roi(frame, self.roi)
+            if face_landmarks is None:
+                self.redetections += 1
+            else:
+                self.last_roi = self.roi
+
+        if face_landmarks is None:
+            face_landmarks = self._process_full(frame)
+
+        if face_landmarks is None:
             self.last_face_landmarks = None
+            self.roi = None
             return None
 
-        # 첫 번째 얼굴 사용
-        face_landmarks = results.multi_face_landmarks[0]
         self.last_face_landmarks = face_landmarks  # 디버그용 저장
+        if self.roi_tracking:
+            self.roi = self._next_roi(face_landmarks, w, h)
 
         # 카메라 매트릭스 초기화 (처음 한번)
-        h, w = frame.shape[:2]
         if self.camera_matrix is None:
             focal_length = w
             center = (w / 2, h / 2)
@@ -64,6 +136,68 @@ class HeadPoseEstimator:
         # PnP로 3D 포즈 계산
         return self._solve_pnp(face_landmarks, w, h)
 
+    def _process_full(self, frame: np.ndarray):
+        """전체 프레임 FaceMesh 추론 (첫 번째 얼굴 랜드마크 또는 None)"""
+        self.full_frames += 1
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        results = self.face_mesh.process(rgb_frame)
+        if not results.multi_face_landmarks:
+            return None
+        return results.multi_face_landmarks[0]
+
+    def _process_roi(self, frame: np.ndarray, roi: Tuple[int, int, int]):
+        """
+        얼굴 영역만 고정 크기로 축소해 FaceMesh 추론
+
+        Returns:
+            전체 프레임 기준 정규화 좌표로 변환한 랜드마크 (얼굴이 없으면 None)
+        """
+        self.roi_frames += 1
+        x0, y0, side = roi
+        h, w = frame.shape[:2]
+
+        size = self.inference_size
+        crop = frame[y0:y0 + side, x0:x0 + side]
+        interpolation = cv2.INTER_AREA if side > size else cv2.INTER_LINEAR
+        # 축소 후 색 변환 (변환할 픽셀 수가 side² → size²)
+        rgb_crop = cv2.cvtColor(cv2.resize(crop, (size, size), interpolation=interpolation), cv2.COLOR_BGR2RGB)
+
+        results = self.roi_face_mesh.process(rgb_crop)
+        if not results.multi_face_landmarks:
+            return None
+
+        # ROI 기준 정규화 좌표 → 전체 프레임 기준 (z는 x와 같은 스케일)
+        face_landmarks = results.multi_face_landmarks[0]
+        sx, sy = side / w, side / h
+        ox, oy = x0 / w, y0 / h
+        for lm in face_landmarks.landmark:
+            lm.x = ox + lm.x * sx
+            lm.y = oy + lm.y * sy
+            lm.z = lm.z * sx
+        return face_landmarks
+
+    def _next_roi(self, face_landmarks, width: int, height: int) -> Tuple[int, int, int]:
+        """랜드마크 bounding box + 여백의 정사각형 영역 (프레임 안으로 이동)"""
+        xs = [lm.x for lm in face_landmarks.landmark]
+        ys = [lm.y for lm in face_landmarks.landmark]
+        x_min, x_max = min(xs) * width, max(xs) * width
+        y_min, y_max = min(ys) * height, max(ys) * height
+
+        face_size = max(x_max - x_min, y_max - y_min)
+        side = int(face_size * (1 + 2 * self.roi_margin))
+        side = max(min(side, width, height), min(self.MIN_ROI_SIZE, width, height))
+
+        cx, cy = (x_min + x_max) / 2, (y_min + y_max) / 2
+        x0 = int(min(max(cx - side / 2, 0), width - side))
+        y0 = int(min(max(cy - side / 2, 0), height - side))
+        return (x0, y0, side)
+
+    def reset_tracking(self):
+        """ROI 추적 초기화 (다음 프레임은 전체 프레임에서 검출)"""
+        self.roi = None
+        self.last_roi = None
+        self._frame_shape = None
+
     def _solve_pnp(
         self, face_landmarks, width: int, height: int
     ) -> Dict:
@@ -124,3 +258,9 @@ class HeadPoseEstimator:
     def get_last_landmarks(self):
         """디버그용: 마지막으로 감지된 얼굴 랜드마크 반환"""
         return self.last_face_landmarks
+
+    def close(self):
+        """FaceMesh 그래프 해제"""
+        self.face_mesh.close()
+        if self.roi_face_mesh is not None:
+            self.roi_face_mesh.close()
@@ -0,0 +1,74 @@
+"""
+세션별 최신 프레임 우선(latest-frame-wins) 메일박스
+
+WebSocket 수신 루프가 프레임마다 처리를 await하면 처리 속도가 클라이언트
+프레임 속도보다 느릴 때 프레임이 소켓/큐에 쌓이고 시선 지연이 끝없이
+늘어난다. FrameMailbox는 슬롯이 하나뿐이라 처리 중에 새 프레임이 오면
+아직 처리하지 않은 이전 프레임을 버린다. 수신 루프는 put()만 하고,
+세션마다 하나인 처리 태스크가 get()으로 항상 가장 최근 프레임을 받는다 -
+지연은 최대 (처리 시간 + 프레임 간격)으로 유지된다.
+"""
+import asyncio
+from typing import Any, Dict, Optional
+
+
+class FrameMailbox:
+    """
+    단일 슬롯 메일박스 (하나의 이벤트 루프 안에서 사용)
+
+    Attributes:
+        received (int): put()된 프레임 수
+        processed (int): get()으로 꺼낸 프레임 수
+        dropped (int): 처리되기 전에 새 프레임으로 교체된 프레임 수
+    """
+
+    def __init__(self):
+        self._slot: Optional[Any] = None
+        self._ready = asyncio.Event()
+        self._closed = False
+
+        self.received = 0
+        self.processed = 0
+        self.dropped = 0
+
+    def put(self, frame: Any) -> bool:
+        """
+        프레임 넣기 (기다리지 않음)
+
+        Returns:
+            이전 프레임을 버렸으면 True
+        """
+        replaced = self._slot is not None
+        if replaced:
+            self.dropped += 1
+        self._slot = frame
+        self.received += 1
+        self._ready.set()
+        return replaced
+
+    async def get(self) -> Optional[Any]:
+        """가장 최근 프레임 (close() 이후에는 None)"""
+        while self._slot is None:
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+
+        frame, self._slot = self._slot, None
+        self.processed += 1
+        return frame
+
+    def close(self):
+        """처리 태스크 종료 (대기 중인 프레임은 버림)"""
+        self._closed = True
+        if self._slot is not None:
+            self._slot = None
+            self.dropped += 1
+        self._ready.set()
+
+    def stats(self) -> Dict:
+        return {
+            'received': self.received,
+            'processed': self.processed,
+            'dropped': self.dropped
+        }
@@ -3,13 +3,22 @@ Vision 추적 API 라우터
 """
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from typing import Dict, List
-import json
-from .websocket import vision_ws_handler
+from .websocket import vision_ws_handler, vision_worker_pool
 from .database import create_vision_session, save_calibration, get_all_vision_sessions
 from .models import CreateVisionSessionRequest, VisionSessionResponse, CalibrationRequest
 
 router = APIRouter()
 
+@router.on_event("startup")
+async def startup():
+    """Vision 워커 프로세스 시작 (MediaPipe 로딩을 첫 프레임 전에 끝냄)"""
+    vision_worker_pool.start()
+
+@router.on_event("shutdown")
+async def shutdown():
+    """Vision 워커 프로세스 종료"""
+    vision_worker_pool.stop()
+
 @router.post("/sessions", response_model=VisionSessionResponse)
 async def start_vision_session(request: CreateVisionSessionRequest):
     """Vision 테스트 세션 시작"""
@@ -33,12 +42,16 @@ async def vision_tracking_websocket(websocket: WebSocket, session_id: str):
 
     try:
         while True:
-            # 클라이언트로부터 프레임 수신
-            data = await websocket.receive_text()
-            frame_data = json.loads(data)
+            # 클라이언트로부터 프레임 수신: 바이너리(헤더 + JPEG) 또는 기존 JSON 텍스트
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
 
-            # 시선 추적 처리 및 응답
-            await vision_ws_handler.handle_frame(session_id, frame_data)
+            # 세션 메일박스에 넣기만 한다 - 처리는 세션 처리 태스크가 최신 프레임만 골라서 한다
+            if message.get("bytes") is not None:
+                vision_ws_handler.enqueue(session_id, message["bytes"])
+            elif message.get("text") is not None:
+                vision_ws_handler.enqueue(session_id, message["text"])
 
     except WebSocketDisconnect:
         vision_ws_handler.disconnect(session_id)
@@ -88,13 +101,18 @@ async def train_session_calibration(
     calibration_points = request.get("points", [])
 
     # Train calibration corrector on the VisionTracker for this session
-    metrics = vision_ws_handler.train_calibration(session_id, calibration_points)
+    metrics = await vision_ws_handler.train_calibration(session_id, calibration_points)
 
     return {
         "status": "success",
         "metrics": metrics
     }
 
+@router.get("/workers")
+async def get_vision_workers():
+    """Vision 워커 풀 및 워커별 지표 (세션 수, 처리 프레임, 오류, 처리 시간)"""
+    return vision_worker_pool.stats()
+
 @router.get("/test")
 async def test_vision_module():
     """Vision 모듈 테스트 엔드포인트"""
@@ -18,9 +18,9 @@ class VisionTracker:
     LEFT_IRIS_CENTER = 468  # MediaPipe iris landmark (refine_landmarks=True)
     RIGHT_IRIS_CENTER = 473
 
-    def __init__(self):
+    def __init__(self, roi_tracking: bool = False):
         self.pupil_detector = OrloskyPupilDetector()
-        self.head_pose_estimator = HeadPoseEstimator()
+        self.head_pose_estimator = HeadPoseEstimator(roi_tracking=roi_tracking)
         self.calibration_corrector = CalibrationCorrector()
 
         # 3D 눈 모델 (mm 단위, 얼굴 중심 기준)
@@ -333,6 +333,7 @@ class VisionTracker:
         - 청록색 시선 광선 (gaze ray)
         - 노란색 화면 시선점
         - 초록색 시선 방향 십자선
+        - 보라색 FaceMesh 추론 영역 (ROI 추적 중일 때)
         """
         debug_frame = frame.copy()
         h, w = frame.shape[:2]
@@ -344,6 +345,12 @@ class VisionTracker:
             )
             return debug_frame
 
+        # 0. FaceMesh 추론 영역 (보라색, ROI 추적 중일 때만)
+        roi = self.head_pose_estimator.last_roi
+        if roi:
+            x0, y0, side = roi
+            cv2.rectangle(debug_frame, (x0, y0), (x0 + side, y0 + side), (255, 0, 255), 1)
+
         # 1. MediaPipe 얼굴 랜드마크 (초록색 점)
         landmarks = self.head_pose_estimator.get_last_landmarks()
         if landmarks:
@@ -472,3 +479,7 @@ class VisionTracker:
     def reset_calibration(self):
         """캘리브레이션 리셋"""
         self.calibration_corrector.reset()
+
+    def close(self):
+        """MediaPipe 리소스 해제 (TrackerPool에서 반납 시 호출)"""
+        self.head_pose_estimator.close()
@@ -0,0 +1,177 @@
+"""
+세션별 VisionTracker 풀
+
+VisionTracker는 FaceMesh 그래프(프레임 간 랜드마크 추적 상태)와
+CalibrationCorrector(개인별 보정)를 가지므로 세션끼리 공유하면 한 학생의
+추적 상태와 캘리브레이션이 다른 학생 프레임에 섞인다. TrackerPool은
+세션마다 트래커를 하나씩 대여한다.
+
+- 대여(lease): 세션의 첫 프레임/캘리브레이션 때 미리 만들어 둔 트래커를
+  배정한다 - MediaPipe 그래프 생성 비용을 첫 프레임에서 내지 않는다
+- LRU 상한: 대여 중인 트래커가 max_sessions를 넘으면 가장 오래 사용하지
+  않은 세션의 트래커를 닫는다 (그 세션은 다음 프레임에 새 트래커를 받고
+  캘리브레이션을 다시 해야 한다)
+- 유휴 축출: idle_timeout 동안 프레임이 없는 세션의 트래커를 닫는다
+  (연결이 끊긴 세션을 release 없이 정리)
+- 축출 보고: 축출된 세션이 다시 대여하면 take_reset()이 한 번 True를
+  돌려준다 - 호출 측이 클라이언트에 재캘리브레이션을 요청한다
+- 반납한 트래커는 재사용하지 않는다 - FaceMesh 추적 상태가 다음 세션으로
+  넘어가지 않도록 닫고, 예비 트래커는 항상 새로 만든다
+
+워커 프로세스(workers.py) 안에서 단일 스레드로 사용한다.
+"""
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+# 축출 기록을 보관할 최대 세션 수 (다시 오지 않는 세션 기록이 쌓이지 않도록)
+MAX_RESET_RECORDS = 1024
+
+
+class TrackerPool:
+    """
+    세션별 트래커 대여 풀
+
+    Attributes:
+        max_sessions (int): 동시에 대여할 수 있는 최대 트래커 수 (LRU 상한)
+        idle_timeout (float): 이 시간(초) 동안 사용하지 않은 대여 트래커 축출
+        prewarm (int): 미리 만들어 둘 예비 트래커 수
+    """
+
+    def __init__(
+        self,
+        factory: Callable,
+        max_sessions: int = 16,
+        idle_timeout: float = 300.0,
+        prewarm: int = 1
+    ):
+        self.factory = factory
+        self.max_sessions = max(1, max_sessions)
+        self.idle_timeout = idle_timeout
+        self.prewarm = max(0, prewarm)
+
+        # session_id -> (tracker, 마지막 사용 시각); 오래된 순서
+        self._leases: 'OrderedDict[str, list]' = OrderedDict()
+        self._spares: List = []
+        # 축출되어 트래커(캘리브레이션)를 잃은 세션; 오래된 순서
+        self._reset: 'OrderedDict[str, None]' = OrderedDict()
+
+        self.created = 0
+        self.leased = 0
+        self.cold_leases = 0
+        self.evicted_idle = 0
+        self.evicted_lru = 0
+
+    def lease(self, session_id: str):
+        """세션의 트래커 (없으면 예비 트래커 배정, 예비가 없으면 생성)"""
+        entry = self._leases.get(session_id)
+        now = time.monotonic()
+        if entry is not None:
+            entry[1] = now
+            self._leases.move_to_end(session_id)
+            return entry[0]
+
+        while len(self._leases) >= self.max_sessions:
+            evicted, (tracker, _) = self._leases.popitem(last=False)
+            self._close(tracker)
+            self._mark_reset(evicted)
+            self.evicted_lru += 1
+            print(f"⚠️ Tracker pool full ({self.max_sessions}); evicted session {evicted}")
+
+        if self._spares:
+            tracker = self._spares.pop()
+        else:
+            tracker = self._create()
+            self.cold_leases += 1
+
+        self._leases[session_id] = [tracker, now]
+        self.leased += 1
+        return tracker
+
+    def take_reset(self, session_id: str) -> bool:
+        """
+        세션의 트래커가 지난 대여 이후 축출되었는지 (한 번만 True)
+
+        lease() 전에 호출한다 - lease()는 다른 세션만 축출한다.
+        """
+        if session_id not in self._reset:
+            return False
+        del self._reset[session_id]
+        return True
+
+    def release(self, session_id: str) -> bool:
+        """세션 종료: 트래커 반납 (닫음)"""
+        self._reset.pop(session_id, None)
+        entry = self._leases.pop(session_id, None)
+        if entry is None:
+            return False
+        self._close(entry[0])
+        return True
+
+    def evict_idle(self) -> int:
+        """idle_timeout을 넘긴 대여 트래커 축출"""
+        deadline = time.monotonic() - self.idle_timeout
+        evicted = 0
+        # 오래된 순서이므로 첫 활성 세션에서 멈춘다
+        while self._leases:
+            session_id, (tracker, last_used) = next(iter(self._leases.items()))
+            if last_used > deadline:
+                break
+            del self._leases[session_id]
+            self._close(tracker)
+            self._mark_reset(session_id)
+            evicted += 1
+
+        self.evicted_idle += evicted
+        return evicted
+
+    def fill(self) -> int:
+        """예비 트래커를 prewarm 개수까지 생성"""
+        created = 0
+        while len(self._spares) < self.prewarm:
+            self._spares.append(self._create())
+            created += 1
+        return created
+
+    def close(self):
+        """모든 트래커 닫기"""
+        for tracker, _ in self._leases.values():
+            self._close(tracker)
+        for tracker in self._spares:
+            self._close(tracker)
+        self._leases.clear()
+        self._spares = []
+        self._reset.clear()
+
+    def _mark_reset(self, session_id: str):
+        self._reset[session_id] = None
+        self._reset.move_to_end(session_id)
+        while len(self._reset) > MAX_RESET_RECORDS:
+            self._reset.popitem(last=False)
+
+    def _create(self):
+        tracker = self.factory()
+        self.created += 1
+        return tracker
+
+    @staticmethod
+    def _close(tracker):
+        close = getattr(tracker, 'close', None)
+        if close is not None:
+            try:
+                close()
+            except Exception as e:
+                print(f"⚠️ Tracker close failed: {e}")
+
+    def stats(self) -> Dict:
+        """풀 지표"""
+        return {
+            'active': len(self._leases),
+            'spare': len(self._spares),
+            'max_sessions': self.max_sessions,
+            'created': self.created,
+            'leased': self.leased,
+            'cold_leases': self.cold_leases,
+            'evicted_idle': self.evicted_idle,
+            'evicted_lru': self.evicted_lru
+        }
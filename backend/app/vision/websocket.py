@@ -2,22 +2,37 @@
 WebSocket을 통한 실시간 시선 추적 데이터 스트리밍
 """
 from fastapi import WebSocket
-import cv2
-import numpy as np
-import base64
-from typing import Dict
+import asyncio
 import json
-from .tracker import VisionTracker
+import numpy as np
+import os
+from typing import Dict, Union
 from .database import save_gaze_data_batch
+from .mailbox import FrameMailbox
+from .frame_protocol import FrameMeta, FrameProtocolError, decode_binary_frame, decode_json_frame
+from .workers import VisionWorkerError, VisionWorkerPool, default_worker_count
 
 class VisionWebSocketHandler:
-    """Vision 추적 WebSocket 핸들러"""
+    """
+    Vision 추적 WebSocket 핸들러
+
+    프레임 처리(디코딩, 추적, 디버그 오버레이)는 VisionWorkerPool의 워커
+    프로세스에서 실행되고, 핸들러는 결과를 await해 응답/버퍼링만 한다.
 
-    def __init__(self):
-        self.tracker = VisionTracker()
+    수신한 프레임은 세션별 FrameMailbox(단일 슬롯)에 넣고 세션마다 하나인
+    처리 태스크가 가장 최근 프레임만 처리한다. 처리보다 빨리 도착한 프레임은
+    버려지고, 응답의 droppedFrames(누적)/skippedFrames(직전 응답 이후 버려진
+    수)로 클라이언트에 알린다.
+    """
+
+    def __init__(self, pool: VisionWorkerPool):
+        self.pool = pool
         self.active_connections: Dict[str, WebSocket] = {}
         self.gaze_buffer: Dict[str, list] = {}  # 배치 저장용 버퍼
         self.debug_mode: Dict[str, bool] = {}  # 세션별 디버그 모드 활성화 여부
+        self.mailboxes: Dict[str, FrameMailbox] = {}  # 세션별 최신 프레임 슬롯
+        self.workers: Dict[str, asyncio.Task] = {}  # 세션별 프레임 처리 태스크
+        self.skipped: Dict[str, int] = {}  # 처리 중인 프레임 직전에 버려진 프레임 수
 
     async def connect(self, websocket: WebSocket, session_id: str):
         """클라이언트 연결"""
@@ -25,6 +40,9 @@ class VisionWebSocketHandler:
         self.active_connections[session_id] = websocket
         self.gaze_buffer[session_id] = []
         self.debug_mode[session_id] = False  # 기본값: 디버그 모드 비활성화
+        self.mailboxes[session_id] = FrameMailbox()
+        self.skipped[session_id] = 0
+        self.workers[session_id] = asyncio.create_task(self._drain(session_id))
         print(f"Vision session {session_id} connected")
 
     def disconnect(self, session_id: str):
@@ -35,7 +53,69 @@ class VisionWebSocketHandler:
             del self.gaze_buffer[session_id]
         if session_id in self.debug_mode:
             del self.debug_mode[session_id]
-        print(f"Vision session {session_id} disconnected")
+
+        mailbox = self.mailboxes.pop(session_id, None)
+        if mailbox is not None:
+            mailbox.close()
+        worker = self.workers.pop(session_id, None)
+        if worker is not None:
+            worker.cancel()
+        self.skipped.pop(session_id, None)
+
+        self.pool.release(session_id)
+        if mailbox is not None:
+            print(f"Vision session {session_id} disconnected ({mailbox.processed}/{mailbox.received} frames processed, {mailbox.dropped} dropped)")
+        else:
+            print(f"Vision session {session_id} disconnected")
+
+    def enqueue(self, session_id: str, message: Union[bytes, str]):
+        """
+        수신 메시지를 세션 메일박스에 넣기 (기다리지 않음)
+
+        아직 처리되지 않은 이전 프레임이 있으면 버려진다 (latest-frame-wins).
+
+        Args:
+            message: 바이너리 프레임(bytes) 또는 JSON 프레임 텍스트(str)
+        """
+        mailbox = self.mailboxes.get(session_id)
+        if mailbox is not None:
+            mailbox.put(message)
+
+    async def _drain(self, session_id: str):
+        """세션 프레임 처리 태스크: 메일박스에서 최신 프레임을 꺼내 순차 처리"""
+        mailbox = self.mailboxes[session_id]
+        reported = 0
+
+        while True:
+            message = await mailbox.get()
+            if message is None:
+                break
+
+            self.skipped[session_id] = mailbox.dropped - reported
+            reported = mailbox.dropped
+
+            try:
+                if isinstance(message, str):
+                    await self.handle_frame(session_id, json.loads(message))
+                else:
+                    await self.handle_binary_frame(session_id, message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 잘못된 메시지 하나로 세션 처리 태스크가 끝나지 않도록
+                print(f"[{session_id}] Error handling frame message: {e}")
+                try:
+                    await self._send_error(session_id, f"Invalid frame message: {e}")
+                except Exception:
+                    break
+
+    def _frame_stats(self, session_id: str) -> Dict:
+        """응답에 붙이는 프레임 드롭 지표"""
+        mailbox = self.mailboxes.get(session_id)
+        return {
+            "droppedFrames": mailbox.dropped if mailbox is not None else 0,
+            "skippedFrames": self.skipped.get(session_id, 0)
+        }
 
     async def handle_frame(
         self,
@@ -43,7 +123,7 @@ class VisionWebSocketHandler:
         frame_data: Dict
     ):
         """
-        프레임 수신 및 시선 추적 처리 (Adaptive Resolution 지원)
+        JSON 프레임 처리 (기존 클라이언트 하위 호환)
 
         Args:
             session_id: 세션 ID
@@ -57,33 +137,77 @@ class VisionWebSocketHandler:
                 "timestamp": 1234567890
             }
         """
+        try:
+            meta, jpeg = decode_json_frame(frame_data)
+        except FrameProtocolError as e:
+            await self._send_error(session_id, str(e))
+            return
+
+        await self._process_frame(session_id, meta, jpeg)
+
+    async def handle_binary_frame(self, session_id: str, data: bytes):
+        """
+        바이너리 프레임 처리 (frame_protocol.py 참고: 고정 헤더 + JPEG)
+
+        헤더와 JPEG를 수신 버퍼에서 바로 읽으므로 base64/JSON 디코딩과
+        중간 문자열 복사가 없다.
+        """
+        try:
+            meta, jpeg = decode_binary_frame(data)
+        except FrameProtocolError as e:
+            await self._send_error(session_id, str(e))
+            return
+
+        await self._process_frame(session_id, meta, jpeg)
+
+    async def _send_error(self, session_id: str, message: str):
+        print(f"[{session_id}] {message}")
+        websocket = self.active_connections.get(session_id)
+        if websocket:
+            await websocket.send_json({
+                "type": "error",
+                "message": message
+            })
+
+    async def _process_frame(self, session_id: str, meta: FrameMeta, jpeg: np.ndarray):
+        """
+        프레임 디코딩 및 시선 추적 처리 (Adaptive Resolution 지원)
+
+        Args:
+            session_id: 세션 ID
+            meta: 프레임 메타데이터 (타임스탬프, 화면/카메라 해상도, 디버그 여부)
+            jpeg: JPEG 바이트 (uint8 배열)
+        """
         websocket = self.active_connections.get(session_id)
 
         # 디버그 모드 업데이트 (클라이언트 요청에 따라)
-        enable_debug = frame_data.get('enableDebug', False)
+        enable_debug = meta.enable_debug
         if enable_debug != self.debug_mode.get(session_id, False):
             self.debug_mode[session_id] = enable_debug
             print(f"[{session_id}] 🐛 Debug mode: {'ON' if enable_debug else 'OFF'}")
 
-        # 프레임 해상도 정보 추출 (기본값: 화면 해상도 사용)
-        frame_width = frame_data.get('frameWidth', frame_data['screenWidth'])
-        frame_height = frame_data.get('frameHeight', frame_data['screenHeight'])
-
         # 첫 프레임에서 해상도 로깅
         if session_id not in getattr(self, '_logged_resolutions', set()):
             if not hasattr(self, '_logged_resolutions'):
                 self._logged_resolutions = set()
-            print(f"[{session_id}] 📹 Camera resolution: {frame_width}x{frame_height} (adaptive)")
-            print(f"[{session_id}] 🖥️  Screen resolution: {frame_data['screenWidth']}x{frame_data['screenHeight']}")
+            print(f"[{session_id}] 📹 Camera resolution: {meta.frame_width}x{meta.frame_height} (adaptive)")
+            print(f"[{session_id}] 🖥️  Screen resolution: {meta.screen_width}x{meta.screen_height}")
             self._logged_resolutions.add(session_id)
 
         try:
-            # Base64 디코딩
-            img_data = base64.b64decode(frame_data['image'].split(',')[1])
-            nparr = np.frombuffer(img_data, np.uint8)
-            frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            # 시선 추적 (세션 담당 워커 프로세스에서 실행)
+            result = await self.pool.track(session_id, meta, jpeg)
 
-            if frame is None:
+            if result.get('tracker_reset'):
+                # 트래커 풀 축출이나 워커 재시작으로 이 세션의 트래커(캘리브레이션)를 잃음
+                print(f"[{session_id}] ⚠️ Tracker was evicted - calibration lost")
+                if websocket:
+                    await websocket.send_json({
+                        "type": "recalibrate",
+                        "message": "Eye tracker was reset - please calibrate again"
+                    })
+
+            if result['status'] == 'decode_failed':
                 print(f"[{session_id}] Frame decode failed")
                 if websocket:
                     await websocket.send_json({
@@ -92,35 +216,20 @@ class VisionWebSocketHandler:
                     })
                 return
 
-            # 시선 추적
-            result = self.tracker.track(frame)
-
-            # 디버그 이미지 생성 (조건부 - 디버그 모드일 때만)
-            debug_image = None
-            if self.debug_mode.get(session_id, False):
-                debug_frame = self.tracker.draw_debug_overlay(frame, result)
-                _, buffer = cv2.imencode('.jpg', debug_frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
-                debug_image = base64.b64encode(buffer).decode('utf-8')
-
-            if result:
-                # 화면 좌표로 변환
-                screen_x, screen_y = self.tracker.map_to_screen(
-                    np.array(result['gaze_vector']),
-                    result['head_pose']['translation'],
-                    frame_data['screenWidth'],
-                    frame_data['screenHeight']
-                )
+            debug_image = result.get('debug_image')
 
+            if result['status'] == 'ok':
                 # 클라이언트로 전송
                 response = {
                     "type": "gaze_data",
-                    "x": screen_x,
-                    "y": screen_y,
+                    "x": result['x'],
+                    "y": result['y'],
                     "confidence": result['confidence'],
-                    "pupilLeft": result.get('pupil_left'),
-                    "pupilRight": result.get('pupil_right'),
+                    "pupilLeft": result['pupil_left'],
+                    "pupilRight": result['pupil_right'],
                     "headPose": result['head_pose'],
-                    "timestamp": frame_data['timestamp']
+                    "timestamp": meta.timestamp,
+                    **self._frame_stats(session_id)
                 }
 
                 # 디버그 이미지 추가 (디버그 모드일 때만)
@@ -142,13 +251,23 @@ class VisionWebSocketHandler:
                 if websocket:
                     warning_response = {
                         "type": "warning",
-                        "message": "No face detected - please position your face in front of camera"
+                        "message": "No face detected - please position your face in front of camera",
+                        **self._frame_stats(session_id)
                     }
                     # 디버그 이미지 추가 (디버그 모드일 때만)
                     if debug_image:
                         warning_response["debugImage"] = f"data:image/jpeg;base64,{debug_image}"
                     await websocket.send_json(warning_response)
 
+        except VisionWorkerError as e:
+            # 워커 측 예외, timeout, 워커 재시작 (traceback은 워커 프로세스가 출력)
+            print(f"[{session_id}] Error processing frame: {e}")
+            if websocket:
+                await websocket.send_json({
+                    "type": "error",
+                    "message": f"Frame processing error: {str(e)}"
+                })
+
         except Exception as e:
             print(f"[{session_id}] Error processing frame: {e}")
             import traceback
@@ -165,9 +284,9 @@ class VisionWebSocketHandler:
             await save_gaze_data_batch(session_id, self.gaze_buffer[session_id])
             self.gaze_buffer[session_id] = []
 
-    def train_calibration(self, session_id: str, calibration_points: list) -> dict:
+    async def train_calibration(self, session_id: str, calibration_points: list) -> dict:
         """
-        세션별 캘리브레이션 학습
+        세션별 캘리브레이션 학습 (세션 담당 워커의 트래커에서 실행)
 
         Args:
             session_id: 세션 ID
@@ -178,13 +297,28 @@ class VisionWebSocketHandler:
         """
         print(f"[{session_id}] 🎯 Training calibration with {len(calibration_points)} points")
 
-        # Train the tracker's calibration corrector
-        metrics = self.tracker.train_calibration(calibration_points)
+        # Train the calibration corrector of the worker that tracks this session
+        metrics = await self.pool.train_calibration(session_id, calibration_points)
 
         print(f"[{session_id}] ✅ Calibration trained successfully")
         print(f"   Error: {metrics['error_mean']:.1f}px ± {metrics['error_std']:.1f}px")
 
         return metrics
 
+# 워커 풀 (VISION_WORKERS=0이면 프로세스 없이 단일 스레드에서 처리)
+# 워커마다 세션별 트래커를 최대 VISION_TRACKERS_PER_WORKER개 대여하고,
+# VISION_TRACKER_IDLE_TIMEOUT초 동안 프레임이 없으면 반납, VISION_TRACKER_PREWARM개를 미리 생성
+# VISION_ROI_TRACKING=1이면 얼굴 ROI만 잘라 FaceMesh 추론 (head_pose.py; 측정 후 켤 것)
+vision_worker_pool = VisionWorkerPool(
+    workers=default_worker_count(),
+    timeout=float(os.environ.get('VISION_WORKER_TIMEOUT', '10')),
+    tracker_options={
+        'max_sessions': int(os.environ.get('VISION_TRACKERS_PER_WORKER', '16')),
+        'idle_timeout': float(os.environ.get('VISION_TRACKER_IDLE_TIMEOUT', '300')),
+        'prewarm': int(os.environ.get('VISION_TRACKER_PREWARM', '1')),
+        'roi_tracking': os.environ.get('VISION_ROI_TRACKING', '0') == '1'
+    }
+)
+
 # 싱글톤 인스턴스
-vision_ws_handler = VisionWebSocketHandler()
+vision_ws_handler = VisionWebSocketHandler(vision_worker_pool)
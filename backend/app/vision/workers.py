@@ -0,0 +1,594 @@
+"""
+Vision 워커 프로세스 풀
+
+FaceMesh, cv2.inpaint, 윤곽선 피팅, solvePnP는 프레임당 수십 ms의 CPU
+작업이라 asyncio 핸들러에서 직접 실행하면 그동안 같은 워커의 모든
+WebSocket/HTTP 요청이 멈춘다. VisionWorkerPool은 이 작업을 별도 프로세스로
+보낸다.
+
+- 워커 프로세스마다 자신의 TrackerPool을 가지고 세션마다 VisionTracker를
+  대여한다 (tracker_pool.py; spawn으로 시작하므로 MediaPipe 그래프, DB 풀,
+  이벤트 루프를 부모와 공유하지 않는다)
+- 세션 고정(affinity): 세션의 첫 작업 때 담당 세션이 가장 적은 워커를
+  배정하고, 이후 프레임/캘리브레이션은 같은 워커로 보낸다 (트래커의
+  시간적 상태와 캘리브레이션이 세션과 함께 유지된다)
+- 결과는 공용 결과 큐로 돌아오고, 수집 스레드가 해당 asyncio Future를
+  loop.call_soon_threadsafe로 완료시킨다 - 이벤트 루프는 await만 한다
+- 워커별 지표: 처리 프레임 수, 오류, 진행 중 작업, 처리 시간 평균/최대,
+  담당 세션 수, 재시작 횟수, 트래커 풀 상태 (stats(), GET /api/vision/workers)
+- 죽은 워커는 수집 스레드가 감지해 진행 중 작업을 실패 처리하고 다시 띄운다.
+  새 워커의 트래커 풀은 비어 있으므로 그 워커에 고정된 세션은 다음 프레임
+  결과에 tracker_reset을 붙인다 (캘리브레이션 다시 요청)
+
+workers=0이면 프로세스 없이 단일 스레드 executor에서 같은 코드를 실행한다
+(로컬 개발용; 이벤트 루프는 여전히 막히지 않는다. 트래커 유지보수는 작업이
+들어올 때만 실행된다).
+"""
+import asyncio
+import base64
+import functools
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .frame_protocol import FrameMeta
+from .tracker_pool import TrackerPool
+
+# 워커가 유휴 트래커 축출/예비 보충/지표 보고를 하는 주기 (초)
+MAINTENANCE_INTERVAL = 1.0
+
+
+class VisionWorkerError(RuntimeError):
+    """워커에서 작업이 실패했거나 워커가 응답하지 않음"""
+
+
+# ===== 워커 프로세스 측 =====
+
+def process_frame(tracker, meta: FrameMeta, jpeg: bytes) -> Dict:
+    """
+    프레임 1장 처리: JPEG 디코딩 → 시선 추적 → 화면 좌표 (+ 디버그 이미지)
+
+    Returns:
+        {"status": "ok" | "no_face" | "decode_failed", ...}
+        ok: x, y, confidence, pupil_left, pupil_right, head_pose
+        debug_image: base64 JPEG (디버그 모드일 때만)
+        tracker_reset: 세션 트래커가 축출되어 새로 배정됨 (_WorkerState가 추가)
+    """
+    import cv2
+    import numpy as np
+
+    frame = cv2.imdecode(np.frombuffer(jpeg, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        return {"status": "decode_failed"}
+
+    result = tracker.track(frame)
+
+    # 디버그 이미지 생성 (조건부 - 디버그 모드일 때만)
+    debug_image = None
+    if meta.enable_debug:
+        debug_frame = tracker.draw_debug_overlay(frame, result)
+        _, buffer = cv2.imencode('.jpg', debug_frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
+        debug_image = base64.b64encode(buffer).decode('utf-8')
+
+    if not result:
+        return {"status": "no_face", "debug_image": debug_image}
+
+    # 화면 좌표로 변환
+    screen_x, screen_y = tracker.map_to_screen(
+        np.array(result['gaze_vector']),
+        result['head_pose']['translation'],
+        meta.screen_width,
+        meta.screen_height
+    )
+
+    return {
+        "status": "ok",
+        "x": screen_x,
+        "y": screen_y,
+        "confidence": result['confidence'],
+        "pupil_left": result.get('pupil_left'),
+        "pupil_right": result.get('pupil_right'),
+        "head_pose": result['head_pose'],
+        "debug_image": debug_image
+    }
+
+
+class _WorkerState:
+    """워커 하나의 상태 (자식 프로세스 또는 inline 스레드에서 생성)"""
+
+    def __init__(self, tracker_options: Optional[Dict] = None):
+        from .tracker import VisionTracker
+        options = dict(tracker_options or {})
+        roi_tracking = options.pop('roi_tracking', False)
+        self.trackers = TrackerPool(functools.partial(VisionTracker, roi_tracking=roi_tracking), **options)
+        self.trackers.fill()
+
+    def handle(self, kind: str, session_id: str, payload: Any) -> Any:
+        if kind == 'track':
+            meta, jpeg = payload
+            # 축출로 캘리브레이션을 잃었으면 결과에 표시 (핸들러가 재캘리브레이션 요청)
+            reset = self.trackers.take_reset(session_id)
+            result = process_frame(self.trackers.lease(session_id), meta, jpeg)
+            if reset:
+                result['tracker_reset'] = True
+            return result
+        if kind == 'calibrate':
+            # 새 캘리브레이션이 축출 전 상태를 대신한다
+            self.trackers.take_reset(session_id)
+            return self.trackers.lease(session_id).train_calibration(payload)
+        if kind == 'release':
+            return self.trackers.release(session_id)
+        raise ValueError(f"Unknown vision task '{kind}'")
+
+    def maintain(self, refill: bool):
+        """유휴 트래커 축출; refill이면 예비 트래커 보충 (처리할 프레임이 없을 때만)"""
+        self.trackers.evict_idle()
+        if refill:
+            self.trackers.fill()
+
+
+def _run_task(state: _WorkerState, kind: str, session_id: str, payload: Any) -> Tuple[bool, Any, float]:
+    """작업 실행 → (성공 여부, 결과 또는 오류 메시지, 처리 시간 s)"""
+    started = time.perf_counter()
+    try:
+        return True, state.handle(kind, session_id, payload), time.perf_counter() - started
+    except Exception as e:
+        traceback.print_exc()
+        return False, f"{type(e).__name__}: {e}", time.perf_counter() - started
+
+
+def _worker_main(worker_id: int, requests, results, tracker_options: Dict):
+    """워커 프로세스 진입점: 요청 큐 → 처리 → 결과 큐"""
+    try:
+        state = _WorkerState(tracker_options)
+    except Exception as e:
+        results.put(('failed', worker_id, f"{type(e).__name__}: {e}"))
+        return
+
+    results.put(('ready', worker_id, os.getpid()))
+    results.put(('trackers', worker_id, state.trackers.stats()))
+    last_maintenance = time.monotonic()
+
+    while True:
+        try:
+            task = requests.get(timeout=MAINTENANCE_INTERVAL)
+        except queue.Empty:
+            # 유휴 시간에 예비 트래커를 채운다 (그래프 생성이 프레임을 막지 않도록)
+            task = ()
+
+        if task is None:
+            break
+
+        if task:
+            task_id, kind, session_id, payload = task
+            ok, result, elapsed = _run_task(state, kind, session_id, payload)
+            results.put((task_id, worker_id, ok, result, elapsed))
+
+        if not task or time.monotonic() - last_maintenance >= MAINTENANCE_INTERVAL:
+            state.maintain(refill=not task)
+            results.put(('trackers', worker_id, state.trackers.stats()))
+            last_maintenance = time.monotonic()
+
+    state.trackers.close()
+
+
+# ===== 부모 프로세스 측 =====
+
+class _WorkerStats:
+    """워커 하나의 누적 지표"""
+
+    __slots__ = (
+        'pid', 'ready', 'start_error', 'tasks', 'errors', 'in_flight', 'busy_time', 'max_time', 'restarts',
+        'trackers'
+    )
+
+    def __init__(self):
+        self.pid: Optional[int] = None
+        self.ready = False
+        self.start_error: Optional[str] = None
+        self.tasks = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.busy_time = 0.0
+        self.max_time = 0.0
+        self.restarts = 0
+        self.trackers: Optional[Dict] = None  # 워커가 보고한 TrackerPool.stats()
+
+
+class VisionWorkerPool:
+    """
+    세션 고정 Vision 워커 프로세스 풀
+
+    Attributes:
+        workers (int): 워커 프로세스 수 (0 = 프로세스 없이 inline 스레드)
+        timeout (float): 작업당 최대 대기 시간 (초)
+        tracker_options (dict): 워커별 TrackerPool 설정
+            (max_sessions, idle_timeout, prewarm) 및 VisionTracker의 roi_tracking
+    """
+
+    def __init__(self, workers: int = 2, timeout: float = 10.0, tracker_options: Optional[Dict] = None):
+        self.workers = max(0, workers)
+        self.timeout = timeout
+        self.tracker_options = dict(tracker_options or {})
+
+        self._ctx = multiprocessing.get_context('spawn')
+        self._requests: List[Any] = []
+        self._processes: List[Any] = []
+        self._results = None
+        self._collector: Optional[threading.Thread] = None
+
+        # Inline 모드 (workers=0)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._inline_state: Optional[_WorkerState] = None
+        self._inline_maintained = 0.0
+
+        # task_id -> (future, loop, worker_id)
+        self._pending: Dict[int, Tuple[asyncio.Future, asyncio.AbstractEventLoop, int]] = {}
+        self._task_ids = itertools.count()
+        self._affinity: Dict[str, int] = {}
+        # 담당 워커가 재시작되어 트래커(캘리브레이션)를 잃은 세션
+        self._reset_sessions: Set[str] = set()
+        self._stats = [_WorkerStats() for _ in range(max(1, self.workers))]
+        self._lock = threading.Lock()
+        self._started = False
+        self._stopping = False
+
+    # ----- Lifecycle -----
+
+    def start(self):
+        """워커 프로세스와 결과 수집 스레드 시작 (idempotent)"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            self._stopping = False
+
+            if self.workers == 0:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='vision-inline')
+                self._stats[0].pid = os.getpid()
+                # 트래커 예비분 생성 (첫 세션 전에 MediaPipe 그래프 준비)
+                self._executor.submit(self._inline_maintain, True)
+                return
+
+            self._results = self._ctx.Queue()
+            for worker_id in range(self.workers):
+                self._requests.append(self._ctx.Queue())
+                self._processes.append(None)
+                self._spawn(worker_id)
+
+            self._collector = threading.Thread(target=self._collect, name='vision-results', daemon=True)
+            self._collector.start()
+
+        print(f"✅ Vision worker pool started ({self.workers} processes)")
+
+    def _spawn(self, worker_id: int):
+        """워커 프로세스 시작 (lock 보유)"""
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(worker_id, self._requests[worker_id], self._results, self.tracker_options),
+            name=f'vision-worker-{worker_id}',
+            daemon=True
+        )
+        process.start()
+        self._processes[worker_id] = process
+        stats = self._stats[worker_id]
+        stats.pid = process.pid
+        stats.ready = False
+        stats.trackers = None
+
+    def stop(self):
+        """워커 종료 및 진행 중 작업 실패 처리"""
+        with self._lock:
+            if not self._started:
+                return
+            self._started = False
+            self._stopping = True
+            processes = list(self._processes)
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            if self._inline_state is not None:
+                executor.submit(self._inline_state.trackers.close)
+            executor.shutdown(wait=False)
+            self._inline_state = None
+
+        for requests in self._requests:
+            try:
+                requests.put(None)
+            except Exception:
+                pass
+        for process in processes:
+            if process is not None:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+        self._fail_pending(lambda worker_id: True, "Vision worker pool stopped")
+        with self._lock:
+            self._requests, self._processes = [], []
+            self._affinity.clear()
+            self._reset_sessions.clear()
+
+    # ----- Dispatch -----
+
+    def worker_for(self, session_id: str) -> int:
+        """세션 담당 워커 (처음이면 담당 세션이 가장 적은 워커 배정)"""
+        with self._lock:
+            worker_id = self._affinity.get(session_id)
+            if worker_id is None:
+                load = [0] * len(self._stats)
+                for assigned in self._affinity.values():
+                    load[assigned] += 1
+                worker_id = min(range(len(load)), key=lambda w: (load[w], self._stats[w].in_flight))
+                self._affinity[session_id] = worker_id
+            return worker_id
+
+    async def submit(self, session_id: str, kind: str, payload: Any, timeout: Optional[float] = None) -> Any:
+        """
+        세션 담당 워커에서 작업 실행 후 결과 반환
+
+        Raises:
+            VisionWorkerError: 작업 실패, 워커 종료 또는 timeout
+        """
+        if not self._started:
+            self.start()
+
+        worker_id = self.worker_for(session_id)
+        stats = self._stats[worker_id]
+        if stats.start_error:
+            raise VisionWorkerError(f"Vision worker {worker_id} failed to start: {stats.start_error}")
+        loop = asyncio.get_running_loop()
+
+        if self.workers == 0:
+            return await self._submit_inline(loop, kind, session_id, payload, stats)
+
+        future = loop.create_future()
+        task_id = next(self._task_ids)
+        with self._lock:
+            self._pending[task_id] = (future, loop, worker_id)
+            stats.in_flight += 1
+
+        try:
+            self._requests[worker_id].put((task_id, kind, session_id, payload))
+            return await asyncio.wait_for(future, timeout or self.timeout)
+
+        except asyncio.TimeoutError:
+            raise VisionWorkerError(f"Vision worker {worker_id} timed out")
+
+        finally:
+            with self._lock:
+                if self._pending.pop(task_id, None) is not None:
+                    stats.in_flight -= 1
+
+    async def _submit_inline(self, loop, kind: str, session_id: str, payload: Any, stats: _WorkerStats) -> Any:
+        """workers=0: 단일 스레드 executor에서 실행"""
+        def run():
+            self._ensure_inline_state()
+            return _run_task(self._inline_state, kind, session_id, payload)
+
+        stats.in_flight += 1
+        try:
+            ok, result, elapsed = await loop.run_in_executor(self._executor, run)
+        finally:
+            stats.in_flight -= 1
+
+        self._record(stats, ok, elapsed)
+        if time.monotonic() - self._inline_maintained >= MAINTENANCE_INTERVAL:
+            self._inline_maintained = time.monotonic()
+            self._executor.submit(self._inline_maintain, True)
+        if not ok:
+            raise VisionWorkerError(result)
+        return result
+
+    def _ensure_inline_state(self):
+        """Inline 워커 상태 생성 (executor 스레드)"""
+        if self._inline_state is None:
+            self._inline_state = _WorkerState(self.tracker_options)
+            self._stats[0].ready = True
+
+    def _inline_maintain(self, refill: bool):
+        """Inline 모드 트래커 유지보수 (executor 스레드)"""
+        try:
+            self._ensure_inline_state()
+            self._inline_state.maintain(refill)
+            self._stats[0].trackers = self._inline_state.trackers.stats()
+        except Exception as e:
+            self._stats[0].start_error = f"{type(e).__name__}: {e}"
+            print(f"❌ Inline vision worker failed: {e}")
+
+    async def track(self, session_id: str, meta: FrameMeta, jpeg) -> Dict:
+        """프레임 처리 (process_frame 참고)"""
+        result = await self.submit(session_id, 'track', (meta, bytes(jpeg)))
+        with self._lock:
+            reset = session_id in self._reset_sessions
+            self._reset_sessions.discard(session_id)
+        if reset:
+            result['tracker_reset'] = True
+        return result
+
+    async def train_calibration(self, session_id: str, calibration_points: list) -> Dict:
+        """세션 담당 워커의 트래커에서 캘리브레이션 학습"""
+        # 새 캘리브레이션이 재시작 전 상태를 대신한다
+        with self._lock:
+            self._reset_sessions.discard(session_id)
+        return await self.submit(session_id, 'calibrate', calibration_points)
+
+    def release(self, session_id: str):
+        """세션 종료: 워커 배정 해제 및 세션 트래커 반납"""
+        with self._lock:
+            worker_id = self._affinity.pop(session_id, None)
+            self._reset_sessions.discard(session_id)
+            started = self._started
+
+        if worker_id is None or not started:
+            return
+
+        if self.workers == 0:
+            if self._inline_state is not None:
+                self._executor.submit(_run_task, self._inline_state, 'release', session_id, None)
+        else:
+            # 결과는 기다리지 않는다 (task_id -1은 수집 스레드가 무시)
+            self._requests[worker_id].put((-1, 'release', session_id, None))
+
+    # ----- Results -----
+
+    def _collect(self):
+        """결과 큐를 읽어 Future 완료; 주기적으로 죽은 워커 확인"""
+        last_check = time.monotonic()
+        while not self._stopping:
+            if time.monotonic() - last_check >= 1.0:
+                self._check_workers()
+                last_check = time.monotonic()
+
+            try:
+                message = self._results.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+
+            if message[0] == 'ready':
+                _, worker_id, pid = message
+                with self._lock:
+                    self._stats[worker_id].ready = True
+                    self._stats[worker_id].pid = pid
+                continue
+
+            if message[0] == 'failed':
+                _, worker_id, error = message
+                with self._lock:
+                    self._stats[worker_id].start_error = error
+                print(f"❌ Vision worker {worker_id} failed to start: {error}")
+                continue
+
+            if message[0] == 'trackers':
+                _, worker_id, tracker_stats = message
+                self._stats[worker_id].trackers = tracker_stats
+                continue
+
+            task_id, worker_id, ok, result, elapsed = message
+            if task_id < 0:
+                continue  # release (결과를 기다리지 않음)
+            self._record(self._stats[worker_id], ok, elapsed)
+
+            with self._lock:
+                entry = self._pending.pop(task_id, None)
+                if entry is not None:
+                    self._stats[worker_id].in_flight -= 1
+            if entry is None:
+                continue  # timeout된 작업
+
+            future, loop, _ = entry
+            loop.call_soon_threadsafe(_resolve, future, ok, result)
+
+    def _record(self, stats: _WorkerStats, ok: bool, elapsed: float):
+        with self._lock:
+            stats.tasks += 1
+            stats.busy_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            if not ok:
+                stats.errors += 1
+
+    def _check_workers(self):
+        """죽은 워커 재시작; 그 워커의 진행 중 작업은 실패 처리"""
+        dead = []
+        with self._lock:
+            if self._stopping:
+                return
+            for worker_id, process in enumerate(self._processes):
+                if process is not None and not process.is_alive():
+                    dead.append((worker_id, process.exitcode))
+                    if self._stats[worker_id].start_error:
+                        # 트래커 초기화 실패(의존성/모델 누락)는 재시작해도 반복된다
+                        self._processes[worker_id] = None
+                        continue
+                    self._stats[worker_id].restarts += 1
+                    self._spawn(worker_id)
+                    # 새 프로세스의 트래커 풀은 비어 있다 - 고정된 세션에 알린다
+                    self._reset_sessions.update(
+                        session_id for session_id, assigned in self._affinity.items()
+                        if assigned == worker_id
+                    )
+
+        for worker_id, exitcode in dead:
+            restarted = self._processes[worker_id] is not None
+            print(f"⚠️ Vision worker {worker_id} exited ({exitcode}){'; restarted' if restarted else ''}")
+            self._fail_pending(lambda w, dead_id=worker_id: w == dead_id, f"Vision worker {worker_id} crashed")
+
+    def _fail_pending(self, match, message: str):
+        with self._lock:
+            failed = [
+                (task_id, entry) for task_id, entry in self._pending.items()
+                if match(entry[2])
+            ]
+            for task_id, (_, _, worker_id) in failed:
+                del self._pending[task_id]
+                self._stats[worker_id].in_flight -= 1
+
+        for _, (future, loop, _) in failed:
+            try:
+                loop.call_soon_threadsafe(_resolve, future, False, message)
+            except RuntimeError:
+                pass  # 루프가 이미 닫힘
+
+    # ----- Monitoring -----
+
+    def stats(self) -> Dict:
+        """풀 및 워커별 지표"""
+        with self._lock:
+            sessions = [0] * len(self._stats)
+            for worker_id in self._affinity.values():
+                sessions[worker_id] += 1
+
+            workers = []
+            for worker_id, stats in enumerate(self._stats):
+                process = self._processes[worker_id] if worker_id < len(self._processes) else None
+                workers.append({
+                    'worker_id': worker_id,
+                    'pid': stats.pid,
+                    'alive': process.is_alive() if process is not None else (self._started and not self.workers),
+                    'ready': stats.ready,
+                    'start_error': stats.start_error,
+                    'sessions': sessions[worker_id],
+                    'in_flight': stats.in_flight,
+                    'tasks': stats.tasks,
+                    'errors': stats.errors,
+                    'avg_ms': round(1000 * stats.busy_time / stats.tasks, 2) if stats.tasks else 0.0,
+                    'max_ms': round(1000 * stats.max_time, 2),
+                    'restarts': stats.restarts,
+                    'trackers': (
+                        self._inline_state.trackers.stats()
+                        if not self.workers and self._inline_state is not None else stats.trackers
+                    )
+                })
+
+            return {
+                'mode': 'processes' if self.workers else 'inline',
+                'started': self._started,
+                'sessions': len(self._affinity),
+                'workers': workers
+            }
+
+
+def _resolve(future: asyncio.Future, ok: bool, result: Any):
+    """이벤트 루프 스레드에서 Future 완료"""
+    if future.done():
+        return
+    if ok:
+        future.set_result(result)
+    else:
+        future.set_exception(VisionWorkerError(result))
+
+
+def default_worker_count() -> int:
+    """VISION_WORKERS 환경 변수 (기본: CPU 수 - 1, 최대 4)"""
+    value = os.environ.get('VISION_WORKERS')
+    if value is not None and value != '':
+        return int(value)
+    return max(1, min(4, (os.cpu_count() or 2) - 1))
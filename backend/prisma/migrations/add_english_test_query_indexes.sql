@@ -0,0 +1,31 @@
+-- Composite and partial indexes for the English test hot queries
+-- Each index matches one EnglishTestDB query shape; scripts/check_query_plans.py
+-- runs EXPLAIN (ANALYZE, BUFFERS) on every query against a seeded database
+-- and fails if one falls back to a sequential scan.
+--
+-- On a busy production database run the CREATE INDEX statements one by one
+-- from psql as CREATE INDEX CONCURRENTLY to avoid blocking response inserts.
+
+-- Candidate selection (get_items_for_selection):
+--   WHERE stage = ? AND panel = ? AND form_id = ? AND status = 'active'
+--   ORDER BY exposure_rate NULLS FIRST, exposure_count
+-- Equality columns first, then the sort keys, so candidates come back in
+-- exposure order without a sort; inactive/flagged items are left out.
+CREATE INDEX IF NOT EXISTS idx_items_active_module_exposure
+ON items (stage, panel, form_id, exposure_rate NULLS FIRST, exposure_count)
+WHERE status = 'active';
+
+-- Session history (get_session_responses, session state rebuild):
+--   WHERE session_id = ? ORDER BY responded_at
+-- Also serves get_session_statistics and the per-session lookups of the
+-- record_submission CTE.
+CREATE INDEX IF NOT EXISTS idx_responses_session_responded
+ON english_test_responses (session_id, responded_at);
+
+-- Superseded: session_id is the leading column of the index above and of
+-- unique_session_item, so this index only cost write amplification
+DROP INDEX IF EXISTS idx_responses_session_id;
+
+-- Add comments
+COMMENT ON INDEX idx_items_active_module_exposure IS 'Active candidates of one MST module in exposure order (get_items_for_selection)';
+COMMENT ON INDEX idx_responses_session_responded IS 'Responses of one session in answer order (get_session_responses)';
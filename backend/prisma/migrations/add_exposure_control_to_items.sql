@@ -0,0 +1,10 @@
+-- Add Sympson-Hetter exposure control parameter to items table
+-- K is the probability an item is administered once it is the most
+-- informative candidate; computed offline by simulation
+-- (python scripts/simulate_mst.py sympson-hetter --write)
+
+ALTER TABLE items
+ADD COLUMN IF NOT EXISTS sympson_hetter_k DOUBLE PRECISION DEFAULT 1.0;
+
+-- Add comments
+COMMENT ON COLUMN items.sympson_hetter_k IS 'Sympson-Hetter exposure parameter K in (0, 1]; 1.0 = no restriction';
@@ -0,0 +1,54 @@
+-- Item bank version counter for the in-memory item bank cache
+-- Any change to item content/parameters or passages bumps the version and
+-- sends NOTIFY item_bank_changed, so API processes reload their cached bank.
+-- Exposure statistics (exposure_count, exposure_rate, point_biserial,
+-- correct_rate) are not cached and deliberately do not bump the version.
+
+CREATE TABLE IF NOT EXISTS item_bank_version (
+  id INTEGER PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+  version BIGINT NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO item_bank_version (id, version)
+VALUES (1, 0)
+ON CONFLICT (id) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_item_bank_version()
+RETURNS TRIGGER AS $$
+DECLARE
+  new_version BIGINT;
+BEGIN
+  UPDATE item_bank_version
+  SET version = version + 1, updated_at = CURRENT_TIMESTAMP
+  WHERE id = 1
+  RETURNING version INTO new_version;
+
+  PERFORM pg_notify('item_bank_changed', new_version::text);
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS items_bump_bank_version ON items;
+CREATE TRIGGER items_bump_bank_version
+AFTER INSERT OR DELETE OR UPDATE OF
+  passage_id, stem, options, correct_answer, domain, text_type, skill_tag,
+  discrimination, difficulty, guessing, stage, panel, form_id, status,
+  sympson_hetter_k
+ON items
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_item_bank_version();
+
+DROP TRIGGER IF EXISTS items_truncate_bump_bank_version ON items;
+CREATE TRIGGER items_truncate_bump_bank_version
+AFTER TRUNCATE ON items
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_item_bank_version();
+
+DROP TRIGGER IF EXISTS passages_bump_bank_version ON passages;
+CREATE TRIGGER passages_bump_bank_version
+AFTER INSERT OR UPDATE OR DELETE ON passages
+FOR EACH STATEMENT
+EXECUTE FUNCTION bump_item_bank_version();
+
+COMMENT ON TABLE item_bank_version IS 'Single-row counter bumped on item/passage changes; invalidates the API item bank cache';
@@ -0,0 +1,32 @@
+-- Running classical item statistics (p-value, point-biserial, response time)
+-- One row of sums per item, incremented by the API's write-behind
+-- ItemStatsAggregator (app/english_test/item_stats.py), so reports never
+-- scan english_test_responses. Rebuild from history with
+-- python scripts/rebuild_item_statistics.py
+
+CREATE TABLE IF NOT EXISTS item_statistics (
+  item_id INTEGER PRIMARY KEY REFERENCES items(id) ON DELETE CASCADE,
+
+  -- All recorded responses (p-value)
+  responses INTEGER NOT NULL DEFAULT 0,
+  correct INTEGER NOT NULL DEFAULT 0,
+
+  -- Responses of completed sessions, against their final theta (point-biserial)
+  scored INTEGER NOT NULL DEFAULT 0,
+  scored_correct INTEGER NOT NULL DEFAULT 0,
+  sum_theta DOUBLE PRECISION NOT NULL DEFAULT 0,
+  sum_theta_sq DOUBLE PRECISION NOT NULL DEFAULT 0,
+  sum_correct_theta DOUBLE PRECISION NOT NULL DEFAULT 0,
+
+  -- Response time in ms: moments plus a log-bucketed quantile sketch
+  rt_count INTEGER NOT NULL DEFAULT 0,
+  rt_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+  rt_sum_sq DOUBLE PRECISION NOT NULL DEFAULT 0,
+  rt_buckets INTEGER[] NOT NULL DEFAULT '{}',
+
+  updated_at TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Add comments
+COMMENT ON TABLE item_statistics IS 'Running per-item response aggregates; items.correct_rate and items.point_biserial are derived from it on every flush (FR-009)';
+COMMENT ON COLUMN item_statistics.rt_buckets IS 'Response-time counts per log bucket: bucket k > 0 covers (100 * 1.1^(k-1), 100 * 1.1^k] ms';
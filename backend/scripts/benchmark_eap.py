@@ -0,0 +1,139 @@
+"""
+EAP Estimation Microbenchmark
+=============================
+
+Compares the vectorized log-space IRTEngine.eap_estimate against the
+previous per-quadrature-point loop over IRTEngine.likelihood(), and
+IRTEngine.eap_estimate_batch against per-session eap_estimate calls.
+
+Usage (from backend/):
+    python scripts/benchmark_eap.py [--items 40] [--repeat 200] [--batch 20000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from scipy.stats import norm
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importing the package builds the router's DB layer; its pool is lazy, so
+# a placeholder URL is enough to benchmark the engine offline.
+os.environ.setdefault('DATABASE_URL', 'postgresql://offline/benchmark')
+
+from app.english_test.irt_engine import IRTEngine  # noqa: E402
+
+
+def loop_eap_estimate(irt: IRTEngine, responses, items):
+    """Previous implementation: one likelihood() call per quadrature point."""
+    likelihoods = np.array([
+        irt.likelihood(theta, responses, items)
+        for theta in irt.quad_points
+    ])
+    posteriors = likelihoods * norm.pdf(irt.quad_points, irt.prior_mean, irt.prior_sd)
+    posterior_sum = np.sum(posteriors * irt.quad_weights)
+
+    if posterior_sum < 1e-100:
+        return irt.prior_mean, irt.prior_sd
+
+    theta_eap = np.sum(irt.quad_points * posteriors * irt.quad_weights) / posterior_sum
+    variance = np.sum(
+        ((irt.quad_points - theta_eap) ** 2) * posteriors * irt.quad_weights
+    ) / posterior_sum
+
+    return theta_eap, np.sqrt(variance)
+
+
+def make_session(n_items: int, rng: np.random.Generator):
+    """Simulate one examinee's response pattern on random 3PL items."""
+    items = [
+        {'a': rng.uniform(0.8, 2.0), 'b': rng.uniform(-2.5, 2.5), 'c': rng.uniform(0.15, 0.3)}
+        for _ in range(n_items)
+    ]
+    theta_true = rng.normal()
+    irt = IRTEngine()
+    responses = [
+        bool(rng.random() < irt.three_pl_probability(theta_true, it['a'], it['b'], it['c']))
+        for it in items
+    ]
+    return responses, items
+
+
+def time_per_call(fn, repeat: int) -> float:
+    """Return mean seconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=40, help='Responses per session')
+    parser.add_argument('--repeat', type=int, default=200, help='Calls per timing')
+    parser.add_argument('--batch', type=int, default=20000, help='Examinees for the batch benchmark')
+    parser.add_argument('--seed', type=int, default=2025)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    irt = IRTEngine()
+
+    print(f"=== EAP microbenchmark ({irt.quadrature_points} quadrature points) ===")
+    print(f"{'items':>6} {'loop (ms)':>10} {'vector (ms)':>12} {'speedup':>8} {'|Δθ|':>9} {'|ΔSE|':>9}")
+
+    for n_items in sorted({1, 8, 24, args.items}):
+        responses, items = make_session(n_items, rng)
+
+        loop_theta, loop_se = loop_eap_estimate(irt, responses, items)
+        vec_theta, vec_se = irt.eap_estimate(responses, items)
+
+        loop_t = time_per_call(lambda: loop_eap_estimate(irt, responses, items), args.repeat)
+        vec_t = time_per_call(lambda: irt.eap_estimate(responses, items), args.repeat)
+
+        print(
+            f"{n_items:>6} {loop_t * 1e3:>10.3f} {vec_t * 1e3:>12.4f} {loop_t / vec_t:>7.1f}x "
+            f"{abs(loop_theta - vec_theta):>9.2e} {abs(loop_se - vec_se):>9.2e}"
+        )
+
+    benchmark_batch(irt, args.batch, args.items, rng)
+
+
+def benchmark_batch(irt: IRTEngine, n_examinees: int, n_items: int, rng: np.random.Generator):
+    """Score n_examinees on a 600-item bank, n_items answered each."""
+    bank_size = 600
+    items = [
+        {'a': rng.uniform(0.8, 2.0), 'b': rng.uniform(-2.5, 2.5), 'c': rng.uniform(0.15, 0.3)}
+        for _ in range(bank_size)
+    ]
+    a, b, c = irt.item_parameter_arrays(items)
+    theta_true = rng.normal(size=n_examinees)
+
+    # Each examinee answers a random n_items subset of the bank
+    answered = np.argsort(rng.random((n_examinees, bank_size)), axis=1)[:, :n_items]
+    mask = np.zeros((n_examinees, bank_size), dtype=bool)
+    np.put_along_axis(mask, answered, True, axis=1)
+    prob = irt.probability_matrix(a, b, c, theta_true).T
+    responses = (rng.random((n_examinees, bank_size)) < prob).astype(float)
+
+    start = time.perf_counter()
+    thetas, _ = irt.eap_estimate_batch(responses, mask, (a, b, c))
+    batch_t = time.perf_counter() - start
+
+    sample = min(n_examinees, 500)
+    start = time.perf_counter()
+    for i in range(sample):
+        idx = answered[i]
+        irt.eap_estimate([bool(r) for r in responses[i, idx]], [items[j] for j in idx])
+    single_t = (time.perf_counter() - start) / sample * n_examinees
+
+    print(f"\n=== Batch EAP ({n_examinees} examinees × {n_items} of {bank_size} items) ===")
+    print(f"per-session eap_estimate: {single_t:8.2f} s (extrapolated from {sample})")
+    print(f"eap_estimate_batch:       {batch_t:8.2f} s ({single_t / batch_t:.1f}x)")
+    print(f"RMSE vs true θ:           {np.sqrt(np.mean((thetas - theta_true) ** 2)):8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Head Pose Throughput Benchmark
+==============================
+
+Compares HeadPoseEstimator on the full-frame path (one video-mode FaceMesh,
+the default) against ROI tracking (tracked face crop downscaled to
+inference_size on a separate FaceMesh, VISION_ROI_TRACKING=1) on the same
+recorded frames, so ROI tracking is only turned on where it is measurably
+faster.
+
+Frames are decoded and resized up front; only estimate() is timed. Use a
+recording of a face in front of the camera (e.g. a test session captured
+with the debug overlay off).
+
+Usage (from backend/):
+    python scripts/benchmark_head_pose.py --video face.mp4 [--frames 300] [--width 1280 --height 720]
+    python scripts/benchmark_head_pose.py --camera 0 --frames 300
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.vision.head_pose import HeadPoseEstimator  # noqa: E402
+
+
+def load_frames(source, n_frames: int, size):
+    """Read up to n_frames BGR frames, resized to size (width, height) if given"""
+    capture = cv2.VideoCapture(source)
+    frames = []
+    while len(frames) < n_frames:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        if size is not None:
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        frames.append(frame)
+    capture.release()
+    return frames
+
+
+def run(frames, repeat: int, **options):
+    """Time estimate() over all frames; returns fps, detection rate and path counters"""
+    estimator = HeadPoseEstimator(**options)
+    try:
+        # Warm-up: graph initialisation and first detection are not steady state
+        for frame in frames[:10]:
+            estimator.estimate(frame)
+        estimator.reset_tracking()
+        estimator.roi_frames = estimator.full_frames = estimator.redetections = 0
+
+        detected = 0
+        yaws = []
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for frame in frames:
+                pose = estimator.estimate(frame)
+                if pose is not None:
+                    detected += 1
+                    yaws.append(pose['yaw'])
+                else:
+                    yaws.append(np.nan)
+        elapsed = time.perf_counter() - started
+
+        total = len(frames) * repeat
+        return {
+            'fps': total / elapsed,
+            'ms_per_frame': 1000 * elapsed / total,
+            'detection_rate': detected / total,
+            'roi_frames': estimator.roi_frames,
+            'full_frames': estimator.full_frames,
+            'redetections': estimator.redetections,
+            'yaw': np.array(yaws)
+        }
+    finally:
+        estimator.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--video', help='Recorded video file')
+    source.add_argument('--camera', type=int, help='Camera index (frames are captured first, then replayed)')
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=1, help='Passes over the frames')
+    parser.add_argument('--width', type=int, help='Resize frames to this width (with --height)')
+    parser.add_argument('--height', type=int)
+    parser.add_argument('--inference-size', type=int, default=HeadPoseEstimator.INFERENCE_SIZE)
+    args = parser.parse_args()
+
+    size = (args.width, args.height) if args.width and args.height else None
+    frames = load_frames(args.video if args.video is not None else args.camera, args.frames, size)
+    if not frames:
+        sys.exit("No frames read")
+    h, w = frames[0].shape[:2]
+    print(f"{len(frames)} frames at {w}x{h}, {args.repeat} pass(es)\n")
+
+    full = run(frames, args.repeat, roi_tracking=False)
+    roi = run(frames, args.repeat, roi_tracking=True, inference_size=args.inference_size)
+
+    print(f"{'path':<12} {'fps':>8} {'ms/frame':>9} {'detected':>9} {'roi':>6} {'full':>6} {'redetect':>9}")
+    for name, result in (('full frame', full), ('roi', roi)):
+        print(f"{name:<12} {result['fps']:>8.1f} {result['ms_per_frame']:>9.2f} "
+              f"{result['detection_rate']:>9.1%} {result['roi_frames']:>6} "
+              f"{result['full_frames']:>6} {result['redetections']:>9}")
+
+    both = ~np.isnan(full['yaw']) & ~np.isnan(roi['yaw'])
+    if both.any():
+        diff = np.abs(full['yaw'][both] - roi['yaw'][both])
+        print(f"\nYaw difference (roi vs full): mean {diff.mean():.2f}°, max {diff.max():.2f}°")
+    print(f"Speed-up: {roi['fps'] / full['fps']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
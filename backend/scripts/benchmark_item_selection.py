@@ -0,0 +1,101 @@
+"""
+Item Selection Microbenchmark
+=============================
+
+Compares IRTEngine.select_next_item on a list of candidate dicts with
+ItemBank.select_item on precomputed information curves, for growing
+synthetic banks.
+
+Usage (from backend/):
+    python scripts/benchmark_item_selection.py [--sizes 600 10000 50000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importing the package builds the router's DB layer; its pool is lazy, so
+# a placeholder URL is enough to benchmark the engine offline.
+os.environ.setdefault('DATABASE_URL', 'postgresql://offline/benchmark')
+
+from app.english_test.irt_engine import IRTEngine  # noqa: E402
+from app.english_test.item_bank import ItemBank  # noqa: E402
+
+PANELS = {
+    1: ['routing'],
+    2: ['low', 'medium', 'high'],
+    3: ['L1', 'L2', 'L3', 'M1', 'M2', 'M3', 'H1', 'H2', 'H3'],
+}
+
+
+def make_bank(n_items: int, rng: np.random.Generator):
+    """Synthetic item dicts spread evenly over the 13 MST modules."""
+    modules = [(stage, panel) for stage, panels in PANELS.items() for panel in panels]
+    items = []
+    for item_id in range(1, n_items + 1):
+        stage, panel = modules[item_id % len(modules)]
+        items.append({
+            'id': item_id,
+            'stage': stage,
+            'panel': panel,
+            'form_id': 1,
+            'a': rng.uniform(0.8, 2.0),
+            'b': rng.uniform(-2.5, 2.5),
+            'c': rng.uniform(0.15, 0.3),
+            'exposure_count': int(rng.integers(0, 50)),
+        })
+    return items
+
+
+def time_per_call(fn, repeat: int) -> float:
+    """Return mean seconds per call."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[600, 10000, 50000])
+    parser.add_argument('--repeat', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=2025)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    irt = IRTEngine()
+
+    print("=== Item selection microbenchmark (stage 2 / medium, 12 excluded) ===")
+    print(f"{'bank':>7} {'module':>7} {'dicts (µs)':>11} {'bank (µs)':>10} {'speedup':>8} {'build (ms)':>11}")
+
+    for size in args.sizes:
+        items = make_bank(size, rng)
+
+        build_start = time.perf_counter()
+        bank = ItemBank(items, irt_engine=irt)
+        build_ms = (time.perf_counter() - build_start) * 1e3
+
+        candidates = [it for it in items if it['stage'] == 2 and it['panel'] == 'medium']
+        excluded = [it['id'] for it in candidates[:12]]
+        excluded_set = set(excluded)
+        remaining = [it for it in candidates if it['id'] not in excluded_set]
+
+        dict_t = time_per_call(lambda: irt.select_next_item(0.3, remaining), args.repeat)
+        bank_t = time_per_call(
+            lambda: bank.select_item(2, 'medium', 0.3, excluded_ids=excluded),
+            args.repeat
+        )
+
+        print(
+            f"{size:>7} {len(remaining):>7} {dict_t * 1e6:>11.1f} {bank_t * 1e6:>10.1f} "
+            f"{dict_t / bank_t:>7.1f}x {build_ms:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Prepared Statement Benchmark
+============================
+
+Measures what the fixed-shape, prepared candidate query saves over the
+old per-call SQL. Replays synthetic get_items_for_selection requests
+(random module, 0-39 excluded item IDs) against DATABASE_URL in three
+variants:
+
+- dynamic:  the old `id NOT IN (%s, ...)` text, one shape per list length
+- fixed:    `id <> ALL(%s::int[])`, one shape, parsed/planned per call
+- prepared: the same text through PREPARE / EXECUTE once per connection
+
+and reports wall time per call plus Postgres' own Planning/Execution
+Time from EXPLAIN (ANALYZE) on a sample of the requests. Read-only.
+
+Usage (from backend/):
+    python scripts/benchmark_prepared_statements.py [--requests 2000] [--explain 200]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import psycopg2
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importing the package builds the router's DB layers, which read DATABASE_URL
+load_dotenv()
+
+from app.english_test.database import _prepared_forms  # noqa: E402
+
+
+SELECT_CANDIDATES = """
+    SELECT i.*, p.title as passage_title, p.content as passage_content
+    FROM items i
+    LEFT JOIN passages p ON i.passage_id = p.id
+    WHERE i.stage = %s
+      AND i.panel = %s
+      AND i.form_id = %s
+      AND i.status = 'active'
+"""
+ORDER_BY = " ORDER BY i.exposure_rate NULLS FIRST, i.exposure_count ASC"
+
+FIXED = SELECT_CANDIDATES + """
+      AND (%s::text IS NULL OR i.domain::text = %s::text)
+      AND i.id <> ALL(%s::int[])
+""" + ORDER_BY
+
+
+def dynamic_query(stage, panel, form_id, excluded):
+    """The pre-change query text and parameters"""
+    query = SELECT_CANDIDATES
+    params = [stage, panel, form_id]
+    if excluded:
+        query += f" AND i.id NOT IN ({','.join(['%s'] * len(excluded))})"
+        params.extend(excluded)
+    return query + ORDER_BY, params
+
+
+def fixed_params(stage, panel, form_id, excluded):
+    return [stage, panel, form_id, None, None, list(excluded)]
+
+
+def make_requests(cursor, n_requests: int, rng: np.random.Generator):
+    """Random (stage, panel, form_id, excluded_ids) drawn from the active bank"""
+    cursor.execute("""
+        SELECT stage, panel, form_id, array_agg(id ORDER BY id)
+        FROM items
+        WHERE status = 'active'
+        GROUP BY stage, panel, form_id;
+    """)
+    modules = cursor.fetchall()
+    if not modules:
+        raise SystemExit("No active items to benchmark against")
+
+    all_ids = np.array([item_id for *_, ids in modules for item_id in ids])
+    requests = []
+    for _ in range(n_requests):
+        stage, panel, form_id, _ = modules[int(rng.integers(len(modules)))]
+        n_excluded = min(int(rng.integers(0, 40)), len(all_ids))
+        excluded = [int(i) for i in rng.choice(all_ids, size=n_excluded, replace=False)]
+        requests.append((stage, panel, form_id, excluded))
+    return requests
+
+
+def timed(run, requests):
+    """Per-call wall times in ms"""
+    times = []
+    for request in requests:
+        start = time.perf_counter()
+        run(*request)
+        times.append((time.perf_counter() - start) * 1000)
+    return np.array(times)
+
+
+def explain(cursor, query, params):
+    """(planning_ms, execution_ms) of one EXPLAIN ANALYZE run"""
+    cursor.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + query, params)
+    plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]['Planning Time'], plan[0]['Execution Time']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--explain', type=int, default=200, help='Requests sampled for EXPLAIN ANALYZE')
+    parser.add_argument('--seed', type=int, default=2025)
+    args = parser.parse_args()
+
+    database_url = os.environ.get('DATABASE_URL')
+    if not database_url:
+        raise SystemExit("DATABASE_URL environment variable is required")
+
+    conn = psycopg2.connect(database_url)
+    conn.autocommit = True
+    cursor = conn.cursor()
+
+    rng = np.random.default_rng(args.seed)
+    requests = make_requests(cursor, args.requests, rng)
+
+    prepare, execute = _prepared_forms('bench_items_for_selection', FIXED)
+    cursor.execute(prepare)
+
+    def run_dynamic(*request):
+        cursor.execute(*dynamic_query(*request))
+        cursor.fetchall()
+
+    def run_fixed(*request):
+        cursor.execute(FIXED, fixed_params(*request))
+        cursor.fetchall()
+
+    def run_prepared(*request):
+        cursor.execute(execute, fixed_params(*request))
+        cursor.fetchall()
+
+    variants = [('dynamic', run_dynamic), ('fixed', run_fixed), ('prepared', run_prepared)]
+
+    # Warm caches so the first variant is not penalized
+    for _, run in variants:
+        timed(run, requests[:50])
+
+    print(f"=== Candidate query benchmark ({args.requests} requests, 0-39 excluded IDs) ===")
+    print(f"{'variant':>10} {'median ms':>10} {'p95 ms':>8} {'mean ms':>8}")
+    for name, run in variants:
+        times = timed(run, requests)
+        print(f"{name:>10} {np.median(times):>10.3f} {np.percentile(times, 95):>8.3f} {times.mean():>8.3f}")
+
+    sample = requests[:args.explain]
+    explained = {
+        'dynamic': [explain(cursor, *dynamic_query(*r)) for r in sample],
+        'fixed': [explain(cursor, FIXED, fixed_params(*r)) for r in sample],
+        'prepared': [explain(cursor, execute, fixed_params(*r)) for r in sample],
+    }
+
+    print(f"\n=== Server-side time (EXPLAIN ANALYZE, {len(sample)} requests) ===")
+    print(f"{'variant':>10} {'planning ms':>12} {'execution ms':>13}")
+    for name, rows in explained.items():
+        planning, execution = np.array(rows).mean(axis=0)
+        print(f"{name:>10} {planning:>12.3f} {execution:>13.3f}")
+
+    cursor.execute("DEALLOCATE bench_items_for_selection")
+    cursor.close()
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Quadrature Accuracy / Speed Benchmark
+=====================================
+
+Scores simulated response patterns with every IRTEngine quadrature
+scheme at several node counts and reports θ / SE error against a
+high-resolution reference (rectangular grid, 2001 nodes over [-6, 6])
+together with the time per eap_estimate call.
+
+Usage (from backend/):
+    python scripts/benchmark_quadrature.py [--sessions 300] [--nodes 11 15 21 31 41]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importing the package builds the router's DB layer; its pool is lazy, so
+# a placeholder URL is enough to benchmark the engine offline.
+os.environ.setdefault('DATABASE_URL', 'postgresql://offline/benchmark')
+
+from app.english_test.irt_engine import IRTEngine  # noqa: E402
+
+
+def make_sessions(n_sessions: int, rng: np.random.Generator):
+    """Response patterns of 1-40 items for simulees with θ ~ N(0, 1.2)."""
+    reference = IRTEngine()
+    sessions = []
+    for _ in range(n_sessions):
+        n_items = int(rng.integers(1, 41))
+        items = [
+            {'a': rng.uniform(0.8, 2.0), 'b': rng.uniform(-2.5, 2.5), 'c': rng.uniform(0.15, 0.3)}
+            for _ in range(n_items)
+        ]
+        theta_true = rng.normal(0.0, 1.2)
+        responses = [
+            bool(rng.random() < reference.three_pl_probability(theta_true, it['a'], it['b'], it['c']))
+            for it in items
+        ]
+        sessions.append((responses, items))
+    return sessions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=300)
+    parser.add_argument('--nodes', type=int, nargs='+', default=[11, 15, 21, 31, 41])
+    parser.add_argument('--seed', type=int, default=2025)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    sessions = make_sessions(args.sessions, rng)
+
+    reference = IRTEngine(quadrature='rectangular', quadrature_points=2001, theta_min=-6.0, theta_max=6.0)
+    ref = np.array([reference.eap_estimate(r, i) for r, i in sessions])
+
+    print(f"=== Quadrature benchmark ({args.sessions} sessions, reference: 2001-node grid) ===")
+    print(f"{'scheme':>14} {'nodes':>6} {'max|Δθ|':>9} {'mean|Δθ|':>9} {'max|ΔSE|':>9} {'µs/call':>8}")
+
+    for scheme in IRTEngine.QUADRATURE_SCHEMES:
+        for n_nodes in args.nodes:
+            try:
+                irt = IRTEngine(quadrature=scheme, quadrature_points=n_nodes)
+            except ValueError as e:
+                print(f"{scheme:>14} {n_nodes:>6}  skipped: {e}")
+                continue
+
+            start = time.perf_counter()
+            est = np.array([irt.eap_estimate(r, i) for r, i in sessions])
+            per_call = (time.perf_counter() - start) / len(sessions)
+
+            theta_err = np.abs(est[:, 0] - ref[:, 0])
+            se_err = np.abs(est[:, 1] - ref[:, 1])
+            print(
+                f"{scheme:>14} {n_nodes:>6} {theta_err.max():>9.4f} {theta_err.mean():>9.5f} "
+                f"{se_err.max():>9.4f} {per_call * 1e6:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
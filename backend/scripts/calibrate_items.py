@@ -0,0 +1,79 @@
+"""
+Calibrate English Test Items (MML-EM, 3PL)
+==========================================
+
+Streams english_test_responses from Postgres, re-estimates
+discrimination / difficulty / guessing for every item with enough
+responses, and bulk-writes them back to items.
+
+Usage (from backend/, DATABASE_URL set):
+    python scripts/calibrate_items.py [--workers 4] [--chunk-sessions 5000]
+        [--min-responses 200] [--max-iterations 50] [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.english_test.calibration import (  # noqa: E402
+    ItemCalibrator,
+    load_items_for_calibration,
+    stream_response_chunks,
+    write_item_parameters,
+)
+from app.english_test.database import EnglishTestDB  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=1, help='Processes for the E-step')
+    parser.add_argument('--chunk-sessions', type=int, default=5000, help='Sessions per streamed chunk')
+    parser.add_argument('--min-responses', type=int, default=200, help='Minimum responses to recalibrate an item')
+    parser.add_argument('--max-iterations', type=int, default=50)
+    parser.add_argument('--tolerance', type=float, default=1e-3)
+    parser.add_argument('--dry-run', action='store_true', help='Calibrate without writing back')
+    args = parser.parse_args()
+
+    load_dotenv()
+    db = EnglishTestDB()
+
+    item_ids, a, b, c = load_items_for_calibration(db)
+    print(f"Loaded {len(item_ids)} items")
+
+    started = time.perf_counter()
+    result = ItemCalibrator().calibrate(
+        lambda: stream_response_chunks(db, item_ids, chunk_sessions=args.chunk_sessions),
+        a, b, c,
+        max_iterations=args.max_iterations,
+        tolerance=args.tolerance,
+        workers=args.workers,
+        min_responses=args.min_responses
+    )
+    elapsed = time.perf_counter() - started
+
+    calibrated = result['responses'] >= args.min_responses
+    status = "converged" if result['converged'] else "did not converge"
+    print(f"EM {status} after {result['iterations']} iterations in {elapsed:.1f}s")
+    print(f"{int(calibrated.sum())} of {len(item_ids)} items have ≥ {args.min_responses} responses")
+
+    if calibrated.any():
+        print(f"Mean |Δa|={np.abs(result['a'] - a)[calibrated].mean():.3f} "
+              f"|Δb|={np.abs(result['b'] - b)[calibrated].mean():.3f} "
+              f"|Δc|={np.abs(result['c'] - c)[calibrated].mean():.3f}")
+
+    if args.dry_run:
+        print("Dry run: parameters not written")
+        return
+
+    updated = write_item_parameters(db, item_ids, result['a'], result['b'], result['c'], calibrated)
+    print(f"✅ Updated {updated} items")
+
+
+if __name__ == "__main__":
+    main()
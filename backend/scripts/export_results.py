@@ -0,0 +1,84 @@
+"""
+Export English Test Sessions and Responses
+==========================================
+
+Streams english_test_sessions / english_test_responses to gzip-compressed
+NDJSON or CSV files without loading them into memory:
+
+- ndjson: server-side cursor, encoded and compressed batch by batch
+  (app/english_test/export.py, the same path as the admin endpoint)
+- csv:    COPY (...) TO STDOUT straight into the gzip file
+
+Usage (from backend/, DATABASE_URL set):
+    python scripts/export_results.py responses --since 2025-03-01 --until 2025-08-31 --status completed
+    python scripts/export_results.py sessions --format csv --output sessions.csv.gz
+    python scripts/export_results.py responses --output - | zcat | head
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import time
+from datetime import date
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importing the package builds the router's DB layers, which read DATABASE_URL
+load_dotenv()
+
+from app.english_test.database import EXPORT_TABLES, EnglishTestDB  # noqa: E402
+from app.english_test.export import FORMATS, export_filename, export_stream  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('table', choices=sorted(EXPORT_TABLES))
+    parser.add_argument('--format', choices=FORMATS, default='ndjson')
+    parser.add_argument('--since', type=date.fromisoformat, help='First session start date (YYYY-MM-DD)')
+    parser.add_argument('--until', type=date.fromisoformat, help='Last session start date (YYYY-MM-DD)')
+    parser.add_argument('--status', help="Session status, e.g. 'completed'")
+    parser.add_argument('--output', help="Output file ('-' for stdout; default: dated name in the current directory)")
+    parser.add_argument('--no-gzip', action='store_true', help='Write uncompressed output')
+    parser.add_argument('--batch-size', type=int, default=5000, help='Rows per cursor fetch (ndjson)')
+    args = parser.parse_args()
+
+    compress = not args.no_gzip
+    output = args.output or export_filename(args.table, args.format, compress)
+    to_stdout = output == '-'
+
+    db = EnglishTestDB()
+    started = time.perf_counter()
+
+    raw = sys.stdout.buffer if to_stdout else open(output, 'wb')
+    try:
+        if args.format == 'csv':
+            out = gzip.GzipFile(fileobj=raw, mode='wb') if compress else raw
+            try:
+                db.copy_export(args.table, out, since=args.since, until=args.until, status=args.status)
+            finally:
+                if compress:
+                    out.close()
+        else:
+            stream = export_stream(
+                db, args.table, fmt='ndjson',
+                since=args.since, until=args.until, status=args.status,
+                compress=compress, batch_size=args.batch_size
+            )
+            for chunk in stream:
+                raw.write(chunk)
+        raw.flush()
+    finally:
+        if not to_stdout:
+            raw.close()
+
+    if not to_stdout:
+        size = os.path.getsize(output)
+        elapsed = time.perf_counter() - started
+        print(f"✅ Exported {args.table} to {output} ({size / 1e6:.1f} MB) in {elapsed:.1f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Rebuild Running Item Statistics
+===============================
+
+Recomputes item_statistics (and items.correct_rate / point_biserial)
+from the full response history, e.g. after installing
+migrations/add_item_statistics.sql or after deleting test data. The API
+keeps the table up to date incrementally afterwards.
+
+Responses are streamed through a server-side cursor ordered by session
+and fed through the same ItemStatsAggregator the API uses, flushed every
+--flush-rows responses, so memory stays bounded by the number of items.
+
+Run it while the API is idle: answers recorded during the rebuild can be
+counted twice (once by the scan, once by the API's next flush).
+
+Usage (from backend/, DATABASE_URL set):
+    python scripts/rebuild_item_statistics.py [--flush-rows 200000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# Importing the package builds the router's DB layers, which read DATABASE_URL
+load_dotenv()
+
+from app.english_test.database import EnglishTestDB  # noqa: E402
+from app.english_test.item_stats import ItemStatsAggregator  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--flush-rows', type=int, default=200000, help='Responses aggregated per flush')
+    args = parser.parse_args()
+
+    db = EnglishTestDB()
+    # Flushed explicitly below; the background thread only idles
+    aggregator = ItemStatsAggregator(db, flush_interval=3600.0)
+
+    db.reset_item_statistics()
+    print("Cleared item_statistics")
+
+    conn = db._get_connection()
+    started = time.perf_counter()
+    total = sessions = unflushed = 0
+
+    try:
+        stream = conn.cursor(name='rebuild_item_statistics_stream')
+        stream.itersize = 50000
+        stream.execute("""
+            SELECT r.session_id, r.item_id, r.is_correct, r.response_time,
+                   CASE WHEN s.status = 'completed' THEN s.final_theta END
+            FROM english_test_responses r
+            JOIN english_test_sessions s ON s.id = r.session_id
+            ORDER BY r.session_id;
+        """)
+
+        current_session, answers, final_theta = None, [], None
+
+        def close_session():
+            nonlocal sessions
+            if final_theta is not None and answers:
+                aggregator.record_session(answers, final_theta)
+                sessions += 1
+
+        for session_id, item_id, is_correct, response_time, theta in stream:
+            if session_id != current_session:
+                close_session()
+                # Flush between sessions so a session is never split
+                if unflushed >= args.flush_rows:
+                    aggregator.flush()
+                    unflushed = 0
+                    print(f"  {total} responses, {sessions} completed sessions")
+                current_session, answers, final_theta = session_id, [], theta
+
+            aggregator.record_response(item_id, is_correct, response_time)
+            answers.append((item_id, is_correct))
+            total += 1
+            unflushed += 1
+
+        close_session()
+        stream.close()
+
+    finally:
+        db._return_connection(conn)
+
+    aggregator.stop()
+    elapsed = time.perf_counter() - started
+    print(f"✅ Rebuilt item statistics from {total} responses ({sessions} completed sessions) in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
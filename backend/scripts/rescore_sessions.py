@@ -0,0 +1,164 @@
+"""
+Rescore Completed English Test Sessions
+=======================================
+
+Re-estimates final_theta / standard_error for every completed session
+with the current item parameters (e.g. after recalibration), using
+IRTEngine.eap_estimate_batch. The scores derived from θ
+(proficiency_level, lexile_score, ar_level) are recomputed with the same
+mapping the API uses when a session is finalized.
+
+Responses are streamed through a server-side cursor ordered by session,
+scored a chunk of sessions at a time, and written back with one bulk
+UPDATE per chunk, so memory stays bounded by the chunk size.
+
+Usage (from backend/, DATABASE_URL set):
+    python scripts/rescore_sessions.py [--chunk-size 5000] [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from dotenv import load_dotenv
+from psycopg2.extras import execute_values
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.english_test.database import EnglishTestDB  # noqa: E402
+from app.english_test.irt_engine import IRTEngine  # noqa: E402
+from app.english_test.service_v2 import EnglishTestServiceV2  # noqa: E402
+
+
+def load_item_params(cursor):
+    """Return (item_id -> column index, (a, b, c)) for all calibrated items."""
+    cursor.execute("""
+        SELECT id, discrimination, difficulty, COALESCE(guessing, 0.25)
+        FROM items
+        WHERE discrimination IS NOT NULL AND difficulty IS NOT NULL
+        ORDER BY id;
+    """)
+    rows = cursor.fetchall()
+
+    column_of = {row[0]: col for col, row in enumerate(rows)}
+    params = np.array([row[1:] for row in rows], dtype=float).reshape(-1, 3)
+
+    return column_of, (params[:, 0], params[:, 1], params[:, 2])
+
+
+def score_chunk(irt, session_ids, rows, column_of, item_params):
+    """Build the (sessions × items) matrices for one chunk and score them."""
+    row_of = {session_id: r for r, session_id in enumerate(session_ids)}
+    responses = np.zeros((len(session_ids), len(column_of)))
+    mask = np.zeros_like(responses, dtype=bool)
+
+    for session_id, item_id, is_correct in rows:
+        col = column_of.get(item_id)
+        if col is None:
+            continue
+        responses[row_of[session_id], col] = is_correct
+        mask[row_of[session_id], col] = True
+
+    return irt.eap_estimate_batch(responses, mask, item_params)
+
+
+def derived_scores(irt, theta, se):
+    """Session columns derived from θ, as finalize_session stores them."""
+    theta = float(theta)
+    return (
+        round(theta, 3),
+        round(float(se), 3),
+        irt.ability_to_proficiency_level(theta),
+        EnglishTestServiceV2._estimate_lexile(theta),
+        EnglishTestServiceV2._estimate_ar(theta)
+    )
+
+
+def write_back(conn, irt, session_ids, thetas, ses):
+    """Bulk-update θ, SE and the scores derived from θ for one chunk."""
+    cursor = conn.cursor()
+    try:
+        execute_values(cursor, """
+            UPDATE english_test_sessions AS s
+            SET final_theta = v.theta, standard_error = v.se,
+                proficiency_level = v.proficiency_level,
+                lexile_score = v.lexile_score, ar_level = v.ar_level,
+                updated_at = CURRENT_TIMESTAMP
+            FROM (VALUES %s) AS v(id, theta, se, proficiency_level, lexile_score, ar_level)
+            WHERE s.id = v.id;
+        """, [
+            (session_id,) + derived_scores(irt, theta, se)
+            for session_id, theta, se in zip(session_ids, thetas, ses)
+        ])
+        conn.commit()
+    finally:
+        cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--chunk-size', type=int, default=5000, help='Sessions scored per batch')
+    parser.add_argument('--dry-run', action='store_true', help='Score without writing back')
+    args = parser.parse_args()
+
+    load_dotenv()
+    db = EnglishTestDB()
+    irt = IRTEngine()
+
+    read_conn = db._get_connection()
+    write_conn = db._get_connection()
+
+    try:
+        cursor = read_conn.cursor()
+        column_of, item_params = load_item_params(cursor)
+        cursor.close()
+        print(f"Loaded parameters for {len(column_of)} items")
+
+        # Named cursor = server-side; rows arrive itersize at a time
+        stream = read_conn.cursor(name='rescore_sessions_stream')
+        stream.itersize = 50000
+        stream.execute("""
+            SELECT r.session_id, r.item_id, r.is_correct
+            FROM english_test_responses r
+            JOIN english_test_sessions s ON s.id = r.session_id
+            WHERE s.status = 'completed'
+            ORDER BY r.session_id;
+        """)
+
+        started = time.perf_counter()
+        total_sessions = 0
+        session_ids, rows = [], []
+
+        def flush():
+            nonlocal total_sessions
+            thetas, ses = score_chunk(irt, session_ids, rows, column_of, item_params)
+            if not args.dry_run:
+                write_back(write_conn, irt, session_ids, thetas, ses)
+            total_sessions += len(session_ids)
+            print(f"  scored {total_sessions} sessions (mean θ={thetas.mean():.3f})")
+
+        for row in stream:
+            if not session_ids or session_ids[-1] != row[0]:
+                if len(session_ids) >= args.chunk_size:
+                    flush()
+                    session_ids, rows = [], []
+                session_ids.append(row[0])
+            rows.append(row)
+
+        if session_ids:
+            flush()
+
+        stream.close()
+        elapsed = time.perf_counter() - started
+        action = "Scored (dry run)" if args.dry_run else "Rescored"
+        print(f"✅ {action} {total_sessions} sessions in {elapsed:.1f}s")
+
+    finally:
+        db._return_connection(read_conn)
+        db._return_connection(write_conn)
+
+
+if __name__ == "__main__":
+    main()
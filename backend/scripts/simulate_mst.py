@@ -0,0 +1,170 @@
+"""
+MST Monte Carlo Simulation CLI
+==============================
+
+Export the active item bank once, then simulate examinees offline
+against the snapshot to check routing thresholds, stage lengths and
+item exposure.
+
+Usage (from backend/):
+    # One-time export (needs DATABASE_URL)
+    python scripts/simulate_mst.py export --out item_bank_snapshot.json
+
+    # Offline simulation
+    python scripts/simulate_mst.py run --bank item_bank_snapshot.json \\
+        --simulees 5000 --workers 4 [--theta-mean 0 --theta-sd 1] [--json report.json] \\
+        [--target-se 0.3 --min-items 24 --max-items 40 --classification-confidence 0.95]
+
+    # Sympson-Hetter exposure parameters (stored in the snapshot;
+    # --write also updates items.sympson_hetter_k, needs DATABASE_URL)
+    python scripts/simulate_mst.py sympson-hetter --bank item_bank_snapshot.json \\
+        --r-max 0.25 --simulees 2000 --iterations 6 [--write]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def cmd_export(args):
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    from app.english_test.database import EnglishTestDB
+    from app.english_test.simulation import export_item_bank
+
+    count = export_item_bank(EnglishTestDB(), args.out)
+    print(f"✅ Exported {count} active items to {args.out}")
+
+
+def cmd_run(args):
+    # Importing the package builds the router's DB layer; its pool is lazy,
+    # so a placeholder URL keeps the simulation fully offline.
+    os.environ.setdefault('DATABASE_URL', 'postgresql://offline/simulation')
+    from app.english_test.irt_engine import StoppingRule
+    from app.english_test.simulation import load_item_bank, run_simulation
+
+    items = load_item_bank(args.bank)
+    print(f"Loaded {len(items)} items from {args.bank}")
+
+    report = run_simulation(
+        items,
+        n_simulees=args.simulees,
+        theta_mean=args.theta_mean,
+        theta_sd=args.theta_sd,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        seed=args.seed,
+        stopping_rule=StoppingRule(
+            target_se=args.target_se or None,
+            min_items=args.min_items,
+            max_items=args.max_items,
+            classification_confidence=args.classification_confidence or None
+        )
+    )
+
+    print(f"\n=== MST simulation: {report['n_simulees']} simulees ===")
+    print(f"Bias: {report['bias']:+.4f}   RMSE: {report['rmse']:.4f}   Mean SE: {report['mean_se']:.4f}")
+    print(f"Mean items: {report['mean_items']}   Stop reasons: {report['stop_reasons']}")
+    print(f"Routing accuracy: stage 2 {report['routing_accuracy']['stage2']:.1%}, "
+          f"stage 3 {report['routing_accuracy']['stage3']:.1%}")
+
+    print(f"\n{'θ range':>16} {'n':>6} {'bias':>8} {'RMSE':>7} {'mean SE':>8}")
+    for row in report['conditional']:
+        low, high = row['theta_range']
+        print(f"{f'[{low:g}, {high:g})':>16} {row['count']:>6} {row['bias']:>+8.3f} {row['rmse']:>7.3f} {row['mean_se']:>8.3f}")
+
+    exposure = report['exposure']
+    print(f"\nExposure: {exposure['items_used']} items used, max rate {exposure['max_rate']:.3f}, "
+          f"mean {exposure['mean_rate']:.3f}, {exposure['items_over_0.25']} items over 0.25")
+    print(f"Throughput: {report['simulees_per_second']} simulees/s ({report['elapsed_seconds']}s)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to {args.json}")
+
+
+def cmd_sympson_hetter(args):
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    if not args.write:
+        os.environ.setdefault('DATABASE_URL', 'postgresql://offline/simulation')
+    elif not os.getenv('DATABASE_URL'):
+        # Fail before the simulation rather than after it, with nowhere to write K
+        raise SystemExit("--write needs DATABASE_URL (set it or add it to .env)")
+    from app.english_test.simulation import sympson_hetter_parameters
+
+    with open(args.bank, 'r', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    items = snapshot['items']
+    print(f"Loaded {len(items)} items from {args.bank}; target max exposure {args.r_max}")
+
+    parameters = sympson_hetter_parameters(
+        items,
+        r_max=args.r_max,
+        n_simulees=args.simulees,
+        iterations=args.iterations,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        seed=args.seed
+    )
+
+    for item in items:
+        item['sympson_hetter_k'] = parameters[item['id']]
+    with open(args.bank, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False)
+    print(f"✅ Stored K for {len(parameters)} items in {args.bank}")
+
+    if args.write:
+        from app.english_test.database import EnglishTestDB
+
+        updated = EnglishTestDB().update_sympson_hetter_parameters(parameters)
+        print(f"✅ Updated sympson_hetter_k for {updated} items")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export = subparsers.add_parser('export', help='Export active items to a JSON snapshot')
+    export.add_argument('--out', default='item_bank_snapshot.json')
+    export.set_defaults(func=cmd_export)
+
+    run = subparsers.add_parser('run', help='Simulate examinees against a snapshot')
+    run.add_argument('--bank', required=True, help='Snapshot written by the export command')
+    run.add_argument('--simulees', type=int, default=1000)
+    run.add_argument('--theta-mean', type=float, default=0.0)
+    run.add_argument('--theta-sd', type=float, default=1.0)
+    run.add_argument('--workers', type=int, default=None, help='Processes (default: CPU count)')
+    run.add_argument('--chunk-size', type=int, default=100, help='Simulees per task')
+    run.add_argument('--seed', type=int, default=2025)
+    run.add_argument('--json', help='Also write the full report to this file')
+    run.add_argument('--target-se', type=float, default=0.30, help='Stop at this SE (0 disables)')
+    run.add_argument('--min-items', type=int, default=24)
+    run.add_argument('--max-items', type=int, default=40)
+    run.add_argument('--classification-confidence', type=float, default=0.95,
+                     help='Stop once the proficiency band has this posterior probability (0 disables)')
+    run.set_defaults(func=cmd_run)
+
+    sympson_hetter = subparsers.add_parser('sympson-hetter', help='Compute Sympson-Hetter exposure parameters')
+    sympson_hetter.add_argument('--bank', required=True, help='Snapshot written by the export command (updated in place)')
+    sympson_hetter.add_argument('--r-max', type=float, default=0.25, help='Target maximum exposure rate')
+    sympson_hetter.add_argument('--simulees', type=int, default=2000, help='Simulees per iteration')
+    sympson_hetter.add_argument('--iterations', type=int, default=6)
+    sympson_hetter.add_argument('--workers', type=int, default=None, help='Processes (default: CPU count)')
+    sympson_hetter.add_argument('--chunk-size', type=int, default=100, help='Simulees per task')
+    sympson_hetter.add_argument('--seed', type=int, default=2025)
+    sympson_hetter.add_argument('--write', action='store_true', help='Also write K to the items table')
+    sympson_hetter.set_defaults(func=cmd_sympson_hetter)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
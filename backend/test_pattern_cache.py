@@ -0,0 +1,88 @@
+"""
+Test Response-Pattern Cache Invalidation
+========================================
+A recalibration reloads the item bank with new a/b/c; the same response
+pattern must then be scored with the new parameters, not the memoized
+posterior. Runs offline (no database or server needed).
+
+Usage (from backend/):
+    python test_pattern_cache.py
+"""
+
+import os
+from types import SimpleNamespace
+
+# Importing the package builds the router's DB layers, which read DATABASE_URL
+os.environ.setdefault('DATABASE_URL', 'postgresql://offline/test')
+
+from app.english_test.irt_engine import IRTEngine  # noqa: E402
+from app.english_test.service_v2 import EnglishTestServiceV2  # noqa: E402
+
+
+def _score(service, item):
+    """θ/SE after answering one item correctly from the prior"""
+    posterior = service.irt.new_posterior()
+    return service._advance_posterior(posterior, True, item)
+
+
+def test_recalibration_invalidates_pattern():
+    """Same pattern, recalibrated item → new θ"""
+    EnglishTestServiceV2._pattern_cache.clear()
+    item_cache = SimpleNamespace(version=1, reloads=1)
+    service = EnglishTestServiceV2(db=None, irt_engine=IRTEngine(), item_cache=item_cache)
+
+    item = {'id': 101, 'a': 1.2, 'b': 0.0, 'c': 0.2}
+    theta_before, _ = _score(service, item)
+
+    # Memoized while the bank is unchanged
+    assert _score(service, item)[0] == theta_before
+    assert EnglishTestServiceV2._pattern_cache.hits == 1
+
+    # Recalibration: the version trigger bumps the bank and it is reloaded
+    recalibrated = dict(item, b=1.5)
+    item_cache.version, item_cache.reloads = 2, 2
+    theta_after, _ = _score(service, recalibrated)
+
+    expected, _ = service.irt.posterior_estimate(
+        service.irt.update_posterior(service.irt.new_posterior(), True, recalibrated)
+    )
+    assert theta_after != theta_before
+    assert abs(theta_after - expected) < 1e-12
+    assert EnglishTestServiceV2._pattern_cache.invalidations == 1
+    print(f"[OK] θ {theta_before:.4f} → {theta_after:.4f} after recalibration")
+
+
+def test_quadrature_change_invalidates_pattern():
+    """Same pattern and bank, different quadrature → recomputed"""
+    EnglishTestServiceV2._pattern_cache.clear()
+    item_cache = SimpleNamespace(version=1, reloads=1)
+    item = {'id': 101, 'a': 1.2, 'b': 0.0, 'c': 0.2}
+
+    coarse = EnglishTestServiceV2(
+        db=None, irt_engine=IRTEngine(quadrature_points=11), item_cache=item_cache
+    )
+    fine = EnglishTestServiceV2(
+        db=None, irt_engine=IRTEngine(quadrature_points=81), item_cache=item_cache
+    )
+
+    _score(coarse, item)
+    _score(fine, item)
+    assert EnglishTestServiceV2._pattern_cache.hits == 0
+    print("[OK] Quadrature change recomputes the pattern")
+
+
+def test_no_item_cache_skips_pattern_cache():
+    """Without a versioned bank, parameter changes are invisible → no caching"""
+    EnglishTestServiceV2._pattern_cache.clear()
+    service = EnglishTestServiceV2(db=None, irt_engine=IRTEngine())
+
+    _score(service, {'id': 101, 'a': 1.2, 'b': 0.0, 'c': 0.2})
+    assert len(EnglishTestServiceV2._pattern_cache) == 0
+    print("[OK] Pattern cache unused without an item bank cache")
+
+
+if __name__ == "__main__":
+    test_recalibration_invalidates_pattern()
+    test_quadrature_change_invalidates_pattern()
+    test_no_item_cache_skips_pattern_cache()
+    EnglishTestServiceV2._pattern_cache.clear()
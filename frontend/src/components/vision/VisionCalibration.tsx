@@ -118,15 +118,23 @@ const VisionCalibration: React.FC<VisionCalibrationProps> = ({
       }
 
       ctx.drawImage(video, 0, 0, canvas.width, canvas.height);
-      const imageData = canvas.toDataURL('image/jpeg', 0.8);
-
-      // Send frame WITH frame dimensions for resolution-independent tracking
-      wsClient.sendFrame(
-        imageData,
-        window.innerWidth,
-        window.innerHeight,
-        video.videoWidth,
-        video.videoHeight
+
+      // Send raw JPEG bytes as a binary frame (no base64 data URL / JSON),
+      // WITH frame dimensions for resolution-independent tracking
+      canvas.toBlob(
+        (jpeg) => {
+          if (jpeg) {
+            wsClient.sendFrameBinary(
+              jpeg,
+              window.innerWidth,
+              window.innerHeight,
+              video.videoWidth,
+              video.videoHeight
+            );
+          }
+        },
+        'image/jpeg',
+        0.8
       );
 
       // ✅ PERFORMANCE: 33ms = ~30 FPS (improved from requestAnimationFrame)